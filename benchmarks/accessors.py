@@ -0,0 +1,49 @@
+"""Benchmark compiled accessors against attribute access.
+
+Run with ``python -m benchmarks.accessors``.
+
+"""
+
+from jsonmodels import fields, models
+
+from .utilities import measure
+
+
+class Product(models.Base):
+    sku = fields.StringField(required=True)
+
+
+class Line(models.Base):
+    product = fields.EmbeddedField(Product)
+    quantity = fields.IntField()
+
+
+class Order(models.Base):
+    lines = fields.ListField([Line])
+
+
+ORDERS = [
+    Order(lines=[Line(product=Product(sku=f"{i}-{j}"), quantity=j) for j in range(5)])
+    for i in range(10000)
+]
+
+
+def main():
+    accessor = Order.accessor("lines[3].product.sku")
+    measure(
+        "order.lines[3].product.sku",
+        lambda: [order.lines[3].product.sku for order in ORDERS],
+    )
+    measure("accessor(order)", lambda: [accessor(order) for order in ORDERS])
+    measure("accessor.extract(orders)", lambda: accessor.extract(ORDERS))
+
+    all_skus = Order.accessor("lines[].product.sku")
+    measure(
+        "[line.product.sku for line in order.lines]",
+        lambda: [[line.product.sku for line in order.lines] for order in ORDERS],
+    )
+    measure("accessor.extract(orders), all lines", lambda: all_skus.extract(ORDERS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark numeric arrays against lists of floats.
+
+Run with ``python -m benchmarks.arrays``.
+
+"""
+
+import tracemalloc
+
+from jsonmodels import fields, models, validators
+
+from .utilities import measure
+
+RANGE = [validators.Min(-1000), validators.Max(1000)]
+
+
+class ListSeries(models.Base):
+    readings = fields.ListField(float, item_validators=RANGE)
+
+
+class ArraySeries(models.Base):
+    readings = fields.NumericArrayField("f8", item_validators=RANGE)
+
+
+READINGS = [index / 1000 for index in range(100000)]
+
+
+def allocated(function):
+    tracemalloc.start()
+    result = function()  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    listed = ListSeries(readings=READINGS)
+    stored = ArraySeries(readings=READINGS)
+
+    measure("load, ListField", lambda: ListSeries(readings=READINGS))
+    measure("load, NumericArrayField", lambda: ArraySeries(readings=READINGS))
+    measure("to_struct(), ListField", listed.to_struct)
+    measure("to_struct(), NumericArrayField", stored.to_struct)
+
+    # Memory of values themselves (`READINGS` are copied, as if from JSON).
+    size = allocated(lambda: ListSeries(readings=[value + 0 for value in READINGS]))
+    print(f"allocated, ListField          {size / 2**20:8.2f} MiB")
+    size = allocated(lambda: ArraySeries(readings=[value + 0 for value in READINGS]))
+    print(f"allocated, NumericArrayField  {size / 2**20:8.2f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark blocking of event loop by casting of large models.
+
+Run with ``python -m benchmarks.asyncstruct``.
+
+Gaps between ticks of task ticking every millisecond are measured, while
+model with long list is created from structure and cast back. Longest gaps
+of asynchronous casting come from collections of garbage (in growing heap).
+
+"""
+
+import asyncio
+import concurrent.futures
+import statistics
+import time
+
+from jsonmodels import fields, models, validators
+
+
+class Line(models.Base):
+    sku = fields.StringField(required=True)
+    quantity = fields.IntField(validators=validators.Min(1))
+    price = fields.FloatField()
+
+
+class Order(models.Base):
+    number = fields.StringField()
+    lines = fields.ListField([Line])
+
+
+STRUCT = {
+    "number": "A-1",
+    "lines": [
+        {"sku": f"SKU-{index}", "quantity": 1 + index % 5, "price": index / 100}
+        for index in range(100000)
+    ],
+}
+
+
+async def ticker(gaps, done):
+    last = time.perf_counter()
+    while not done.is_set():
+        await asyncio.sleep(0.001)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def run(name, work):
+    gaps = []
+    done = asyncio.Event()
+    task = asyncio.create_task(ticker(gaps, done))
+    await asyncio.sleep(0)
+    start = time.perf_counter()
+    await work()
+    total = time.perf_counter() - start
+    done.set()
+    await task
+    median = statistics.median(gaps) * 1000
+    print(
+        f"{name:<32} total {total * 1000:7.1f} ms, "
+        f"stall: median {median:7.1f} ms, longest {max(gaps) * 1000:7.1f} ms"
+    )
+
+
+async def main():
+    async def sync():
+        Order(**STRUCT).to_struct()
+
+    async def asynchronous():
+        order = await Order.afrom_struct(STRUCT)
+        await order.ato_struct()
+
+    executor = concurrent.futures.ThreadPoolExecutor(1)
+
+    async def offloaded():
+        order = await Order.afrom_struct(STRUCT, executor=executor)
+        await order.ato_struct(executor=executor)
+
+    await run("Order(**data).to_struct()", sync)
+    await run("afrom_struct() + ato_struct()", asynchronous)
+    await run("... in thread pool", offloaded)
+    executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,72 @@
+"""Benchmark columnar batches against instances of model.
+
+Run with ``python -m benchmarks.batches``.
+
+"""
+
+import tracemalloc
+
+from jsonmodels import fields, models, validators
+
+from .utilities import measure
+
+
+class Reading(models.Base):
+    sensor = fields.StringField(
+        required=True, validators=validators.Enum("north", "south", "east", "west")
+    )
+    timestamp = fields.IntField(required=True, validators=validators.Min(0))
+    value = fields.FloatField(validators=[validators.Min(-100), validators.Max(100)])
+    unit = fields.StringField(validators=validators.Length(1, 3))
+
+
+SENSORS = ["north", "south", "east", "west"]
+RECORDS = [
+    {
+        "sensor": SENSORS[index % 4],
+        "timestamp": 1600000000 + index,
+        "value": (index % 2000) / 20 - 50,
+        "unit": "C",
+    }
+    for index in range(100000)
+]
+
+
+def load_instances():
+    instances = [Reading(**record) for record in RECORDS]
+    for instance in instances:
+        instance.validate()
+    return instances
+
+
+def load_batch():
+    return Reading.batch_from_structs(RECORDS)
+
+
+def allocated(function):
+    tracemalloc.start()
+    result = function()  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    measure("load + validate, instances", load_instances, number=1)
+    measure("load + validate, batch", load_batch, number=1)
+
+    instances = load_instances()
+    batch = load_batch()
+    measure("validate(), instances", lambda: [i.validate() for i in instances], 1)
+    measure("validate(), batch", batch.validate, number=1)
+    measure("to_struct(), instances", lambda: [i.to_struct() for i in instances], 1)
+    measure("to_structs(), batch", batch.to_structs, number=1)
+    measure("read value, instances", lambda: [i.value for i in instances], 1)
+    measure("read value, batch rows", lambda: [row.value for row in batch], 1)
+
+    print(f"allocated, instances  {allocated(load_instances) / 2**20:8.1f} MiB")
+    print(f"allocated, batch      {allocated(load_batch) / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark comparison of large JSON schemas.
+
+Run with ``python -m benchmarks.comparison``.
+
+"""
+
+import random
+
+from jsonmodels import utilities
+
+from .utilities import measure
+
+
+def large_schema(size, seed):
+    """Schema with big `oneOf`, `enum` and `required` lists in random order."""
+    rnd = random.Random(seed)
+    names = [f"field{index}" for index in range(size)]
+    variants = [
+        {
+            "type": "object",
+            "properties": {name: {"type": "string"} for name in names[:index]},
+            "required": rnd.sample(names[:index], index),
+        }
+        for index in range(1, 30)
+    ]
+    return {
+        "type": "object",
+        "properties": {
+            "kind": {"enum": rnd.sample(names, size)},
+            "value": {"oneOf": rnd.sample(variants, len(variants))},
+        },
+        "required": rnd.sample(names, size),
+    }
+
+
+def main():
+    for size in (100, 1000, 10000):
+        one, two = large_schema(size, 1), large_schema(size, 2)
+        measure(
+            f"{size} items, compare_schemas",
+            lambda: utilities.compare_schemas(one, two),
+        )
+        measure(f"{size} items, schema_hash", lambda: utilities.schema_hash(one))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Benchmark copying of models against round trip through structure.
+
+Run with ``python -m benchmarks.copying``.
+
+"""
+
+import datetime
+
+from jsonmodels import fields, models
+
+from .utilities import measure
+
+
+class Line(models.Base):
+    sku = fields.StringField(required=True)
+    quantity = fields.IntField()
+    shipped = fields.DateTimeField()
+
+
+class Order(models.Base):
+    number = fields.IntField(required=True)
+    created = fields.DateTimeField()
+    lines = fields.ListField([Line])
+    notes = fields.DictField()
+
+
+ORDER = Order(
+    number=1,
+    created=datetime.datetime(2020, 1, 2, 3, 4, 5),
+    lines=[
+        Line(sku=f"SKU-{i}", quantity=i, shipped=datetime.datetime(2020, 1, 3))
+        for i in range(100)
+    ],
+    notes={"gift": True, "tags": ["a", "b"]},
+)
+
+
+def main():
+    measure("Order(**order.to_struct())", lambda: Order(**ORDER.to_struct()))
+    measure("order.copy()", ORDER.copy)
+    measure("order.copy(deep=True)", lambda: ORDER.copy(deep=True))
+    measure(
+        "order.copy(deep=True, update=...)",
+        lambda: ORDER.copy(deep=True, update={"number": 2}),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark parsing of polymorphic trees.
+
+Run with ``python -m benchmarks.discriminator``.
+
+"""
+
+from jsonmodels import errors, fields, models, validators
+
+from .utilities import measure
+
+
+class File(models.Base):
+    kind = fields.StringField(default="file", validators=validators.Enum("file"))
+    name = fields.StringField(required=True)
+    size = fields.IntField()
+
+
+class Directory(models.Base):
+    kind = fields.StringField(
+        default="directory", validators=validators.Enum("directory")
+    )
+    name = fields.StringField(required=True)
+    children = fields.ListField(["Directory", File], discriminator="kind")
+
+
+class TrialDirectory(models.Base):
+    """Directory without discriminator, its children are parsed by hand."""
+
+    kind = fields.StringField(
+        default="directory", validators=validators.Enum("directory")
+    )
+    name = fields.StringField(required=True)
+    children = fields.ListField(["TrialDirectory", File])
+
+
+def tree(depth, width):
+    """Tree with `width` files and `width` directories in each directory."""
+    children = [{"kind": "file", "name": f"f{i}", "size": i} for i in range(width)]
+    if depth:
+        children += [tree(depth - 1, width) for _ in range(width)]
+    return {"kind": "directory", "name": "d", "children": children}
+
+
+def count(node):
+    return 1 + sum(count(child) for child in node.get("children", []))
+
+
+def by_trial(data):
+    """Parse node trying candidate models in turn."""
+    try:
+        children = [by_trial(child) for child in data.get("children", [])]
+        return TrialDirectory(**dict(data, children=children))
+    except errors.ValidationError:
+        pass
+    return File(**data)
+
+
+def main():
+    data = tree(6, 5)
+    print(f"{count(data)} nodes")
+    measure("discriminator", lambda: Directory(**data), number=1, repeat=3)
+    measure("trying candidates in turn", lambda: by_trial(data), number=1, repeat=3)
+    measure(
+        "discriminator, validate_struct",
+        lambda: Directory.validate_struct(data),
+        number=1,
+        repeat=3,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark indexes of lists against linear scans.
+
+Run with ``python -m benchmarks.indexes``.
+
+"""
+
+from jsonmodels import fields, models
+
+from .utilities import measure
+
+
+class Item(models.Base):
+    id = fields.IntField()
+    name = fields.StringField()
+
+
+class Plain(models.Base):
+    items = fields.ListField([Item])
+
+
+class Indexed(models.Base):
+    items = fields.ListField([Item], index_on=["id"])
+
+
+DATA = {"items": [{"id": i, "name": f"item {i}"} for i in range(10000)]}
+IDS = range(0, 10000, 100)
+
+
+def main():
+    plain = Plain(**DATA)
+    indexed = Indexed(**DATA)
+
+    measure(
+        "lookup, linear scan",
+        lambda: [next(i for i in plain.items if i.id == id_) for id_ in IDS],
+    )
+    measure(
+        "lookup, get_by",
+        lambda: [indexed.items.get_by("id", id_) for id_ in IDS],
+    )
+
+    measure("parse, plain", lambda: Plain(**DATA))
+    measure("parse, indexed", lambda: Indexed(**DATA))
+
+    items = [Item(id=i) for i in range(10000)]
+    measure("append, plain", lambda: _append(Plain(items=[]), items))
+    measure("append, indexed", lambda: _append(Indexed(items=[]), items))
+    measure("pop, plain", lambda: _pop(Plain(items=[]), items))
+    measure("pop, indexed", lambda: _pop(Indexed(items=[]), items))
+
+
+def _append(model, items):
+    append = model.items.append
+    for item in items:
+        append(item)
+
+
+def _pop(model, items):
+    model.items[:] = items
+    pop = model.items.pop
+    for _ in items:
+        pop()
+
+
+if __name__ == "__main__":
+    main()
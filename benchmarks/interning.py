@@ -0,0 +1,75 @@
+"""Benchmark interning of repeated embedded models.
+
+Run with ``python -m benchmarks.interning``.
+
+"""
+
+import tracemalloc
+
+from jsonmodels import fields, interning, models
+
+from .utilities import measure
+
+
+class Currency(models.Base, frozen=True):
+    code = fields.StringField(required=True)
+    name = fields.StringField()
+
+
+class Address(models.Base, frozen=True):
+    street = fields.StringField()
+    city = fields.StringField()
+    country = fields.StringField()
+
+
+class Invoice(models.Base):
+    number = fields.IntField()
+    currency = fields.EmbeddedField(Currency)
+    address = fields.EmbeddedField(Address)
+
+
+DOCUMENTS = [
+    {
+        "number": number,
+        "currency": {"code": "EUR", "name": "Euro"},
+        "address": {"street": f"Street {number % 10}", "city": "Berlin"},
+    }
+    for number in range(20000)
+]
+
+
+def load():
+    return [Invoice(**data) for data in DOCUMENTS]
+
+
+def load_interned():
+    with interning.scope(Currency, Address):
+        return load()
+
+
+def allocated(function):
+    tracemalloc.start()
+    result = function()  # noqa: F841
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main():
+    measure("load", load, number=1)
+    measure("load, interned", load_interned, number=1)
+
+    with interning.scope(Currency, Address) as tables:
+        load()
+    for model, table in tables.items():
+        print(
+            f"{model.__name__:<10} hit rate {table.hit_rate:.3f}, "
+            f"saved about {table.saved_bytes / 2**20:.1f} MiB"
+        )
+
+    print(f"allocated, plain     {allocated(load) / 2**20:8.1f} MiB")
+    print(f"allocated, interned  {allocated(load_interned) / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
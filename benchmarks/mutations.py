@@ -0,0 +1,49 @@
+"""Benchmark changes and validation of lists of models.
+
+Run with ``python -m benchmarks.mutations``.
+
+"""
+
+from jsonmodels import errors, fields, models
+
+from .utilities import measure
+
+
+class Item(models.Base):
+    id = fields.IntField()
+
+
+def has_id(item):
+    if item.id is None:
+        raise errors.ValidationError("Item has no id.")
+
+
+class Basket(models.Base):
+    items = fields.ListField([Item], item_validators=[has_id])
+
+
+DATA = {"items": [{"id": i} for i in range(10000)]}
+ITEMS = [Item(id=i) for i in range(10000)]
+
+
+def main():
+    basket = Basket(**DATA)
+    measure("validate() of unchanged model", basket.validate)
+    measure("append() + validate()", lambda: _append_and_validate(basket))
+    measure("extend() with 10000 items", lambda: Basket(items=[]).items.extend(ITEMS))
+    measure("append() of 10000 items", lambda: _append_all(Basket(items=[])))
+
+
+def _append_all(basket):
+    append = basket.items.append
+    for item in ITEMS:
+        append(item)
+
+
+def _append_and_validate(basket):
+    basket.items.append(Item(id=1))
+    basket.validate()
+
+
+if __name__ == "__main__":
+    main()
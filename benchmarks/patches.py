@@ -0,0 +1,95 @@
+"""Benchmark diff and patches of mostly shared models.
+
+Run with ``python -m benchmarks.patches``.
+
+"""
+
+from jsonmodels import fields, models
+
+from .utilities import measure
+
+
+class Product(models.Base):
+    sku = fields.StringField(required=True)
+    price = fields.FloatField()
+
+
+class Line(models.Base):
+    product = fields.EmbeddedField(Product)
+    quantity = fields.IntField()
+
+
+class Order(models.Base):
+    number = fields.IntField()
+    lines = fields.ListField([Line])
+
+
+class Catalog(models.Base):
+    orders = fields.ListField([Order])
+
+
+CATALOG = Catalog(
+    orders=[
+        Order(
+            number=number,
+            lines=[
+                Line(product=Product(sku=f"{number}-{i}", price=i), quantity=i)
+                for i in range(20)
+            ],
+        )
+        for number in range(200)
+    ]
+)
+
+
+def changed():
+    """Catalog sharing all but one line with `CATALOG`."""
+    order = CATALOG.orders[100].copy()
+    order.lines = list(order.lines)
+    order.lines[5] = order.lines[5].copy(update={"quantity": 42})
+    orders = list(CATALOG.orders)
+    orders[100] = order
+    return CATALOG.copy(update={"orders": orders})
+
+
+def diff_structs(old, new, path=""):
+    """Naive diff of structures (without list additions and removals)."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            yield from diff_structs(old.get(key), new.get(key), f"{path}/{key}")
+    elif isinstance(old, list) and isinstance(new, list):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from diff_structs(old_item, new_item, f"{path}/{index}")
+    elif old != new:
+        yield {"op": "replace", "path": path, "value": new}
+
+
+def main():
+    other = changed()
+    assert CATALOG.diff(other) == list(
+        diff_structs(CATALOG.to_struct(), other.to_struct())
+    )
+
+    measure(
+        "diff of structures",
+        lambda: list(diff_structs(CATALOG.to_struct(), other.to_struct())),
+        number=1,
+    )
+    measure("model.diff(other)", lambda: CATALOG.diff(other))
+
+    def rebuild():
+        struct = CATALOG.to_struct()
+        struct["orders"][100]["lines"][5]["quantity"] = 42
+        return Catalog(**struct)
+
+    operations = [{"op": "replace", "path": "/orders/100/lines/5/quantity", "value": 7}]
+    measure("to_struct, change and rebuild", rebuild, number=1)
+    measure("model.apply_patch(operations)", lambda: CATALOG.apply_patch(operations))
+    measure(
+        "model.merge_patch(document)",
+        lambda: CATALOG.orders[100].merge_patch({"number": 100}),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark lazy models over raw JSON documents.
+
+Run with ``python -m benchmarks.rawjson``.
+
+Few fields are read from 10 MB document, with model created from decoded
+document and lazily over raw bytes.
+
+"""
+
+import json
+
+from jsonmodels import fields, models
+
+from .utilities import measure
+
+
+class Item(models.Base):
+    id = fields.IntField()
+    name = fields.StringField()
+    tags = fields.ListField(str)
+    price = fields.FloatField()
+
+
+class Response(models.Base):
+    status = fields.StringField()
+    total = fields.IntField()
+    results = fields.ListField([Item])
+    cursor = fields.StringField(name="next-cursor")
+
+
+def make_document():
+    results = [
+        {"id": index, "name": f"item {index}", "tags": ["a", "b"], "price": 1.5}
+        for index in range(140000)
+    ]
+    struct = {"status": "ok", "total": len(results), "results": results}
+    struct["next-cursor"] = "abc"
+    return json.dumps(struct).encode()
+
+
+def main():
+    document = make_document()
+    print(f"document size {len(document) / 2**20:.1f} MiB")
+
+    def eager():
+        response = Response(**json.loads(document))
+        return response.status, response.total
+
+    def lazy():
+        response = Response.from_json(document, lazy=True)
+        return response.status, response.total
+
+    def lazy_after_list():
+        return Response.from_json(document, lazy=True).cursor
+
+    def eager_all():
+        return Response(**json.loads(document)).to_struct()
+
+    def lazy_all():
+        return Response.from_json(document, lazy=True).to_struct()
+
+    measure("json.loads only", lambda: json.loads(document), number=1)
+    measure("Model(**json.loads()), 2 fields", eager, number=1)
+    measure("from_json(lazy=True), 2 fields before list", lazy)
+    measure("from_json(lazy=True), field after list", lazy_after_list, number=1)
+    measure("Model(**json.loads()), to_struct()", eager_all, number=1)
+    measure("from_json(lazy=True), to_struct()", lazy_all, number=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Benchmark JSON schema generation for synthetic model graphs.
+
+Run with ``python -m benchmarks.schema``.
+
+"""
+
+from jsonmodels import fields, models, parsers
+
+from .utilities import measure
+
+
+def wide_graph(size):
+    """Root model with `size` distinct models, each shared by its neighbour."""
+    leaves = [
+        type(f"Wide{index}", (models.Base,), {"name": fields.StringField()})
+        for index in range(size)
+    ]
+    attributes = {}
+    for index, leaf in enumerate(leaves):
+        attributes[f"field{index}"] = fields.EmbeddedField(leaf)
+        attributes[f"items{index}"] = fields.ListField([leaves[index - 1]])
+    return type("WideRoot", (models.Base,), attributes)
+
+
+def deep_graph(depth):
+    """Chain of `depth` distinct models sharing a single leaf model."""
+    leaf = type("Leaf", (models.Base,), {"name": fields.StringField()})
+    model = leaf
+    for index in range(depth):
+        model = type(
+            f"Deep{index}",
+            (models.Base,),
+            {"child": fields.EmbeddedField(model), "leaf": fields.EmbeddedField(leaf)},
+        )
+    return model
+
+
+def cyclic_graph(size):
+    """Ring of `size` models, each pointing to the next and to the first one."""
+    names = [f"Cyclic{index}" for index in range(size)]
+    for index, name in enumerate(names):
+        globals()[name] = type(
+            name,
+            (models.Base,),
+            {
+                "__module__": __name__,
+                "next": fields.EmbeddedField(names[(index + 1) % size]),
+                "first": fields.ListField([names[0]]),
+            },
+        )
+    return globals()[names[0]]
+
+
+def shared_roots(size):
+    """`size` root models using the same wide graph of shared models."""
+    shared = wide_graph(50)
+    return [
+        type(f"Root{index}", (models.Base,), {"shared": fields.EmbeddedField(shared)})
+        for index in range(size)
+    ]
+
+
+def separate_schemas(roots):
+    return [root.to_json_schema() for root in roots]
+
+
+def main():
+    for size in (100, 200, 400):
+        model = wide_graph(size)
+        measure(f"wide graph, {size} models", model.to_json_schema)
+    for depth in (50, 100, 200):
+        model = deep_graph(depth)
+        measure(f"deep graph, depth {depth}", model.to_json_schema)
+    for size in (50, 100, 200):
+        model = cyclic_graph(size)
+        measure(f"cyclic graph, {size} models", model.to_json_schema)
+    for size in (100, 200, 400):
+        roots = shared_roots(size)
+        measure(f"{size} roots, separate schemas", lambda: separate_schemas(roots))
+        measure(
+            f"{size} roots, bundled schema",
+            lambda: parsers.to_json_schema_bundle(roots),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark handoff of instances to other process via shared memory.
+
+Run with ``python -m benchmarks.shared``.
+
+Handoff by pickling of structures is compared with `SharedModelArray`, both
+sides (sending and reading all values in receiving process) run here.
+
+"""
+
+import datetime
+import pickle
+
+from jsonmodels import fields, models, validators
+from jsonmodels.shared import SharedModelArray
+
+from .utilities import measure
+
+
+class Reading(models.Base):
+    sensor = fields.StringField(
+        required=True, validators=validators.Enum("north", "south", "east", "west")
+    )
+    taken = fields.DateTimeField(required=True)
+    value = fields.FloatField()
+    valid = fields.BoolField()
+
+
+SENSORS = ["north", "south", "east", "west"]
+START = datetime.datetime(2020, 1, 1)
+INSTANCES = [
+    Reading(
+        sensor=SENSORS[index % 4],
+        taken=START + datetime.timedelta(seconds=index),
+        value=index / 100,
+        valid=index % 3 == 0,
+    )
+    for index in range(100000)
+]
+
+
+def send_pickled():
+    return pickle.dumps([instance.to_struct() for instance in INSTANCES])
+
+
+def receive_pickled(data):
+    return [Reading(**struct) for struct in pickle.loads(data)]
+
+
+def read_values(rows):
+    return [(row.sensor, row.taken, row.value, row.valid) for row in rows]
+
+
+def main():
+    data = send_pickled()
+    measure("send, pickle", send_pickled, number=1)
+    measure("receive + read, pickle", lambda: read_values(receive_pickled(data)), 1)
+
+    def send():
+        SharedModelArray.create(Reading, INSTANCES).close()
+
+    measure("send, shared memory", send, number=1)
+    with SharedModelArray.create(Reading, INSTANCES) as readings:
+
+        def attach():
+            SharedModelArray.attach(Reading, readings.name).close()
+
+        def receive():
+            with SharedModelArray.attach(Reading, readings.name) as attached:
+                return read_values(attached)
+
+        def read_column():
+            with SharedModelArray.attach(Reading, readings.name) as attached:
+                return sum(attached.columns["value"].values)
+
+        measure("attach, shared memory", attach)
+        measure("attach + read, shared memory", receive, number=1)
+        measure("attach + sum of raw column, shared memory", read_column, 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Benchmark parsing of subset of fields of wide records.
+
+Run with ``python -m benchmarks.sparse``.
+
+"""
+
+from jsonmodels import fields, models
+
+from .utilities import measure
+
+ATTRIBUTES = {}
+for number in range(100):
+    ATTRIBUTES[f"name_{number}"] = fields.StringField()
+    ATTRIBUTES[f"count_{number}"] = fields.IntField()
+    ATTRIBUTES[f"time_{number}"] = fields.DateTimeField()
+    ATTRIBUTES[f"values_{number}"] = fields.ListField(int)
+
+Record = type("Record", (models.Base,), ATTRIBUTES)
+
+RECORDS = [
+    {
+        key: value
+        for number in range(100)
+        for key, value in [
+            (f"name_{number}", f"name {number}"),
+            (f"count_{number}", number),
+            (f"time_{number}", "2020-01-02T03:04:05"),
+            (f"values_{number}", list(range(10))),
+        ]
+    }
+    for _ in range(100)
+]
+
+ONLY = ["name_0", "count_0", "time_0"]
+
+
+def main():
+    measure("Record(**data)", lambda: [Record(**data) for data in RECORDS], number=1)
+    measure(
+        "Record.from_struct(data, only=...)",
+        lambda: [Record.from_struct(data, only=ONLY) for data in RECORDS],
+    )
+    measure(
+        "Record.from_struct(data, only=..., keep_raw=False)",
+        lambda: [
+            Record.from_struct(data, only=ONLY, keep_raw=False) for data in RECORDS
+        ],
+    )
+
+
+if __name__ == "__main__":
+    main()
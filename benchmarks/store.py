@@ -0,0 +1,85 @@
+"""Benchmark random access to NDJSON records against full scans.
+
+Run with ``python -m benchmarks.store``.
+
+"""
+
+import json
+import os
+import random
+import tempfile
+
+from jsonmodels import fields, models
+from jsonmodels.store import IndexedNDJSON
+
+from .utilities import measure
+
+
+class Order(models.Base):
+    number = fields.StringField(required=True)
+    customer = fields.StringField()
+    total = fields.FloatField()
+    items = fields.ListField(str)
+
+
+COUNT = 200000
+NUMBERS = [f"ORD-{index:08d}" for index in range(COUNT)]
+SAMPLE = random.Random(0).sample(range(COUNT), 100)
+
+
+def write_orders(path):
+    with open(path, "w") as target:
+        for index, number in enumerate(NUMBERS):
+            struct = {
+                "number": number,
+                "customer": f"customer-{index % 1000}",
+                "total": index / 100,
+                "items": ["book", "pen"],
+            }
+            target.write(json.dumps(struct) + "\n")
+
+
+def scan_for_position(path, position):
+    with open(path) as source:
+        for index, line in enumerate(source):
+            if index == position:
+                return Order(**json.loads(line))
+
+
+def scan_for_key(path, number):
+    with open(path) as source:
+        for line in source:
+            struct = json.loads(line)
+            if struct["number"] == number:
+                return Order(**struct)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "orders.ndjson")
+        write_orders(path)
+
+        def build():
+            os.remove(path + ".idx")
+            IndexedNDJSON(path, Order, key="number").close()
+
+        open(path + ".idx", "w").close()
+        measure("build index (once per file)", build, number=1)
+
+        def open_indexed():
+            IndexedNDJSON(path, Order, key="number").close()
+
+        measure("open with saved index", open_indexed)
+
+        number = NUMBERS[SAMPLE[0]]
+        measure("1 by position, full scan", lambda: scan_for_position(path, SAMPLE[0]))
+        measure("1 by key, full scan", lambda: scan_for_key(path, number), number=1)
+
+        with IndexedNDJSON(path, Order, key="number") as orders:
+            measure("100 by position, index", lambda: [orders[i] for i in SAMPLE])
+            keys = [NUMBERS[index] for index in SAMPLE]
+            measure("100 by key, index", lambda: [orders.get(key) for key in keys])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+"""Helpers shared by benchmarks."""
+
+import timeit
+
+
+def measure(name, function, number=10, repeat=3):
+    """Print best time of single `function` call in milliseconds."""
+    best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+    print(f"{name:<50} {best * 1000:10.3f} ms")
+    return best
@@ -0,0 +1,95 @@
+"""Benchmark validation of raw nested structures.
+
+Run with ``python -m benchmarks.validation``.
+
+"""
+
+from jsonmodels import errors, fields, models, validators
+
+from .utilities import measure
+
+
+class Line(models.Base):
+    sku = fields.StringField(required=True)
+    quantity = fields.IntField(validators=validators.Min(1), required=True)
+    price = fields.FloatField(required=True)
+
+
+class Address(models.Base):
+    street = fields.StringField(required=True)
+    city = fields.StringField(required=True)
+    country = fields.StringField(validators=validators.Enum("PL", "DE", "US"))
+
+
+class Customer(models.Base):
+    name = fields.StringField(required=True)
+    email = fields.StringField()
+    address = fields.EmbeddedField(Address, required=True)
+
+
+class Order(models.Base):
+    number = fields.StringField(required=True)
+    customer = fields.EmbeddedField(Customer, required=True)
+    lines = fields.ListField(Line)
+    shipping = fields.EmbeddedField(Address)
+
+
+def order(lines):
+    address = {"street": "Main 1", "city": "Warsaw", "country": "PL"}
+    return {
+        "number": "A-1",
+        "customer": {"name": "Chuck", "email": "c@example.com", "address": address},
+        "lines": [
+            {"sku": f"SKU-{index}", "quantity": index + 1, "price": 9.99}
+            for index in range(lines)
+        ],
+        "shipping": address,
+    }
+
+
+def invalid_order(lines):
+    """Order with huge invalid value and invalid lines."""
+    data = order(lines)
+    data["number"] = ["A"] * 10000
+    for line in data["lines"]:
+        line["quantity"] = 0
+    return data
+
+
+def validate_all(records):
+    invalid = 0
+    for data in records:
+        try:
+            Order(**data).validate()
+        except errors.ValidationError as error:
+            str(error)
+            invalid += 1
+    return invalid
+
+
+def check_all(records):
+    return sum(1 for data in records if Order.check_struct(data))
+
+
+def main():
+    for lines in (1, 10, 100, 1000):
+        data = order(lines)
+        number = max(10, 10000 // lines)
+        measure(
+            f"{lines} lines, Order(**data).validate()",
+            lambda: Order(**data).validate(),
+            number=number,
+        )
+        measure(
+            f"{lines} lines, Order.validate_struct(data)",
+            lambda: Order.validate_struct(data),
+            number=number,
+        )
+
+    records = [invalid_order(10) if i % 10 < 7 else order(10) for i in range(100)]
+    measure("100 records (70% invalid), validate", lambda: validate_all(records))
+    measure("100 records (70% invalid), check_struct", lambda: check_all(records))
+
+
+if __name__ == "__main__":
+    main()
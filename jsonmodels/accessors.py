@@ -0,0 +1,198 @@
+"""Compiled accessors of values nested in models."""
+
+import re
+
+from . import fields
+
+_SEGMENT = re.compile(r"^([A-Za-z_][\w\-]*)(?:\[(-?\d*)\])?$")
+
+
+def get_accessor(cls, path):
+    """Get accessor of path in model (it is compiled on first use).
+
+    :param cls: Model class.
+    :param str path: See `Accessor`.
+    :rtype: `Accessor`
+
+    """
+    compiled = cls._get_fields_index().compiled
+    key = ("accessor", path)
+    try:
+        return compiled[key]
+    except KeyError:
+        accessor = compiled[key] = Accessor(cls, path)
+        return accessor
+
+
+class Accessor:
+    """Getter (and setter) of value nested in model.
+
+    Path is made of names of fields (attribute or structure ones) joined with
+    dots, like ``"product.sku"``. Name of list field can be followed by index
+    (like ``"lines[3].sku"``) or by ``[]`` to get values of all the items as
+    list (like ``"lines[].sku"``).
+
+    Fields are resolved once, when accessor is created, and values are read
+    straight from storage of fields. If any value on the way is `None`, `None`
+    is returned.
+
+    """
+
+    def __init__(self, model, path):
+        self.model = model
+        self.path = path
+        self.segments = _parse_path(path)
+        self._get = _compile_getter(model, self.segments)
+        self._get_parent = _compile_getter(model, self.segments[:-1])
+
+    def __call__(self, instance):
+        return self._get(instance)
+
+    get = __call__
+
+    def extract(self, instances):
+        """Get values from each of instances (e.g. from `ModelCollection`).
+
+        :rtype: ``list``
+
+        """
+        get = self._get
+        return [get(instance) for instance in instances]
+
+    def set(self, instance, value):
+        """Assign value (it is parsed and validated like on assignment)."""
+        if any(selector == "" for _, selector in self.segments):
+            raise ValueError(f"Can't assign to all items of '{self.path}'.")
+
+        parent = self._get_parent(instance)
+        if parent is None:
+            raise ValueError(f"Can't assign to '{self.path}', it has no parent.")
+
+        name, selector = self.segments[-1]
+        field = _find_field(type(parent), name)
+        if selector is None:
+            parent.set_field(field, name, value)
+            return
+
+        parent._check_not_frozen()
+        items = field.__get__(parent)
+        [value] = field.parse_value([value])
+        items[int(selector)] = value
+
+
+def _parse_path(path):
+    segments = []
+    for segment in path.split("."):
+        match = _SEGMENT.match(segment)
+        if match is None:
+            raise ValueError(f"Wrong path: '{path}'.")
+        segments.append(match.groups())
+    return segments
+
+
+def _find_field(model, name):
+    index = model._get_fields_index()
+    if name in index.by_name:
+        return index.by_name[name]
+    if name in index.by_structure_name:
+        return index.by_structure_name[name][1]
+    raise ValueError(f"'{model.__name__}' has no field '{name}'.")
+
+
+def _compile_getter(model, segments):
+    if not segments:
+        return _identity
+
+    name, selector = segments[0]
+    field = _find_field(model, name)
+    if selector is not None and not isinstance(field, fields.ListField):
+        raise ValueError(f"Field '{name}' isn't a list.")
+
+    get_value = _get_value(field)
+    get_rest = _compile_rest(field, segments[1:])
+    if selector is None:
+        return _chain(get_value, get_rest)
+    if selector == "":
+        return _chain_items(get_value, get_rest)
+    return _chain_item(get_value, int(selector), get_rest)
+
+
+def _compile_rest(field, segments):
+    if not segments:
+        return _identity
+
+    if isinstance(field, fields.EmbeddedField):
+        types = field.types
+    elif isinstance(field, fields.ListField):
+        types = field.items_types
+    else:
+        raise ValueError(f"Can't get '{segments[0][0]}' from {type(field).__name__}.")
+
+    if len(types) == 1:
+        return _compile_getter(types[0], segments)
+    return _DynamicGetter(segments)
+
+
+def _get_value(field):
+    memory = field.memory
+
+    def get_value(instance):
+        try:
+            return memory[instance._cache_key]
+        except KeyError:
+            return field.__get__(instance)
+
+    return get_value
+
+
+def _identity(value):
+    return value
+
+
+def _chain(get_value, get_rest):
+    if get_rest is _identity:
+        return get_value
+
+    def get(instance):
+        value = get_value(instance)
+        return None if value is None else get_rest(value)
+
+    return get
+
+
+def _chain_items(get_value, get_rest):
+    def get(instance):
+        values = get_value(instance)
+        if values is None:
+            return None
+        return [None if value is None else get_rest(value) for value in values]
+
+    return get
+
+
+def _chain_item(get_value, index, get_rest):
+    def get(instance):
+        values = get_value(instance)
+        if values is None:
+            return None
+        value = values[index]
+        return None if value is None else get_rest(value)
+
+    return get
+
+
+class _DynamicGetter:
+    """Getter compiled for type of each value (for fields with many types)."""
+
+    def __init__(self, segments):
+        self.segments = segments
+        self.getters = {}
+
+    def __call__(self, value):
+        try:
+            get = self.getters[type(value)]
+        except KeyError:
+            get = self.getters[type(value)] = _compile_getter(
+                type(value), self.segments
+            )
+        return get(value)
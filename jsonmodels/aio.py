@@ -0,0 +1,124 @@
+"""Support of asynchronous validators.
+
+Validator (function or object with `validate` method) can be coroutine
+function. Results of validators, which are awaitable, are collected while
+model is validated with `validate` (called by `Base.avalidate`) and awaited
+concurrently afterwards. Synchronous validators are still run right away.
+
+Outside of `Base.avalidate` (e.g. when value is assigned) results of
+asynchronous validators are dropped.
+
+"""
+
+import asyncio
+import contextvars
+import inspect
+
+from .errors import ValidationError
+
+_pending = contextvars.ContextVar("jsonmodels_pending", default=None)
+_dropped = contextvars.ContextVar("jsonmodels_dropped", default=0)
+
+
+async def validate(model, concurrency=None):
+    """Validate model, awaiting asynchronous validators (see `Base.avalidate`)."""
+    pending = Pending()
+    token = _pending.set(pending)
+    try:
+        model.validate()
+    except BaseException:
+        pending.close()
+        raise
+    finally:
+        _pending.reset(token)
+    await pending.run(concurrency)
+
+
+def get_pending():
+    """Get awaitables collected in current validation (or `None`)."""
+    return _pending.get()
+
+
+def defer(result):
+    """Collect result of validator, if it is awaitable."""
+    if not inspect.isawaitable(result):
+        return
+    pending = _pending.get()
+    if pending is None:
+        _close(result)
+        _dropped.set(_dropped.get() + 1)
+    else:
+        pending.add(result)
+
+
+def count():
+    """Get number of awaitables met so far (collected or dropped).
+
+    It tells, if any asynchronous validator was run by some code.
+
+    """
+    pending = _pending.get()
+    return _dropped.get() if pending is None else len(pending)
+
+
+class Pending:
+    """Awaitables of asynchronous validators, with names of fields of them."""
+
+    def __init__(self):
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, awaitable):
+        self.entries.append((awaitable, []))
+
+    def wrap(self, start, name):
+        """Mark entries added since `start` as errors of field `name`."""
+        for _, names in self.entries[start:]:
+            names.append(name)
+
+    def close(self):
+        for awaitable, _ in self.entries:
+            _close(awaitable)
+
+    async def run(self, concurrency=None):
+        """Await all the entries, with at most `concurrency` at once.
+
+        Error of first failed entry (in order of fields) is raised. No new
+        entries are started after any of them fails.
+
+        """
+        if not self.entries:
+            return
+        entries = iter(enumerate(self.entries))
+        errors = {}
+        workers = min(concurrency or len(self.entries), len(self.entries))
+        await asyncio.gather(*(_work(entries, errors) for _ in range(workers)))
+        if errors:
+            raise errors[min(errors)]
+
+
+async def _work(entries, errors):
+    """Await entries one by one, until any of them (in any worker) fails."""
+    for index, (awaitable, names) in entries:
+        if errors:
+            _close(awaitable)
+            continue
+        try:
+            await awaitable
+        except ValidationError as error:
+            errors[index] = _wrap(error, names)
+        except Exception as error:
+            errors[index] = error
+
+
+def _wrap(error, names):
+    for name in names:
+        error = ValidationError(f"Error for field '{name}'.", error)
+    return error
+
+
+def _close(awaitable):
+    if inspect.iscoroutine(awaitable):
+        awaitable.close()
@@ -0,0 +1,233 @@
+"""Conversion of models to Apache Arrow record batches (and back).
+
+This module requires ``pyarrow`` (install ``jsonmodels[arrow]``).
+
+Columns are named with structure names of fields. Embedded models become
+struct columns, lists become list columns, dates and times are stored with
+Arrow date and time types (timezone aware datetimes are stored in UTC).
+
+"""
+
+import array
+
+import pyarrow
+
+from . import fields
+from .batches import ModelBatch
+from .errors import FieldNotSupported
+
+_TYPECODES = {
+    "d": pyarrow.float64(),
+    "f": pyarrow.float32(),
+    "q": pyarrow.int64(),
+    "l": pyarrow.int64() if array.array("l").itemsize == 8 else pyarrow.int32(),
+    "i": pyarrow.int32(),
+    "h": pyarrow.int16(),
+    "b": pyarrow.int8(),
+    "Q": pyarrow.uint64(),
+    "I": pyarrow.uint32(),
+    "H": pyarrow.uint16(),
+    "B": pyarrow.uint8(),
+}
+
+
+def get_schema(model):
+    """Get Arrow schema of model.
+
+    :param model: Model class.
+    :rtype: ``pyarrow.Schema``
+
+    """
+    return pyarrow.schema(_get_arrow_fields(model, ()))
+
+
+def to_record_batch(model, items):
+    """Convert instances of model (or raw structures) to record batch.
+
+    Values are gathered column by column. Raw structures are parsed and
+    validated in bulk with `ModelBatch` first.
+
+    :param model: Model class.
+    :param items: `ModelBatch`, ``list`` of instances of model or ``list`` of
+        structures (``dict``).
+    :rtype: ``pyarrow.RecordBatch``
+
+    """
+    if not isinstance(items, ModelBatch):
+        items = list(items)
+        if items and isinstance(items[0], dict):
+            items = ModelBatch.from_structs(model, items)
+
+    schema = get_schema(model)
+    arrays = []
+    for (name, _, field), arrow_field in zip(model.iterate_with_name(), schema):
+        if isinstance(items, ModelBatch):
+            values = items.columns[name]
+        else:
+            values = [field.__get__(item) for item in items]
+        arrays.append(_to_array(field, values, arrow_field.type))
+    return pyarrow.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def from_record_batch(model, record_batch):
+    """Read instances of model from record batch.
+
+    :param model: Model class.
+    :param record_batch: ``pyarrow.RecordBatch`` (or ``pyarrow.Table``).
+    :rtype: ``list`` of instances of model
+
+    """
+    return [model(**struct) for struct in _iter_structs(record_batch)]
+
+
+def to_model_batch(model, record_batch, validate=True):
+    """Read record batch into `ModelBatch` of model.
+
+    :param model: Model class.
+    :param record_batch: ``pyarrow.RecordBatch`` (or ``pyarrow.Table``).
+    :param bool validate: Validate all the columns.
+    :rtype: `jsonmodels.batches.ModelBatch`
+
+    """
+    return ModelBatch.from_structs(model, _iter_structs(record_batch), validate)
+
+
+def write_parquet(model, items, path):
+    """Write instances of model (or raw structures) to Parquet file.
+
+    See `to_record_batch` for accepted `items`.
+
+    """
+    import pyarrow.parquet
+
+    record_batch = to_record_batch(model, items)
+    pyarrow.parquet.write_table(pyarrow.Table.from_batches([record_batch]), path)
+
+
+def read_parquet(model, path):
+    """Read instances of model from Parquet file.
+
+    :rtype: ``list`` of instances of model
+
+    """
+    import pyarrow.parquet
+
+    return from_record_batch(model, pyarrow.parquet.read_table(path))
+
+
+def _get_arrow_fields(model, seen):
+    if model in seen:
+        raise FieldNotSupported(f"Model '{model.__name__}' references itself.")
+    seen = seen + (model,)
+    return [
+        pyarrow.field(name, _get_arrow_type(field, seen), nullable=not field.required)
+        for _, name, field in model.iterate_with_name()
+    ]
+
+
+def _get_arrow_type(field, seen):
+    field._finish_initialization(seen[-1])
+    if isinstance(field, fields.EmbeddedField):
+        return pyarrow.struct(_get_arrow_fields(_get_single_type(field.types), seen))
+    if isinstance(field, fields.ListField):
+        type_ = _get_single_type(field.items_types)
+        if hasattr(type_, "iterate_with_name"):
+            return pyarrow.list_(pyarrow.struct(_get_arrow_fields(type_, seen)))
+        return pyarrow.list_(_get_primitive_type(type_))
+    if isinstance(field, fields.NumericArrayField):
+        return pyarrow.list_(_TYPECODES[field.typecode])
+    for field_type, arrow_type in _FIELD_TYPES:
+        if isinstance(field, field_type):
+            return arrow_type
+    raise FieldNotSupported(f"Field {type(field).__name__} is not supported!")
+
+
+_FIELD_TYPES = [
+    (fields.DateTimeField, pyarrow.timestamp("us")),
+    (fields.DateField, pyarrow.date32()),
+    (fields.TimeField, pyarrow.time64("us")),
+    (fields.StringField, pyarrow.string()),
+    (fields.BoolField, pyarrow.bool_()),
+    (fields.IntField, pyarrow.int64()),
+    (fields.FloatField, pyarrow.float64()),
+]
+
+_PRIMITIVE_TYPES = [
+    (bool, pyarrow.bool_()),
+    (int, pyarrow.int64()),
+    (float, pyarrow.float64()),
+    (str, pyarrow.string()),
+]
+
+
+def _get_single_type(types):
+    if len(types) != 1:
+        names = ", ".join(type_.__name__ for type_ in types)
+        raise FieldNotSupported(f"Can't store one of many types ({names}) in Arrow.")
+    return types[0]
+
+
+def _get_primitive_type(type_):
+    for python_type, arrow_type in _PRIMITIVE_TYPES:
+        if issubclass(type_, python_type):
+            return arrow_type
+    raise FieldNotSupported(f"Type {type_.__name__} is not supported!")
+
+
+def _to_array(field, values, arrow_type):
+    if isinstance(values, array.array) and _TYPECODES[values.typecode] == arrow_type:
+        # Column of `ModelBatch` (with no missing values) is used as it is.
+        buffer = pyarrow.py_buffer(values)
+        return pyarrow.Array.from_buffers(arrow_type, len(values), [None, buffer])
+
+    convert = _get_converter(field)
+    if convert is not None:
+        values = [None if value is None else convert(value) for value in values]
+    return pyarrow.array(values, type=arrow_type)
+
+
+def _get_converter(field):
+    """Get function making value acceptable for Arrow (or `None`)."""
+    if isinstance(field, fields.EmbeddedField):
+        return _model_to_dict
+    if isinstance(field, fields.ListField):
+        return _items_to_list
+    if isinstance(field, fields.NumericArrayField):
+        return array.array.tolist
+    return None
+
+
+def _model_to_dict(model):
+    struct = {}
+    for _, name, field in model.iterate_with_name():
+        value = field.__get__(model)
+        convert = _get_converter(field)
+        if value is not None and convert is not None:
+            value = convert(value)
+        struct[name] = value
+    return struct
+
+
+def _items_to_list(items):
+    return [
+        _model_to_dict(item) if hasattr(item, "iterate_with_name") else item
+        for item in items
+    ]
+
+
+def _iter_structs(record_batch):
+    for row in record_batch.to_pylist():
+        yield _drop_missing(row)
+
+
+def _drop_missing(struct):
+    """Drop `None` values (Arrow has them for all missing fields)."""
+    result = {}
+    for key, value in struct.items():
+        if isinstance(value, dict):
+            value = _drop_missing(value)
+        elif isinstance(value, list):
+            value = [_drop_missing(v) if isinstance(v, dict) else v for v in value]
+        if value is not None:
+            result[key] = value
+    return result
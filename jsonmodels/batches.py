@@ -0,0 +1,286 @@
+"""Many instances of one model, stored column by column."""
+
+import array
+import sys
+
+from . import fields
+from .errors import FieldNotFound, ValidationError
+
+_MISSING = object()
+# Types of items of arrays made by `_pack`.
+_ITEM_TYPES = {"q": int, "d": float}
+
+
+class ModelBatch:
+    """Instances of one model, with values of each field kept in one column.
+
+    Columns of numbers (without missing values) are compact arrays, strings
+    are interned, other values are kept in lists. Rows are read through views
+    (see `RowView`), which are created on demand.
+
+    """
+
+    def __init__(self, model, columns, length):
+        """Init.
+
+        :param model: Model class.
+        :param dict columns: Values of fields (already parsed), by attribute
+            names of fields.
+        :param int length: Number of rows.
+
+        """
+        self.model = model
+        self.columns = columns
+        self._length = length
+        self._view = get_view_class(model)
+
+    @classmethod
+    def from_structs(cls, model, records, validate=True):
+        """Parse structures (like these given to `populate`) into batch.
+
+        :param model: Model class.
+        :param records: Iterable of ``dict``.
+        :param bool validate: Validate all the columns.
+        :rtype: `ModelBatch`
+
+        """
+        records = records if isinstance(records, list) else list(records)
+        columns = {}
+        for name, structure_name, field in model.iterate_with_name():
+            field._finish_initialization(model)
+            values = _get_values(records, structure_name, name)
+            columns[name] = _pack(_parse(field, values))
+
+        batch = cls(model, columns, len(records))
+        if validate:
+            batch.validate()
+        return batch
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Row index out of range.")
+        return self._view(self, index)
+
+    def __iter__(self):
+        view = self._view
+        for index in range(self._length):
+            yield view(self, index)
+
+    def column(self, name):
+        """Get column of field (by attribute or structure name).
+
+        :rtype: ``array.array`` or ``list``
+
+        """
+        if name in self.columns:
+            return self.columns[name]
+        for attribute, structure_name, _ in self.model.iterate_with_name():
+            if structure_name == name:
+                return self.columns[attribute]
+        raise FieldNotFound("Field not found", name)
+
+    def validate(self):
+        """Validate all the columns.
+
+        Type checks and validators, which can check many values at once (like
+        `Min`, `Max`, `Enum` and `Length`), are run once per column. Rows are
+        checked one by one only to find the invalid one.
+
+        """
+        for name, _, field in self.model.iterate_with_name():
+            values = self.columns[name]
+            try:
+                _validate_column(field, values)
+            except (ValidationError, TypeError):
+                _validate_rows(name, field, values)
+                raise
+
+    def to_structs(self):
+        """Cast all the rows to structures (like `to_struct` of model does).
+
+        :rtype: ``list`` of ``dict``
+
+        """
+        structs = [{} for _ in range(self._length)]
+        for name, structure_name, field in self.model.iterate_with_name():
+            to_struct = _get_converter(field)
+            for struct, value in zip(structs, self.columns[name]):
+                if value is not None:
+                    struct[structure_name] = to_struct(value)
+        return structs
+
+
+class RowView:
+    """Read-only view of one row of `ModelBatch`.
+
+    Values are read with the same attributes as from instance of model.
+
+    """
+
+    __slots__ = ("batch", "index")
+
+    model = None
+
+    def __init__(self, batch, index):
+        self.batch = batch
+        self.index = index
+
+    def __setattr__(self, name, value):
+        if name in RowView.__slots__ and not hasattr(self, name):
+            return object.__setattr__(self, name, value)
+        raise AttributeError(f"Row of '{self.model.__name__}' batch is read-only.")
+
+    def __repr__(self):
+        return f"<{type(self).__name__}: row {self.index}>"
+
+    def __iter__(self):
+        """Iterate through fields and values (like model does)."""
+        for name, _, field in self.model.iterate_with_name():
+            yield name, field
+
+    def to_struct(self):
+        """Cast row to structure."""
+        struct = {}
+        for name, structure_name, field in self.model.iterate_with_name():
+            value = self.batch.columns[name][self.index]
+            if value is not None:
+                struct[structure_name] = _get_converter(field)(value)
+        return struct
+
+    def to_model(self):
+        """Create instance of model with values of row.
+
+        Lists, dicts and embedded models are copied (like by deep `copy` of
+        model), so changes of instance don't change batch.
+
+        """
+        instance = self.model()
+        for name, _, field in self.model.iterate_with_name():
+            value = self.batch.columns[name][self.index]
+            if value is not None:
+                field.memory[instance._cache_key] = value
+        return instance.copy(deep=True)
+
+
+def get_view_class(model):
+    """Get class of row views of model (it is created on first use)."""
+    compiled = model._get_fields_index().compiled
+    try:
+        return compiled["row_view"]
+    except KeyError:
+        pass
+
+    attributes = {"__slots__": (), "model": model}
+    for name, _, _ in model.iterate_with_name():
+        attributes[name] = property(_get_column_getter(name))
+    view = compiled["row_view"] = type(f"{model.__name__}Row", (RowView,), attributes)
+    return view
+
+
+def _get_column_getter(name):
+    def get(view):
+        return view.batch.columns[name][view.index]
+
+    return get
+
+
+def _get_values(records, structure_name, name):
+    if structure_name == name:
+        return [record.get(name, _MISSING) for record in records]
+    return [
+        (
+            record[structure_name]
+            if structure_name in record
+            else record.get(name, _MISSING)
+        )
+        for record in records
+    ]
+
+
+def _parse(field, values):
+    """Parse values like on assignment (missing ones get default value)."""
+    if type(field).parse_value is fields.BaseField.parse_value:
+        default = field.get_default_value()
+        return [default if value is _MISSING else value for value in values]
+
+    parse, get_default = field.parse_value, field.get_default_value
+    return [parse(get_default() if value is _MISSING else value) for value in values]
+
+
+def _pack(values):
+    """Store values in compact form, if they allow it."""
+    if not values:
+        return values
+    kind = type(values[0])
+    if not all(type(value) is kind for value in values):
+        return values
+
+    if kind is int:
+        try:
+            return array.array("q", values)
+        except OverflowError:
+            return values
+    if kind is float:
+        return array.array("d", values)
+    if kind is str:
+        return [sys.intern(value) for value in values]
+    return values
+
+
+def _validate_column(field, values):
+    if type(field).validate is not fields.BaseField.validate:
+        for value in values:
+            field.validate(value)
+        return
+
+    field._check_types()
+    present = _check_column_types(field, values)
+    if present is None:
+        # Missing values aren't allowed or validators are run for them too.
+        for value in values:
+            field.validate(value)
+    elif field.validators:
+        fields._validate_all(field.validators, present)
+
+
+def _check_column_types(field, values):
+    """Check types of values, get the ones which aren't `None`.
+
+    `None` is returned, if values must be validated one by one.
+
+    """
+    if isinstance(values, array.array):
+        if not issubclass(_ITEM_TYPES[values.typecode], field.types):
+            # All the numbers are of wrong type, the first one is reported.
+            field.validate(values[0])
+        return values
+
+    present = [value for value in values if value is not None]
+    if len(present) != len(values) and (field.required or not field.nullable):
+        return None
+    for value in present:
+        field._validate_against_types(value)
+    return present
+
+
+def _validate_rows(name, field, values):
+    for index, value in enumerate(values):
+        try:
+            field.validate(value)
+        except ValidationError as error:
+            raise ValidationError(f"Error for field '{name}' in row {index}: {error}.")
+
+
+def _get_converter(field):
+    if type(field).to_struct is fields.BaseField.to_struct:
+        return _identity
+    return field.to_struct
+
+
+def _identity(value):
+    return value
@@ -2,6 +2,7 @@
 
 import warnings
 from collections import defaultdict
+from contextlib import contextmanager
 
 from . import errors
 from .fields import NotSet
@@ -10,9 +11,11 @@ from .fields import NotSet
 class Builder:
     def __init__(self, parent=None, nullable=False, default=NotSet):
         self.parent = parent
+        self.root = parent.root if parent else self
         self.types_builders = {}
         self.types_count = defaultdict(int)
         self.definitions = set()
+        self.open_definitions = 0
         self.nullable = nullable
         self.default = default
 
@@ -21,34 +24,50 @@ class Builder:
         return self.default is not NotSet
 
     def register_type(self, type, builder):
-        if self.parent:
-            return self.parent.register_type(type, builder)
-
-        self.types_count[type] += 1
-        if type not in self.types_builders:
-            self.types_builders[type] = builder
+        root = self.root
+        root.types_count[type] += 1
+        first_builder = root.types_builders.setdefault(type, builder)
+        if root.types_count[type] == 2 and first_builder.is_open:
+            # Type is referenced from inside of its own subtree, so from now on
+            # everything built under it must become a definition.
+            root.open_definitions += 1
 
     def get_builder(self, type):
-        if self.parent:
-            return self.parent.get_builder(type)
-
-        return self.types_builders[type]
+        return self.root.types_builders[type]
 
     def count_type(self, type):
-        if self.parent:
-            return self.parent.count_type(type)
-
-        return self.types_count[type]
+        return self.root.types_count[type]
 
     @staticmethod
     def maybe_build(value):
         return value.build() if isinstance(value, Builder) else value
 
     def add_definition(self, builder):
-        if self.parent:
-            return self.parent.add_definition(builder)
+        self.root.definitions.add(builder)
+
 
-        self.definitions.add(builder)
+class BundleBuilder(Builder):
+    """Builder of one schema for many models, which share all definitions."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.roots = []
+        # Every model met in bundle is kept in definitions.
+        self.open_definitions = 1
+
+    def add_root(self, builder):
+        self.roots.append(builder)
+
+    def build(self):
+        roots = [self.maybe_build(builder) for builder in self.roots]
+        definitions = sorted(self.definitions, key=lambda builder: builder.type_name)
+        return {
+            "oneOf": roots,
+            "definitions": {
+                builder.type_name: builder.build_definition(False, False)
+                for builder in definitions
+            },
+        }
 
 
 class ObjectBuilder(Builder):
@@ -57,9 +76,29 @@ class ObjectBuilder(Builder):
         self.properties = {}
         self.required = []
         self.type = model_type
+        self.is_open = False
 
         self.register_type(self.type, self)
 
+    @contextmanager
+    def populating(self):
+        """Mark builder as being populated with fields of its model.
+
+        Builders of all types met while populating are nested in this one,
+        which lets `is_definition` be resolved without walking up parents.
+
+        """
+        root = self.root
+        if self.count_type(self.type) > 1:
+            root.open_definitions += 1
+        self.is_open = True
+        try:
+            yield self
+        finally:
+            self.is_open = False
+            if self.count_type(self.type) > 1:
+                root.open_definitions -= 1
+
     def add_field(self, name, field, schema):
         _apply_validators_modifications(schema, field)
         self.properties[name] = schema
@@ -70,7 +109,6 @@ class ObjectBuilder(Builder):
         builder = self.get_builder(self.type)
         if self.is_definition and not self.is_root:
             self.add_definition(builder)
-            [self.maybe_build(value) for _, value in self.properties.items()]
             return f"#/definitions/{self.type_name}"
         else:
             return builder.build_definition(nullable=self.nullable)
@@ -110,10 +148,9 @@ class ObjectBuilder(Builder):
     def is_definition(self):
         if self.count_type(self.type) > 1:
             return True
-        elif self.parent:
-            return self.parent.is_definition
-        else:
-            return False
+        # Any ancestor which is still being populated and turned out to be
+        # a definition makes this builder a definition too.
+        return self.root.open_definitions > 0
 
     @property
     def is_root(self):
@@ -227,3 +264,30 @@ class EmbeddedBuilder(Builder):
     @property
     def is_definition(self):
         return self.parent.is_definition
+
+
+class DiscriminatedBuilder(Builder):
+    """Builder, which marks schema of model with value of discriminator."""
+
+    def __init__(self, builder, name, value, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.builder = builder
+        self.name = name
+        self.value = value
+
+    def build(self):
+        schema = self.maybe_build(self.builder)
+        if not isinstance(schema, dict):
+            # Reference to definition, which can't be modified.
+            constraint = {
+                "properties": {self.name: {"const": self.value}},
+                "required": [self.name],
+            }
+            return {"allOf": [schema, constraint]}
+
+        properties = dict(schema["properties"])
+        properties[self.name] = dict(properties[self.name], const=self.value)
+        required = list(schema.get("required", []))
+        if self.name not in required:
+            required.append(self.name)
+        return dict(schema, properties=properties, required=required)
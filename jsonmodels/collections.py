@@ -1,18 +1,287 @@
+import array
+
+from . import aio
+from .errors import FrozenModelError
+
+
 class ModelCollection(list):
     """`ModelCollection` is list which validates stored values.
 
     Validation is made with use of field passed to `__init__` at each point,
-    when new value is assigned.
+    when new value is assigned (values added at once, e.g. with `extend`, are
+    validated in one batch, before collection is changed). Collection knows
+    how many of its first items were already validated, so
+    `ListField.validate` checks only the new ones.
+
+    If field has `index_on` names, collection keeps index of items by value of
+    each of these fields (see `get_by`). Index is updated by all the methods
+    changing collection, but not when item itself is changed - call `reindex`
+    then (or use frozen models as items).
 
     """
 
     def __init__(self, field):
         self.field = field
+        self._validated = 0
+        self._indexes = {name: {} for name in getattr(field, "index_on", ())}
 
     def append(self, value):
-        self.field.validate_single_value(value)
-        super().append(value)
+        valid = self._check(self.field.validate_single_value, value)
+        self._change(len(self), super().append, value, valid=valid)
+        if self._indexes:
+            self._add_to_indexes((value,))
+
+    def extend(self, values):
+        values = list(values)
+        valid = self._check(self.field.validate_items, values)
+        self._change(len(self), super().extend, values, valid=valid)
+        if self._indexes:
+            self._add_to_indexes(values)
+
+    def __iadd__(self, values):
+        self.extend(values)
+        return self
+
+    def __imul__(self, times):
+        self._change(len(self), super().__imul__, times)
+        if self._indexes:
+            self.reindex()
+        return self
+
+    def insert(self, index, value):
+        valid = self._check(self.field.validate_single_value, value)
+        position = self._get_position(index)
+        self._change(position, super().insert, index, value, valid=valid)
+        if self._indexes:
+            self._add_to_indexes((value,))
 
     def __setitem__(self, key, value):
-        self.field.validate_single_value(value)
-        super().__setitem__(key, value)
+        if isinstance(key, slice):
+            value = list(value)
+            valid = self._check(self.field.validate_items, value)
+            old = self[key]
+        else:
+            valid = self._check(self.field.validate_single_value, value)
+            old = (self[key],)
+        position = self._get_position(key)
+        self._change(position, super().__setitem__, key, value, valid=valid)
+        if self._indexes:
+            self._remove_from_indexes(old)
+            self._add_to_indexes(value if isinstance(key, slice) else (value,))
+
+    def __delitem__(self, key):
+        old = self[key] if isinstance(key, slice) else (self[key],)
+        self._change(self._get_position(key), super().__delitem__, key)
+        if self._indexes:
+            self._remove_from_indexes(old)
+
+    def pop(self, index=-1):
+        value = self[index]
+        del self[index]
+        return value
+
+    def remove(self, value):
+        del self[self.index(value)]
+
+    def clear(self):
+        super().clear()
+        self._validated = 0
+        for index in self._indexes.values():
+            index.clear()
+
+    def sort(self, *args, **kwargs):
+        self._change(0, super().sort, *args, **kwargs)
+
+    def reverse(self):
+        self._change(0, super().reverse)
+
+    def copy(self):
+        """Get shallow copy of collection (with copy of its indexes)."""
+        collection = ModelCollection(self.field)
+        list.extend(collection, self)
+        collection._validated = self._validated
+        for name, index in self._indexes.items():
+            collection._indexes[name] = {
+                value: list(items) for value, items in index.items()
+            }
+        return collection
+
+    def get_by(self, name, value):
+        """Get item, which has given value of indexed field.
+
+        If many items have this value, first of them is returned.
+
+        :param str name: Name of field from `index_on` of list field.
+        :raises KeyError: If there is no such item.
+
+        """
+        items = self._get_index(name).get(value)
+        if not items:
+            raise KeyError(value)
+        if len(items) == 1:
+            return items[0]
+        return self.get_all_by(name, value)[0]
+
+    def get_all_by(self, name, value):
+        """Get all the items, which have given value of indexed field.
+
+        :param str name: Name of field from `index_on` of list field.
+        :rtype: ``list`` (items are in order of collection)
+
+        """
+        items = self._get_index(name).get(value, [])
+        if len(items) <= 1:
+            return list(items)
+        ids = {id(item) for item in items}
+        return [item for item in self if id(item) in ids]
+
+    def reindex(self):
+        """Build indexes from scratch (e.g. after items were changed)."""
+        for index in self._indexes.values():
+            index.clear()
+        self._add_to_indexes(self)
+
+    def _load(self, values):
+        """Add values without validation (`ListField.validate` checks them)."""
+        super().extend(values)
+        if self._indexes:
+            self._add_to_indexes(values)
+
+    def _check(self, validate, value):
+        """Validate new value(s), tell if they are known to be valid.
+
+        They aren't, if any asynchronous validator was skipped.
+
+        """
+        count = aio.count()
+        validate(value)
+        return aio.count() == count
+
+    def _change(self, position, method, *args, valid=True, **kwargs):
+        """Call method changing items from `position` and update marker."""
+        validated = valid and self._validated >= len(self)
+        method(*args, **kwargs)
+        if validated:
+            # New values are validated (unless `valid` tells otherwise).
+            self._validated = len(self)
+        else:
+            self._validated = min(self._validated, position)
+
+    def _get_position(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self))
+            return min(range(start, stop, step), default=start)
+        return max(key + len(self), 0) if key < 0 else key
+
+    def _get_index(self, name):
+        try:
+            return self._indexes[name]
+        except KeyError:
+            raise ValueError(f"Collection isn't indexed on '{name}'.")
+
+    def _add_to_indexes(self, items):
+        for name, index in self._indexes.items():
+            for item in items:
+                value = getattr(item, name)
+                try:
+                    index[value].append(item)
+                except KeyError:
+                    index[value] = [item]
+
+    def _remove_from_indexes(self, items):
+        for name, index in self._indexes.items():
+            for item in items:
+                if not _discard(index, getattr(item, name), item):
+                    # Item was changed after it was indexed.
+                    for value in list(index):
+                        if _discard(index, value, item):
+                            break
+
+
+def _discard(index, value, item):
+    bucket = index.get(value, ())
+    for position, other in enumerate(bucket):
+        if other is item:
+            del bucket[position]
+            if not bucket:
+                del index[value]
+            return True
+    return False
+
+
+def _refuse(self, *args, **kwargs):
+    raise FrozenModelError("Value of frozen model can't be changed.")
+
+
+class FrozenList(list):
+    """Read-only list (value of frozen model)."""
+
+    append = extend = insert = pop = remove = clear = sort = reverse = _refuse
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse
+
+    def __reduce__(self):
+        return freeze, (self.copy(),)
+
+
+class FrozenCollection(FrozenList, ModelCollection):
+    """Read-only `ModelCollection` (value of list field of frozen model).
+
+    `copy` gives collection, which can be changed.
+
+    """
+
+
+class FrozenDict(dict):
+    """Read-only dict (value of frozen model)."""
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    clear = pop = popitem = setdefault = update = _refuse
+
+    def __reduce__(self):
+        return freeze, (self.copy(),)
+
+
+class FrozenArray(array.array):
+    """Read-only array (value of `NumericArrayField` of frozen model)."""
+
+    append = extend = insert = pop = remove = reverse = byteswap = _refuse
+    frombytes = fromfile = fromlist = fromunicode = _refuse
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _refuse
+
+
+_FROZEN_TYPES = (FrozenList, FrozenDict, FrozenArray)
+
+
+def freeze(value):
+    """Get read-only equivalent of value of field of frozen model.
+
+    Lists (including `ModelCollection`), dicts and arrays are copied into
+    their read-only subclasses (items of lists and dicts recursively). Other
+    values are returned as they are.
+
+    """
+    if isinstance(value, _FROZEN_TYPES):
+        return value
+    if isinstance(value, ModelCollection):
+        frozen = FrozenCollection(value.field)
+        list.extend(frozen, [freeze(item) for item in value])
+        frozen._validated = value._validated
+        if frozen._indexes:
+            frozen.reindex()
+        return frozen
+    if isinstance(value, list):
+        return FrozenList(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, array.array):
+        return FrozenArray(value.typecode, value)
+    return value
+
+
+def thaw(value):
+    """Get copy of read-only value (see `freeze`), which can be changed."""
+    if isinstance(value, FrozenList):
+        return [thaw(item) for item in value]
+    if isinstance(value, FrozenDict):
+        return {key: thaw(item) for key, item in value.items()}
+    return value
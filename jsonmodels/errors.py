@@ -8,3 +8,35 @@ class FieldNotFound(RuntimeError):
 
 class FieldNotSupported(ValueError):
     pass
+
+
+class FrozenModelError(AttributeError):
+    pass
+
+
+class PatchError(ValueError):
+    pass
+
+
+class ErrorRecord:
+    """Validation error described without raising it.
+
+    Message is formatted from `template` and `params` only when requested,
+    so huge values don't cost anything unless the message is needed.
+
+    """
+
+    __slots__ = ("code", "template", "params", "path")
+
+    def __init__(self, code, template, params=None, path=()):
+        self.code = code
+        self.template = template
+        self.params = params or {}
+        self.path = path
+
+    @property
+    def message(self):
+        return self.template.format(**self.params)
+
+    def __repr__(self):
+        return f"{type(self).__name__}(code={self.code!r}, path={self.path!r})"
@@ -1,3 +1,4 @@
+import array
 import datetime
 import re
 import warnings
@@ -5,8 +6,9 @@ from weakref import WeakKeyDictionary
 
 from dateutil.parser import parse
 
-from .collections import ModelCollection
-from .errors import ValidationError
+from . import aio, interning
+from .collections import ModelCollection, freeze, thaw
+from .errors import ErrorRecord, ValidationError
 
 # unique marker for "no default value specified". None is not good enough since
 # it is a completely valid default value.
@@ -51,6 +53,8 @@ class BaseField:
         self._finish_initialization(type(instance))
         value = self.parse_value(value)
         self.validate(value)
+        if instance._frozen:
+            value = freeze(value)
         self.memory[instance._cache_key] = value
 
     def __get__(self, instance, owner=None):
@@ -68,38 +72,85 @@ class BaseField:
 
     def _check_value(self, obj):
         if obj._cache_key not in self.memory:
-            self.__set__(obj, self.get_default_value())
+            if self in obj.__dict__.get("_raw_values", ()):
+                obj._load_raw_value(self)
+            else:
+                self.__set__(obj, self.get_default_value())
 
     def validate_for_object(self, obj):
         value = self.__get__(obj)
         self.validate(value)
 
+    def iter_errors_for_object(self, obj, path=()):
+        """Iterate over errors of value of field in given object.
+
+        Unlike `validate_for_object`, it doesn't assign default value.
+
+        """
+        self._finish_initialization(type(obj))
+        try:
+            value = self.memory[obj._cache_key]
+        except KeyError:
+            value = self.parse_value(self.get_default_value())
+        return self.iter_errors(value, path)
+
     def validate(self, value):
         self._check_types()
         self._validate_against_types(value)
         self._check_against_required(value)
         self._validate_with_custom_validators(value)
 
+    def iter_errors(self, value, path=()):
+        """Iterate over errors of value, without raising them.
+
+        :param value: Value (already parsed) to check.
+        :param tuple path: Path to value, which is set in each error.
+        :rtype: Iterator of `jsonmodels.errors.ErrorRecord`.
+
+        """
+        error = (
+            self._get_types_error()
+            or self._get_type_error(value)
+            or self._get_required_error(value)
+        )
+        if error is not None:
+            error.path = path
+            yield error
+            return
+
+        if value is None and self.nullable:
+            return
+        yield from _iter_validators_errors(self.validators, value, path)
+
     def _check_against_required(self, value):
+        error = self._get_required_error(value)
+        if error is not None:
+            raise ValidationError(error.message)
+
+    def _get_required_error(self, value):
         if value is None and self.required:
-            raise ValidationError("Field is required!")
+            return ErrorRecord("required", "Field is required!")
 
     def _validate_against_types(self, value):
+        error = self._get_type_error(value)
+        if error is not None:
+            raise ValidationError(error.message, value)
+
+    def _get_type_error(self, value):
         if value is not None and not isinstance(value, self.types):
-            raise ValidationError(
-                'Value is wrong, expected type "{types}"'.format(
-                    types=", ".join([t.__name__ for t in self.types])
-                ),
-                value,
-            )
+            types = ", ".join([t.__name__ for t in self.types])
+            tpl = 'Value is wrong, expected type "{types}"'
+            return ErrorRecord("type", tpl, {"types": types, "value": value})
 
     def _check_types(self):
+        error = self._get_types_error()
+        if error is not None:
+            raise ValidationError(error.message)
+
+    def _get_types_error(self):
         if self.types is None:
-            raise ValidationError(
-                'Field "{type}" is not usable, try different field type.'.format(
-                    type=type(self).__name__
-                )
-            )
+            tpl = 'Field "{type}" is not usable, try different field type.'
+            return ErrorRecord("unusable", tpl, {"type": type(self).__name__})
 
     def to_struct(self, value):
         """Cast value to Python structure."""
@@ -120,9 +171,11 @@ class BaseField:
 
         for validator in self.validators:
             try:
-                validator.validate(value)
+                result = validator.validate(value)
             except AttributeError:
-                validator(value)
+                result = validator(value)
+            if result is not None:
+                aio.defer(result)
 
     def get_default_value(self):
         """Get default value for field.
@@ -193,22 +246,41 @@ class DictField(BaseField):
 
     types = (dict,)
 
+    def to_struct(self, value):
+        return thaw(value)
+
 
 class ListField(BaseField):
     """List field."""
 
     types = (list,)
 
-    def __init__(self, items_types=None, item_validators=(), *args, **kwargs):
+    def __init__(
+        self,
+        items_types=None,
+        item_validators=(),
+        *args,
+        discriminator=None,
+        index_on=(),
+        **kwargs,
+    ):
         """Init.
 
         `ListField` is **always not required**. If you want to control number
         of items use validators. If you want to validate each individual item,
         use `item_validators`.
 
+        :param str discriminator: Structure name of field, which value decides
+            which of `items_types` to choose for item (see `EmbeddedField`).
+        :param index_on: Names of fields of items, by which items can be looked
+            up in `ModelCollection` (see `ModelCollection.get_by`).
+
         """
         self._assign_types(items_types)
         self.item_validators = item_validators
+        self.discriminator = discriminator
+        self.index_on = tuple(index_on)
+        self._discriminator_lookup = None
         super().__init__(*args, **kwargs)
         self.required = False
 
@@ -238,26 +310,89 @@ class ListField(BaseField):
     def validate(self, value):
         super().validate(value)
 
-        for item in value:
-            self.validate_single_value(item)
+        start = self._get_validated_count(value)
+        deferred = aio.count()
+        self.validate_items(value[start:] if start else value)
+        if isinstance(value, ModelCollection) and value.field is self:
+            # Items checked by asynchronous validators aren't known to be valid.
+            if aio.count() == deferred:
+                value._validated = len(value)
+
+    def iter_errors(self, value, path=()):
+        yield from super().iter_errors(value, path)
+        if not isinstance(value, list):
+            return
+
+        for index in range(self._get_validated_count(value), len(value)):
+            yield from self.iter_single_value_errors(value[index], path + (index,))
+
+    def _get_validated_count(self, value):
+        if isinstance(value, ModelCollection) and value.field is self:
+            return value._validated
+        return 0
+
+    def validate_items(self, values):
+        """Validate many items at once.
+
+        Types of all the items are checked first, then each of item validators
+        is run over all the items (validators with `validate_all` method, like
+        `Min` and `Max`, check them in one call). If any of items is invalid,
+        items are checked again one by one, so that error of the first one is
+        raised.
+
+        """
+        try:
+            if self.items_types:
+                types = self.items_types
+                for value in values:
+                    if not isinstance(value, types):
+                        raise ValidationError(self._get_item_type_error(value).message)
+
+            _validate_all(self.item_validators, values)
+        except ValidationError:
+            for value in values:
+                self.validate_single_value(value)
+            raise
 
     def validate_single_value(self, value):
+        error = self._get_item_type_error(value)
+        if error is not None:
+            raise ValidationError(error.message)
+
         for validator in self.item_validators:
             try:
-                validator.validate(value)
+                result = validator.validate(value)
             except AttributeError:  # Case when validator is simple function.
-                validator(value)
+                result = validator(value)
+            if result is not None:
+                aio.defer(result)
 
-        if len(self.items_types) == 0:
+    def iter_single_value_errors(self, value, path=()):
+        """Iterate over errors of single item, without raising them.
+
+        Validators aren't run for item of wrong type (like in
+        `validate_single_value`).
+
+        """
+        error = self._get_item_type_error(value)
+        if error is not None:
+            error.path = path
+            yield error
             return
 
+        yield from _iter_validators_errors(self.item_validators, value, path)
+
+    def _get_item_type_error(self, value):
+        if len(self.items_types) == 0:
+            return None
+
         if not isinstance(value, self.items_types):
-            raise ValidationError(
-                'All items must be instances of "{types}", and not "{type}".'.format(
-                    types=", ".join([t.__name__ for t in self.items_types]),
-                    type=type(value).__name__,
-                )
-            )
+            tpl = 'All items must be instances of "{types}", and not "{type}".'
+            params = {
+                "types": ", ".join([t.__name__ for t in self.items_types]),
+                "type": type(value).__name__,
+            }
+            return ErrorRecord("item_type", tpl, params)
 
     def parse_value(self, values):
         """Cast value to proper collection."""
@@ -269,18 +404,24 @@ class ListField(BaseField):
         if not isinstance(values, list):
             return values
 
-        return [self._cast_value(value) for value in values]
+        values = [self._cast_value(value) for value in values]
+        if not isinstance(result, ModelCollection):
+            return values
+        result._load(values)
+        return result
 
     def _cast_value(self, value):
         if isinstance(value, self.items_types):
             return value
+        elif self.discriminator is not None and isinstance(value, dict):
+            return interning.create(self._discriminator_lookup.get_type(value), value)
         else:
             if len(self.items_types) != 1:
                 tpl = 'Cannot decide which type to choose from "{types}".'
                 raise ValidationError(
                     tpl.format(types=", ".join([t.__name__ for t in self.items_types]))
                 )
-            return self.items_types[0](**value)
+            return interning.create(self.items_types[0], value)
 
     def _finish_initialization(self, owner):
         super()._finish_initialization(owner)
@@ -288,26 +429,137 @@ class ListField(BaseField):
         types = []
         for type_ in self.items_types:
             if isinstance(type_, _LazyType):
-                types.append(type_.evaluate(owner))
-            else:
-                types.append(type_)
+                type_ = type_.evaluate(owner)
+                _check_frozen_type(owner, type_)
+            types.append(type_)
         self.items_types = tuple(types)
 
+        if self.discriminator is not None and self._discriminator_lookup is None:
+            self._discriminator_lookup = _DiscriminatorLookup(
+                self.discriminator, self.items_types
+            )
+
     def _elem_to_struct(self, value):
         try:
-            return value.to_struct()
+            struct = value.to_struct()
         except AttributeError:
             return value
+        if self._discriminator_lookup is not None:
+            self._discriminator_lookup.mark(value, struct)
+        return struct
 
     def to_struct(self, values):
         return [self._elem_to_struct(v) for v in values]
 
 
+class NumericArrayField(BaseField):
+    """Field of numbers stored in compact array (`array.array`).
+
+    Numbers are kept in one buffer instead of list of Python objects. Item
+    validators with `validate_all` method (like `Min` and `Max`) check all the
+    numbers in one pass (with NumPy, if it is installed).
+
+    """
+
+    types = (array.array,)
+
+    DTYPES = {
+        "f8": "d",
+        "f4": "f",
+        "i8": "q",
+        "i4": "i",
+        "i2": "h",
+        "i1": "b",
+        "u8": "Q",
+        "u4": "I",
+        "u2": "H",
+        "u1": "B",
+    }
+
+    def __init__(self, dtype="f8", item_validators=(), *args, **kwargs):
+        """Init.
+
+        :param str dtype: Type of numbers, like ``"f8"`` (float) or ``"i4"``
+            (4 byte integer), see `DTYPES`. Type codes of `array` module are
+            accepted too.
+        :param item_validators: Validators of each of numbers.
+
+        """
+        try:
+            self.typecode = self.DTYPES.get(dtype) or array.array(dtype).typecode
+        except (TypeError, ValueError):
+            raise ValueError("Unknown type of numbers", dtype)
+        self.dtype = dtype
+        self.item_validators = item_validators
+        if kwargs.get("default") is not None:
+            kwargs["default"] = self.parse_value(kwargs["default"])
+        super().__init__(*args, **kwargs)
+
+    def get_default_value(self):
+        default = super().get_default_value()
+        # Each instance gets its own copy, since arrays are mutable.
+        return array.array(self.typecode, default) if default is not None else None
+
+    def parse_value(self, value):
+        """Cast sequence of numbers (e.g. list or NumPy array) to array."""
+        if isinstance(value, array.array) and value.typecode == self.typecode:
+            return value
+        if hasattr(value, "tolist") and not isinstance(value, array.array):
+            value = value.tolist()
+        if not isinstance(value, (list, tuple, array.array)):
+            return value
+
+        try:
+            return array.array(self.typecode, value)
+        except OverflowError as error:
+            raise ValueError(f"Value can't be stored as '{self.dtype}': {error}")
+
+    def validate(self, value):
+        super().validate(value)
+        if value is None:
+            return
+
+        try:
+            _validate_all(self.item_validators, value)
+        except ValidationError:
+            # Error of the first invalid number is raised.
+            for item in value:
+                _validate_all(self.item_validators, (item,))
+            raise
+
+    def iter_errors(self, value, path=()):
+        yield from super().iter_errors(value, path)
+        if not isinstance(value, array.array):
+            return
+
+        try:
+            _validate_all(self.item_validators, value)
+        except ValidationError:
+            # Find all invalid numbers, with their indexes.
+            for index, item in enumerate(value):
+                yield from _iter_validators_errors(
+                    self.item_validators, item, path + (index,)
+                )
+
+    def to_struct(self, value):
+        """Cast array to list."""
+        return value.tolist()
+
+
 class EmbeddedField(BaseField):
     """Field for embedded models."""
 
-    def __init__(self, model_types, *args, **kwargs):
+    def __init__(self, model_types, *args, discriminator=None, **kwargs):
+        """Init.
+
+        :param str discriminator: Structure name of field, which value decides
+            which of `model_types` to choose when parsing dict. Each of models
+            must have field with such name and unique default value.
+
+        """
         self._assign_model_types(model_types)
+        self.discriminator = discriminator
+        self._discriminator_lookup = None
         super().__init__(*args, **kwargs)
 
     def _assign_model_types(self, model_types):
@@ -328,11 +580,16 @@ class EmbeddedField(BaseField):
         types = []
         for type_ in self.types:
             if isinstance(type_, _LazyType):
-                types.append(type_.evaluate(owner))
-            else:
-                types.append(type_)
+                type_ = type_.evaluate(owner)
+                _check_frozen_type(owner, type_)
+            types.append(type_)
         self.types = tuple(types)
 
+        if self.discriminator is not None and self._discriminator_lookup is None:
+            self._discriminator_lookup = _DiscriminatorLookup(
+                self.discriminator, self.types
+            )
+
     def validate(self, value):
         super().validate(value)
         try:
@@ -340,15 +597,27 @@ class EmbeddedField(BaseField):
         except AttributeError:
             pass
 
+    def iter_errors(self, value, path=()):
+        valid = True
+        for error in super().iter_errors(value, path):
+            valid = False
+            yield error
+
+        iter_errors = getattr(value, "iter_errors", None)
+        if valid and iter_errors is not None:
+            yield from iter_errors(path)
+
     def parse_value(self, value):
         """Parse value to proper model type."""
         if not isinstance(value, dict):
             return value
 
-        embed_type = self._get_embed_type()
-        return embed_type(**value)
+        embed_type = self._get_embed_type(value)
+        return interning.create(embed_type, value)
 
-    def _get_embed_type(self):
+    def _get_embed_type(self, value=None):
+        if self._discriminator_lookup is not None and value is not None:
+            return self._discriminator_lookup.get_type(value)
         if len(self.types) != 1:
             raise ValidationError(
                 'Cannot decide which type to choose from "{types}".'.format(
@@ -358,7 +627,132 @@ class EmbeddedField(BaseField):
         return self.types[0]
 
     def to_struct(self, value):
-        return value.to_struct()
+        struct = value.to_struct()
+        if self._discriminator_lookup is not None:
+            self._discriminator_lookup.mark(value, struct)
+        return struct
+
+
+class _DiscriminatorLookup:
+    """Lookup of model types by values of discriminator field."""
+
+    def __init__(self, name, types):
+        self.name = name
+        self.types = {}
+        self.values = {}
+        for type_ in types:
+            value = _get_discriminator_value(type_, name)
+            if value in self.types:
+                raise ValueError("Discriminator value taken", name, value)
+            self.types[value] = type_
+            self.values[type_] = value
+
+    def get_type(self, struct):
+        """Get type for given structure."""
+        try:
+            return self.types[struct[self.name]]
+        except (KeyError, TypeError):
+            raise ValidationError(
+                'Cannot decide which type to choose by "{name}" of "{value}".'.format(
+                    name=self.name, value=struct.get(self.name)
+                )
+            )
+
+    def mark(self, value, struct):
+        """Put value of discriminator in structure of given model instance."""
+        try:
+            struct[self.name] = self.values[type(value)]
+        except KeyError:
+            pass
+
+
+def _get_discriminator_value(model, name):
+    field = _find_field_statically(model, name)
+    if field is None or not field.has_default:
+        raise ValueError(
+            f"Model '{model.__name__}' must have field '{name}' with default value."
+        )
+    return field.get_default_value()
+
+
+def _find_field_statically(model, structure_name):
+    # Getting fields from model would finish initialization of (possibly
+    # the very same) field again.
+    names = set()
+    for type_ in model.__mro__:
+        for name, attr in vars(type_).items():
+            if name in names:
+                continue
+            names.add(name)
+            if not isinstance(attr, BaseField):
+                continue
+            if attr.structure_name(name) == structure_name:
+                return attr
+    return None
+
+
+def _validate_all(validators, values):
+    for validator in validators:
+        validate_all = getattr(validator, "validate_all", None)
+        if validate_all is not None:
+            aio.defer(validate_all(values))
+            continue
+
+        validate = getattr(validator, "validate", validator)
+        for value in values:
+            result = validate(value)
+            if result is not None:
+                aio.defer(result)
+
+
+def _iter_validators_errors(validators, value, path):
+    for validator in validators:
+        check = getattr(validator, "check", None)
+        if check is not None:
+            error = check(value)
+        else:
+            error = _get_validator_error(validator, value)
+
+        if error is not None:
+            error.path = path
+            yield error
+
+
+def _get_validator_error(validator, value):
+    try:
+        try:
+            result = validator.validate(value)
+        except AttributeError:  # Case when validator is simple function.
+            result = validator(value)
+        aio.defer(result)  # Asynchronous validators are skipped here.
+    except ValidationError as error:
+        return ErrorRecord("invalid", "{error}", {"error": error})
+
+
+def check_frozen_embedding(owner, field):
+    """Check that field of frozen model embeds only frozen models.
+
+    Types given by name are checked, when they are evaluated.
+
+    :raises TypeError: If some of models isn't frozen.
+
+    """
+    if isinstance(field, ListField):
+        types = field.items_types
+    elif isinstance(field, EmbeddedField):
+        types = field.types
+    else:
+        return
+    for type_ in types:
+        _check_frozen_type(owner, type_)
+
+
+def _check_frozen_type(owner, type_):
+    if getattr(owner, "_frozen", False) and getattr(type_, "_frozen", True) is False:
+        raise TypeError(
+            f"Frozen model '{owner.__name__}' can't embed '{type_.__name__}', "
+            "which isn't frozen."
+        )
 
 
 class _LazyType:
@@ -0,0 +1,185 @@
+"""Sharing of instances of identical frozen models.
+
+Embedded models, which are parsed from structures, can be interned: instead of
+keeping many equal instances, all of them are replaced with the first one.
+Instances are shared for equal (``==``) structures, so model isn't even created
+again for structure, which was seen before.
+
+Interning can be turned on for model globally (with `intern_globally`), or
+only inside given scope (with `scope`), e.g. for time of one bulk load.
+
+"""
+
+import contextvars
+import sys
+import weakref
+from collections import OrderedDict
+from contextlib import contextmanager
+
+_scoped_tables = contextvars.ContextVar("jsonmodels_intern_tables", default=None)
+
+
+class InternTable:
+    """Table of shared instances of frozen models.
+
+    :param int maxsize: Maximal number of kept instances. When exceeded, least
+        recently used instances are dropped from the table. No limit if `None`.
+
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._instances = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+
+    def __len__(self):
+        return len(self._instances)
+
+    def __iter__(self):
+        """Iterate over shared instances, from least recently used."""
+        for instance, _ in self._instances.values():
+            yield instance
+
+    def intern(self, instance):
+        """Get shared instance equal to given one.
+
+        If there is no such instance yet, the given one becomes shared.
+
+        """
+        return self._get_shared(instance, lambda: instance)
+
+    def create(self, model, values):
+        """Get shared instance of model for structure (create it if needed).
+
+        Structures with unhashable values (like sets) aren't interned.
+
+        """
+        try:
+            key = _freeze(values)
+        except TypeError:
+            return model(**values)
+        return self._get_shared(key, lambda: model(**values))
+
+    def _get_shared(self, key, create):
+        try:
+            shared, size = self._instances[key]
+        except KeyError:
+            instance = create()
+            self.misses += 1
+            self._instances[key] = (instance, _get_size(instance))
+            if self.maxsize is not None and len(self._instances) > self.maxsize:
+                self._instances.popitem(last=False)
+            return instance
+
+        self.hits += 1
+        self.saved_bytes += size
+        self._instances.move_to_end(key)
+        return shared
+
+    @property
+    def hit_rate(self):
+        """Part of interned instances, which were replaced with shared ones."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self):
+        """Drop all instances and reset counters."""
+        self._instances.clear()
+        self.hits = self.misses = self.saved_bytes = 0
+
+
+def intern_globally(model, maxsize=None):
+    """Intern instances of model everywhere, where they are parsed.
+
+    :param model: Frozen model class.
+    :param int maxsize: See `InternTable`.
+    :rtype: `InternTable`
+
+    """
+    _check_frozen(model)
+    table = InternTable(maxsize)
+    type.__setattr__(model, "_intern_table", table)
+    return table
+
+
+def stop_interning(model):
+    """Stop interning instances of model globally."""
+    if "_intern_table" in model.__dict__:
+        type.__delattr__(model, "_intern_table")
+
+
+@contextmanager
+def scope(*models, maxsize=None):
+    """Intern instances of models only within `with` block.
+
+    Tables are given as dict, keyed by model::
+
+        with interning.scope(Address) as tables:
+            orders = [Order(**data) for data in documents]
+        print(tables[Address].hit_rate)
+
+    """
+    for model in models:
+        _check_frozen(model)
+
+    tables = dict(_scoped_tables.get() or {})
+    new_tables = {model: InternTable(maxsize) for model in models}
+    tables.update(new_tables)
+    token = _scoped_tables.set(tables)
+    try:
+        yield new_tables
+    finally:
+        _scoped_tables.reset(token)
+
+
+def create(model, values):
+    """Create instance of model from structure, interning it if needed."""
+    table = get_table(model)
+    if table is None:
+        return model(**values)
+    return table.create(model, values)
+
+
+def get_table(model):
+    """Get table used currently for model (or `None`)."""
+    tables = _scoped_tables.get()
+    if tables and model in tables:
+        return tables[model]
+    return model.__dict__.get("_intern_table")
+
+
+def _check_frozen(model):
+    if not getattr(model, "_frozen", False):
+        raise TypeError(f"Only frozen models can be interned, not '{model.__name__}'.")
+
+
+def _freeze(value):
+    """Get hashable key of structure (equal only for equal structures)."""
+    if isinstance(value, dict):
+        return dict, frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return list, tuple(_freeze(item) for item in value)
+    hash(value)
+    # Type is part of key, since e.g. 1, 1.0 and True are equal.
+    return type(value), value
+
+
+def _get_size(instance):
+    """Estimate memory, which is freed when instance is replaced.
+
+    Values of fields aren't counted, since they are often shared with parsed
+    structure anyway.
+
+    """
+    fields = len(instance._get_fields_index().fields)
+    return (
+        sys.getsizeof(instance)
+        + sys.getsizeof(instance.__dict__)
+        + sys.getsizeof(instance._cache_key)
+        + fields * _WEAKREF_SIZE
+    )
+
+
+_WEAKREF_SIZE = sys.getsizeof(weakref.ref(InternTable))
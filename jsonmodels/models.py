@@ -1,12 +1,38 @@
-from . import errors, parsers
+import array
+import copy
+import datetime
+import json
+
+from . import accessors, aio, batches, errors, parsers, patches, plans, rawjson
+from .collections import ModelCollection, freeze
 from .errors import ValidationError
-from .fields import BaseField
+from .fields import BaseField, check_frozen_embedding
 
 
 class JsonmodelMeta(type):
-    def __new__(cls, name, bases, attributes):
+    def __new__(cls, name, bases, attributes, **kwargs):
         cls.validate_fields(attributes)
-        return super(cls, cls).__new__(cls, name, bases, attributes)
+        return super(cls, cls).__new__(cls, name, bases, attributes, **kwargs)
+
+    def __setattr__(cls, name, value):
+        replaced = any(
+            isinstance(klass.__dict__.get(name), BaseField) for klass in cls.__mro__
+        )
+        super().__setattr__(name, value)
+        if replaced or isinstance(value, BaseField):
+            cls._forget_fields_index()
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        cls._forget_fields_index()
+
+    def _forget_fields_index(cls):
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            if "_fields_index" in klass.__dict__:
+                type.__delattr__(klass, "_fields_index")
+            classes.extend(klass.__subclasses__())
 
     @staticmethod
     def validate_fields(attributes):
@@ -24,33 +50,117 @@ class JsonmodelMeta(type):
 
 
 class Base(metaclass=JsonmodelMeta):
-    """Base class for all models."""
+    """Base class for all models.
+
+    Models created with ``frozen=True`` class keyword (like
+    ``class Point(Base, frozen=True)``) can't be changed after initialization
+    and are hashable. They can embed only frozen models.
+
+    """
+
+    _frozen = False
+
+    def __init_subclass__(cls, frozen=None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if frozen is not None:
+            cls._frozen = frozen
+        if cls._frozen:
+            for klass in cls.__mro__:
+                for field in vars(klass).values():
+                    check_frozen_embedding(cls, field)
+        if cls._frozen and cls.__dict__.get("__hash__", None) is None:
+            cls.__hash__ = Base._get_hash
+        elif not cls._frozen and cls.__hash__ is Base._get_hash:
+            cls.__hash__ = None
 
     def __init__(self, **kwargs):
         self._cache_key = _CacheKey()
         self.populate(**kwargs)
+        if self._frozen:
+            # Presence of hash (even not computed yet) marks frozen instance.
+            self._frozen_hash = None
 
     def populate(self, **values):
         """Populate values to fields. Skip non-existing."""
-        values = values.copy()
-        fields = list(self.iterate_with_name())
-        for _, structure_name, field in fields:
-            if structure_name in values:
-                self.set_field(field, structure_name, values.pop(structure_name))
-        for name, _, field in fields:
-            if name in values:
-                self.set_field(field, name, values.pop(name))
+        keys = self._get_fields_index().keys
+        found = sorted((keys[key], key) for key in values if key in keys)
+        for (_, field), key in found:
+            self.set_field(field, key, values[key])
 
     def get_field(self, field_name):
         """Get field associated with given attribute."""
-        for attr_name, field in self:
-            if field_name == attr_name:
-                return field
+        try:
+            return self._get_fields_index().by_name[field_name]
+        except KeyError:
+            raise errors.FieldNotFound("Field not found", field_name)
+
+    def copy(self, deep=False, update=None):
+        """Copy model, without validating values again.
+
+        :param bool deep: Copy also embedded models and lists (recursively),
+            instead of sharing them with copied model. Frozen models are
+            always shared.
+        :param dict update: Values to assign in copy, like in `populate`. Only
+            these are validated.
+
+        """
+        return self._copy(deep, update, {})
+
+    def _copy(self, deep, update, memo):
+        cls = type(self)
+        clone = memo[id(self)] = cls.__new__(cls)
+        clone.__dict__.update(self.__dict__)
+        clone.__dict__.pop("_frozen_hash", None)
+        if "_raw_values" in self.__dict__:
+            clone.__dict__["_raw_values"] = self._raw_values.copy()
+        clone._cache_key = _CacheKey()
+        for _, _, field in self.iterate_with_name():
+            try:
+                value = field.memory[self._cache_key]
+            except KeyError:
+                continue
+            value = _copy_value(value, memo) if deep else value
+            field.memory[clone._cache_key] = value
+
+        if update:
+            clone.populate(**update)
+        if self._frozen:
+            clone._freeze_values()
+            clone._frozen_hash = None
+        return clone
 
-        raise errors.FieldNotFound("Field not found", field_name)
+    def diff(self, other):
+        """Get JSON Patch (RFC 6902), which changes this model into `other`.
+
+        See `jsonmodels.patches.diff`.
+
+        """
+        return patches.diff(self, other)
+
+    def apply_patch(self, operations):
+        """Apply JSON Patch (RFC 6902), with paths made of structure names.
+
+        Only changed values (and fields on the way to them) are validated.
+        Model is left untouched if any of operations fails.
+
+        See `jsonmodels.patches.apply_patch`.
+
+        """
+        patches.apply_patch(self, operations)
+
+    def merge_patch(self, document):
+        """Apply JSON Merge Patch (RFC 7386), like `apply_patch` does."""
+        patches.merge_patch(self, document)
+
+    def __copy__(self):
+        return self.copy()
+
+    def __deepcopy__(self, memo):
+        return self._copy(True, None, memo)
 
     def set_field(self, field, field_name, value):
         """Sets the value of a field."""
+        self._check_not_frozen()
         try:
             field.__set__(self, value)
         except ValidationError as error:
@@ -62,7 +172,9 @@ class Base(metaclass=JsonmodelMeta):
 
     def validate(self):
         """Explicitly validate all the fields."""
+        pending = aio.get_pending()
         for name, field in self:
+            start = 0 if pending is None else len(pending)
             try:
                 field.validate_for_object(self)
             except ValidationError as error:
@@ -70,14 +182,169 @@ class Base(metaclass=JsonmodelMeta):
                     f"Error for field '{name}'.",
                     error,
                 )
+            if pending is not None:
+                pending.wrap(start, name)
+
+    async def avalidate(self, concurrency=10):
+        """Validate all the fields, also with asynchronous validators.
+
+        Validators can be coroutine functions (or have `validate` method,
+        which is coroutine function). Synchronous validators are run like in
+        `validate` (and their errors are raised right away), then asynchronous
+        ones (of all the fields, embedded models and items of lists) are
+        awaited concurrently.
+
+        :param int concurrency: Maximal number of asynchronous validators
+            awaited at once (`None` for no limit).
+
+        Note, that `validate` (and assignment of values) skip asynchronous
+        validators.
+
+        """
+        await aio.validate(self, concurrency)
+
+    def iter_errors(self, path=()):
+        """Iterate over errors of all the fields, without raising them.
+
+        :param tuple path: Path to model, errors get paths relative to it.
+        :rtype: Iterator of `jsonmodels.errors.ErrorRecord`.
+
+        """
+        raw_values = self.__dict__.get("_raw_values", {})
+        for _, structure_name, field in self.iterate_with_name():
+            field_path = path + (structure_name,)
+            if field in raw_values and self._cache_key not in field.memory:
+                key, value = raw_values[field]
+                plan = plans.get_plan(type(self))
+                yield from plan.iter_value_errors(key, value, field_path)
+            else:
+                yield from field.iter_errors_for_object(self, field_path)
+
+    @classmethod
+    def from_struct(cls, data, only=None, keep_raw=True):
+        """Create model from structure, parsing only selected values.
+
+        :param dict data: Structure, like for `populate`.
+        :param only: Names (attribute or structure ones) of fields to parse.
+            All of them are parsed if `None`.
+        :param bool keep_raw: Keep values of other fields as they are, to parse
+            them on first access. Otherwise they are dropped.
+
+        Values kept raw are parsed and validated when they are accessed for the
+        first time (and errors are raised then). Since `validate` and
+        `to_struct` access all of them, for these the model behaves like if it
+        was created from whole structure. `iter_errors` checks raw values
+        without parsing them.
+
+        """
+        if only is None:
+            return cls(**data)
+
+        selected = _select_fields(cls, only)
+        keys = cls._get_fields_index().keys
+        values = {}
+        raw_values = []
+        for key, value in data.items():
+            found = keys.get(key)
+            if found is None:
+                continue
+            if found[1] in selected:
+                values[key] = value
+            elif keep_raw:
+                raw_values.append((found, key, value))
+
+        model = cls(**values)
+        if raw_values:
+            raw_values.sort(key=lambda item: item[0][0])
+            model.__dict__["_raw_values"] = {
+                field: (key, value) for (_, field), key, value in raw_values
+            }
+        return model
+
+    @classmethod
+    def from_json(cls, data, lazy=False):
+        """Create model from JSON document.
+
+        :param data: JSON document (``bytes`` or ``str``) with object.
+        :param bool lazy: Don't decode document up front. It is decoded when
+            first field is accessed and values are parsed only when their
+            fields are accessed for the first time, like values kept raw by
+            `from_struct`.
+
+        For few fields read from large document (especially with embedded
+        models), lazy model is much faster. `validate` and `to_struct` access
+        all the fields, so they parse all the values.
+
+        """
+        if not lazy:
+            return cls(**json.loads(data))
+        model = cls()
+        spans = rawjson.JSONSpans(data)
+        model.__dict__["_raw_values"] = rawjson.RawValues(cls, spans)
+        return model
+
+    def _load_raw_value(self, field):
+        key, value = self._raw_values[field]
+        try:
+            field.__set__(self, value)
+        except ValidationError as error:
+            raise ValidationError(f"Error for field '{key}': {error}.")
+        del self._raw_values[field]
+
+    @classmethod
+    def validate_struct(cls, data):
+        """Validate raw structure without creating model instances.
+
+        Outcome is the same as of `cls(**data).validate()`. Note, that values
+        of embedded models are still instantiated for fields with validators,
+        since validators expect to get instances.
+
+        """
+        plans.get_plan(cls).validate(data)
+
+    @classmethod
+    def check_struct(cls, data):
+        """Check raw structure, like `validate_struct`, but without raising.
+
+        Values which can't be parsed (e.g. `'abc'` for `IntField`) are also
+        reported instead of raising.
+
+        :rtype: ``list`` of `jsonmodels.errors.ErrorRecord`
+
+        """
+        return list(plans.get_plan(cls).iter_errors(data))
+
+    @classmethod
+    def accessor(cls, path):
+        """Get compiled getter (and setter) of value nested in model.
+
+        :param str path: Path like ``"lines[].product.sku"``, see
+            `jsonmodels.accessors.Accessor`.
+        :rtype: `jsonmodels.accessors.Accessor`
+
+        """
+        return accessors.get_accessor(cls, path)
+
+    @classmethod
+    def batch_from_structs(cls, records, validate=True):
+        """Parse many structures into columnar batch.
+
+        Values of each field are stored in one column (numbers in arrays), so
+        batch takes much less memory than instances of model. Columns are
+        validated in bulk.
+
+        :param records: Iterable of ``dict``, like for `populate`.
+        :param bool validate: Validate all the columns.
+        :rtype: `jsonmodels.batches.ModelBatch`
+
+        """
+        return batches.ModelBatch.from_structs(cls, records, validate)
 
     @classmethod
     def iterate_over_fields(cls):
         """Iterate through fields as `(attribute_name, field_instance)`."""
-        for attr in dir(cls):
-            clsattr = getattr(cls, attr)
-            if isinstance(clsattr, BaseField):
-                yield attr, clsattr
+        for attr_name, _, field in cls._get_fields_index().fields:
+            yield attr_name, field
 
     @classmethod
     def iterate_with_name(cls):
@@ -87,13 +354,59 @@ class Base(metaclass=JsonmodelMeta):
         Structure name is name under which value is seen in structure and
         schema (in primitives) and only there.
         """
-        for attr_name, field in cls.iterate_over_fields():
-            structure_name = field.structure_name(attr_name)
-            yield attr_name, structure_name, field
+        return iter(cls._get_fields_index().fields)
+
+    @classmethod
+    def _get_fields_index(cls):
+        try:
+            return cls.__dict__["_fields_index"]
+        except KeyError:
+            index = _FieldsIndex(cls)
+            type.__setattr__(cls, "_fields_index", index)
+            return index
+
+    def to_struct(self, include=None, exclude=None):
+        """Cast model to Python structure.
+
+        :param include: Paths of values to include, like
+            ``{"name", "address.city", "items[].id"}`` (all by default).
+        :param exclude: Paths of values to exclude.
+
+        Only included values are validated.
+
+        """
+        return parsers.to_struct(self, include, exclude)
 
-    def to_struct(self):
-        """Cast model to Python structure."""
-        return parsers.to_struct(self)
+    async def ato_struct(
+        self, chunk_size=1000, interval=0.01, executor=None, threshold=100000
+    ):
+        """Cast model to Python structure, without blocking event loop.
+
+        Items of lists are cast in slices and control is given back to event
+        loop after every `chunk_size` items or every `interval` seconds.
+
+        :param executor: Executor of thread pool, to call `to_struct` in, if
+            lists have at least `threshold` items together.
+
+        """
+        return await parsers.ato_struct(self, chunk_size, interval, executor, threshold)
+
+    @classmethod
+    async def afrom_struct(
+        cls, data, chunk_size=1000, interval=0.01, executor=None, threshold=100000
+    ):
+        """Create model from structure, without blocking event loop.
+
+        Long lists are parsed and validated in slices, like `ato_struct` casts
+        them.
+
+        :param executor: Executor of thread pool, to create model in, if lists
+            have at least `threshold` items together.
+
+        """
+        return await parsers.afrom_struct(
+            cls, data, chunk_size, interval, executor, threshold
+        )
 
     @classmethod
     def to_json_schema(cls):
@@ -116,34 +429,174 @@ class Base(metaclass=JsonmodelMeta):
         return f"{self.__class__.__name__} object"
 
     def __setattr__(self, name, value):
+        self._check_not_frozen()
         try:
             return super().__setattr__(name, value)
         except ValidationError as error:
             raise ValidationError(f"Error for field '{name}'.", error)
 
+    def _freeze_values(self):
+        """Make values (set without `set_field`) of frozen instance read-only."""
+        for _, _, field in self.iterate_with_name():
+            try:
+                value = field.memory[self._cache_key]
+            except KeyError:
+                continue
+            field.memory[self._cache_key] = freeze(value)
+
+    def _check_not_frozen(self):
+        if self._frozen and "_frozen_hash" in self.__dict__:
+            raise errors.FrozenModelError(
+                f"Instance of '{type(self).__name__}' is frozen."
+            )
+
     def __eq__(self, other):
         if type(other) is not type(self):
             return False
+        if self is other:
+            return True
 
-        for name, _ in self.iterate_over_fields():
-            try:
-                our = getattr(self, name)
-            except errors.ValidationError:
-                our = None
-
-            try:
-                their = getattr(other, name)
-            except errors.ValidationError:
-                their = None
+        if self._frozen:
+            our_hash = self.__dict__.get("_frozen_hash")
+            their_hash = other.__dict__.get("_frozen_hash")
+            if None not in (our_hash, their_hash) and our_hash != their_hash:
+                return False
 
-            if our != their:
+        for _, _, field in self.iterate_with_name():
+            if _get_value(self, field) != _get_value(other, field):
                 return False
 
         return True
 
+    def _get_hash(self):
+        if self.__dict__.get("_frozen_hash") is None:
+            values = [
+                _freeze(_get_value(self, field))
+                for _, _, field in self.iterate_with_name()
+            ]
+            self.__dict__["_frozen_hash"] = hash((type(self), tuple(values)))
+        return self.__dict__["_frozen_hash"]
+
     def __ne__(self, other):
         return not (self == other)
 
 
+def _get_value(model, field):
+    try:
+        return field.__get__(model)
+    except ValidationError:
+        return None
+
+
+def _select_fields(cls, only):
+    """Get set of fields of model with given names."""
+    index = cls._get_fields_index()
+    key = ("only", frozenset(only))
+    try:
+        return index.compiled[key]
+    except KeyError:
+        pass
+
+    selected = set()
+    for name in key[1]:
+        if name in index.by_name:
+            selected.add(index.by_name[name])
+        elif name in index.by_structure_name:
+            selected.add(index.by_structure_name[name][1])
+        else:
+            raise errors.FieldNotFound("Field not found", name)
+    selected = index.compiled[key] = frozenset(selected)
+    return selected
+
+
+_IMMUTABLE_TYPES = (
+    str,
+    int,
+    float,
+    bool,
+    type(None),
+    datetime.date,
+    datetime.time,
+    datetime.datetime,
+)
+
+
+def _copy_value(value, memo):
+    """Copy value of field (for deep copy of model).
+
+    Values shared by many fields (or models) are copied once, with `memo` like
+    in `copy.deepcopy`.
+
+    """
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return value
+    if id(value) in memo:
+        return memo[id(value)]
+    if isinstance(value, Base):
+        return value if value._frozen else value._copy(True, None, memo)
+    if isinstance(value, ModelCollection):
+        collection = memo[id(value)] = ModelCollection(value.field)
+        collection._load([_copy_value(item, memo) for item in value])
+        collection._validated = value._validated
+        return collection
+    if isinstance(value, list):
+        items = memo[id(value)] = []
+        items.extend(_copy_value(item, memo) for item in value)
+        return items
+    if isinstance(value, dict):
+        items = memo[id(value)] = {}
+        items.update((key, _copy_value(item, memo)) for key, item in value.items())
+        return items
+    return copy.deepcopy(value, memo)
+
+
+def _freeze(value):
+    """Get hashable equivalent of value of field."""
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, array.array):
+        return tuple(value)
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    return value
+
+
 class _CacheKey:
     """Object to identify model in memory."""
+
+
+class _FieldsIndex:
+    """Lookups of fields of model class, computed once per class.
+
+    It is computed on first use (and not with class), since types of fields
+    can be lazy loaded.
+
+    """
+
+    def __init__(self, cls):
+        self.fields = []
+        for attr in dir(cls):
+            clsattr = getattr(cls, attr)
+            if isinstance(clsattr, BaseField):
+                structure_name = clsattr.structure_name(attr)
+                self.fields.append((attr, structure_name, clsattr))
+
+        self.by_name = {name: field for name, _, field in self.fields}
+        self.by_structure_name = {
+            structure_name: (name, field) for name, structure_name, field in self.fields
+        }
+        self.structure_names = {
+            name: structure_name for name, structure_name, _ in self.fields
+        }
+
+        # Keys of structures, which are mapped to fields like `Base.populate`
+        # does: first by structure names and then by (not taken) attribute
+        # names. Position tells the order of assignments.
+        self.keys = {}
+        for position, (_, structure_name, field) in enumerate(self.fields):
+            self.keys[structure_name] = (position, field)
+        for position, (name, _, field) in enumerate(self.fields, len(self.fields)):
+            self.keys.setdefault(name, (position, field))
+
+        # Place for other things compiled from fields (like plans).
+        self.compiled = {}
@@ -1,17 +1,28 @@
 """Parsers to change model structure into different ones."""
 
+import asyncio
+import concurrent.futures
+import functools
 import inspect
+import time
 
-from . import builders, errors, fields
+from . import builders, errors, fields, plans
+from .collections import ModelCollection
 
 
-def to_struct(model):
+def to_struct(model, include=None, exclude=None):
     """Cast instance of model to python structure.
 
     :param model: Model to be casted.
+    :param include: Paths of values to include, see
+        `jsonmodels.plans.ProjectionPlan`.
+    :param exclude: Paths of values to exclude.
     :rtype: ``dict``
 
     """
+    if include is not None or exclude:
+        return plans.get_projection(type(model), include, exclude).to_struct(model)
+
     model.validate()
 
     resp = {}
@@ -25,6 +36,147 @@ def to_struct(model):
     return resp
 
 
+async def ato_struct(
+    model, chunk_size=1000, interval=0.01, executor=None, threshold=100000
+):
+    """Cast instance of model to python structure, without blocking event loop.
+
+    Items of list fields are cast in slices, with control given back to event
+    loop after every `chunk_size` items or every `interval` seconds.
+
+    :param executor: Executor of thread pool, to cast whole model in, if list
+        fields have at least `threshold` items together.
+    :rtype: ``dict``
+
+    """
+    if executor is not None and _count_items(model) >= threshold:
+        return await _run_in_executor(executor, model.to_struct)
+
+    model.validate()  # Items of lists are usually validated already.
+
+    pacer = _Pacer(chunk_size, interval)
+    resp = {}
+    for _, name, field in model.iterate_with_name():
+        value = field.__get__(model)
+        if value is None:
+            continue
+
+        if isinstance(field, fields.ListField):
+            items = []
+            async for values in pacer.slices(value):
+                items.extend(field.to_struct(values))
+            value = items
+        else:
+            value = field.to_struct(value)
+        resp[name] = value
+    return resp
+
+
+async def afrom_struct(
+    cls, data, chunk_size=1000, interval=0.01, executor=None, threshold=100000
+):
+    """Create model from structure, without blocking event loop.
+
+    Lists longer than `chunk_size` are parsed and validated in slices, with
+    control given back to event loop after every `chunk_size` items or every
+    `interval` seconds.
+
+    :param executor: Executor of thread pool, to create whole model in, if
+        lists have at least `threshold` items together.
+
+    """
+    if executor is not None and _count_values(data) >= threshold:
+        return await _run_in_executor(executor, functools.partial(cls, **data))
+
+    values, lists = _split_long_lists(cls, data, chunk_size)
+    model = cls(**values)
+    pacer = _Pacer(chunk_size, interval)
+    for field, key, value in lists:
+        try:
+            collection = ModelCollection(field)
+            async for items in pacer.slices(value):
+                collection.extend(field.parse_value(items))
+            field.validate(collection)
+        except errors.ValidationError as error:
+            raise errors.ValidationError(f"Error for field '{key}': {error}.")
+        field.memory[model._cache_key] = collection
+    if model._frozen:
+        model._freeze_values()
+    return model
+
+
+class _Pacer:
+    """Gives control back to event loop every `items` items or `interval`."""
+
+    step = 64
+
+    def __init__(self, items, interval):
+        self.items = items
+        self.interval = interval
+        self.step = max(1, min(items, self.step))
+        self.count = 0
+        self.deadline = time.perf_counter() + interval
+
+    async def slices(self, values):
+        """Iterate over slices of values, pausing between them if needed."""
+        for start in range(0, len(values), self.step):
+            stop = start + self.step
+            yield values[start:stop]
+
+            self.count += self.step
+            if self.count >= self.items or time.perf_counter() >= self.deadline:
+                # Tasks woken up by timers or I/O are run only after few
+                # rounds of event loop (their futures are done first).
+                for _ in range(3):
+                    await asyncio.sleep(0)
+                self.count = 0
+                self.deadline = time.perf_counter() + self.interval
+
+
+def _count_items(model):
+    return sum(
+        len(field.__get__(model) or ())
+        for _, field in model
+        if isinstance(field, fields.ListField)
+    )
+
+
+def _count_values(data):
+    return sum(len(value) for value in data.values() if isinstance(value, list))
+
+
+def _split_long_lists(cls, data, chunk_size):
+    """Split values of structure into short ones and long lists of items.
+
+    :returns: ``dict`` of values and ``list`` of field, key and items (in
+        order, in which `Base.populate` would assign them).
+
+    """
+    keys = cls._get_fields_index().keys
+    values = {}
+    lists = []
+    for key, value in data.items():
+        found = keys.get(key)
+        if (
+            found is not None
+            and isinstance(found[1], fields.ListField)
+            and isinstance(value, list)
+            and len(value) > chunk_size
+        ):
+            lists.append((found, key, value))
+        else:
+            values[key] = value
+    lists.sort(key=lambda item: item[0][0])
+    return values, [(field, key, value) for (_, field), key, value in lists]
+
+
+async def _run_in_executor(executor, function):
+    if isinstance(executor, concurrent.futures.ProcessPoolExecutor):
+        # Values of models are kept by fields, they aren't pickled with them.
+        raise ValueError("Models can't be passed between processes.")
+    return await asyncio.get_running_loop().run_in_executor(executor, function)
+
+
 def to_json_schema(cls):
     """Generate JSON schema for given class.
 
@@ -36,6 +188,22 @@ def to_json_schema(cls):
     return builder.build()
 
 
+def to_json_schema_bundle(classes):
+    """Generate one JSON schema for many classes.
+
+    Each class met (directly or through fields) is generated only once, as
+    definition, and given classes are referenced in `oneOf`.
+
+    :param classes: Classes to be casted.
+    :rtype: ``dict``
+
+    """
+    bundle = builders.BundleBuilder()
+    for cls in classes:
+        bundle.add_root(build_json_schema_object(cls, bundle))
+    return bundle.build()
+
+
 def build_json_schema(value, parent_builder=None):
     from .models import Base
 
@@ -50,13 +218,17 @@ def build_json_schema_object(cls, parent_builder=None):
     builder = builders.ObjectBuilder(cls, parent_builder)
     if builder.count_type(builder.type) > 1:
         return builder
-    for _, name, field in cls.iterate_with_name():
-        if isinstance(field, fields.EmbeddedField):
-            builder.add_field(name, field, _parse_embedded(field, builder))
-        elif isinstance(field, fields.ListField):
-            builder.add_field(name, field, _parse_list(field, builder))
-        else:
-            builder.add_field(name, field, _create_primitive_field_schema(field))
+    with builder.populating():
+        for _, name, field in cls.iterate_with_name():
+            if isinstance(field, fields.EmbeddedField):
+                builder.add_field(name, field, _parse_embedded(field, builder))
+            elif isinstance(field, fields.ListField):
+                builder.add_field(name, field, _parse_list(field, builder))
+            elif isinstance(field, fields.NumericArrayField):
+                builder.add_field(name, field, _parse_numeric_array(field, builder))
+            else:
+                schema = _create_primitive_field_schema(field)
+                builder.add_field(name, field, schema)
     return builder
 
 
@@ -65,7 +237,16 @@ def _parse_list(field, parent_builder):
         parent_builder, field.nullable, default=field._default
     )
     for type_ in field.items_types:
-        builder.add_type_schema(build_json_schema(type_, builder))
+        builder.add_type_schema(_build_type_schema(type_, field, builder))
+    return builder.build()
+
+
+def _parse_numeric_array(field, parent_builder):
+    builder = builders.ListBuilder(
+        parent_builder, field.nullable, default=field._default
+    )
+    type_ = float if field.typecode in "fd" else int
+    builder.add_type_schema(build_json_schema_primitive(type_, builder))
     return builder.build()
 
 
@@ -74,10 +255,21 @@ def _parse_embedded(field, parent_builder):
         parent_builder, field.nullable, default=field._default
     )
     for type_ in field.types:
-        builder.add_type_schema(build_json_schema(type_, builder))
+        builder.add_type_schema(_build_type_schema(type_, field, builder))
     return builder.build()
 
 
+def _build_type_schema(type_, field, parent_builder):
+    schema = build_json_schema(type_, parent_builder)
+    if field.discriminator is None:
+        return schema
+
+    value = field._discriminator_lookup.values[type_]
+    return builders.DiscriminatedBuilder(
+        schema, field.discriminator, value, parent_builder
+    )
+
+
 def build_json_schema_primitive(cls, parent_builder):
     builder = builders.PrimitiveBuilder(cls, parent_builder)
     return builder
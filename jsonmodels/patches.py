@@ -0,0 +1,424 @@
+"""Changes of models described as JSON Patch (RFC 6902) operations."""
+
+import copy
+
+from . import fields
+from .collections import ModelCollection
+from .errors import FieldNotFound, PatchError, ValidationError
+
+
+def diff(old, new):
+    """Get JSON Patch, which changes structure of `old` model into `new` one.
+
+    Models are compared field by field (without casting them to structures),
+    values shared by both models (the same objects) are skipped at once. Paths
+    are made of structure names.
+
+    :param old: Model instance.
+    :param new: Instance of the same model.
+    :rtype: ``list`` of operations (``dict``)
+
+    """
+    if type(old) is not type(new):
+        raise TypeError(
+            f"Can't compare '{type(old).__name__}' with '{type(new).__name__}'."
+        )
+    operations = []
+    _diff_models(old, new, "", operations)
+    return operations
+
+
+def escape(name):
+    """Escape name to be used in JSON Pointer."""
+    return name.replace("~", "~0").replace("/", "~1")
+
+
+def _diff_models(old, new, path, operations):
+    for _, structure_name, field in old.iterate_with_name():
+        old_value = _get_value(old, field)
+        new_value = _get_value(new, field)
+        if old_value is not new_value:
+            field_path = f"{path}/{escape(structure_name)}"
+            _diff_values(field, old_value, new_value, field_path, operations)
+
+
+def _diff_values(field, old, new, path, operations):
+    if old is None:
+        value = field.to_struct(new)
+        operations.append({"op": "add", "path": path, "value": value})
+    elif new is None:
+        operations.append({"op": "remove", "path": path})
+    elif isinstance(field, fields.EmbeddedField) and type(old) is type(new):
+        _diff_models(old, new, path, operations)
+    elif isinstance(field, fields.ListField) and isinstance(old, list):
+        _diff_lists(field, old, new, path, operations)
+    elif old != new:
+        value = field.to_struct(new)
+        operations.append({"op": "replace", "path": path, "value": value})
+
+
+def _diff_lists(field, old, new, path, operations):
+    if not isinstance(new, list):
+        value = field.to_struct(new)
+        operations.append({"op": "replace", "path": path, "value": value})
+        return
+
+    for index, (old_item, new_item) in enumerate(zip(old, new)):
+        if old_item is not new_item:
+            _diff_items(field, old_item, new_item, f"{path}/{index}", operations)
+    for index in range(len(old) - 1, len(new) - 1, -1):
+        operations.append({"op": "remove", "path": f"{path}/{index}"})
+    added = len(old)
+    for item in new[added:]:
+        value = field._elem_to_struct(item)
+        operations.append({"op": "add", "path": f"{path}/-", "value": value})
+
+
+def _diff_items(field, old, new, path, operations):
+    if type(old) is type(new) and hasattr(old, "iterate_with_name"):
+        _diff_models(old, new, path, operations)
+    elif old != new:
+        value = field._elem_to_struct(new)
+        operations.append({"op": "replace", "path": path, "value": value})
+
+
+def _get_value(model, field):
+    try:
+        return field.__get__(model)
+    except ValidationError:
+        return None
+
+
+def apply_patch(model, operations):
+    """Apply JSON Patch (RFC 6902) to model.
+
+    Only values on paths of operations are parsed and validated (and fields of
+    models on the way to them). Embedded models and lists on these paths are
+    copied before they are changed, so model is changed only if all the
+    operations succeed.
+
+    :param model: Model instance.
+    :param operations: ``list`` of operations (``dict``).
+
+    """
+    patch = _Patch(model)
+    for operation in operations:
+        patch.apply(operation)
+    patch.commit()
+
+
+def merge_patch(model, document):
+    """Apply JSON Merge Patch (RFC 7386) to model.
+
+    :param model: Model instance.
+    :param dict document: Patch, with structure names as keys.
+
+    """
+    if not isinstance(document, dict):
+        raise PatchError("Merge patch of model must be an object.")
+    operations = []
+    _merge_model(model, document, "", operations)
+    apply_patch(model, operations)
+
+
+def unescape(token):
+    """Unescape token of JSON Pointer."""
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class _Patch:
+    def __init__(self, model):
+        model._check_not_frozen()
+        self.model = model
+        self.root = model.copy()
+        self.owned = {id(self.root): self.root}
+        self.touched = {}
+
+    def apply(self, operation):
+        try:
+            name = operation["op"]
+            path = operation["path"]
+        except (KeyError, TypeError):
+            raise PatchError(f"Wrong operation: {operation!r}.")
+        if name not in _OPERATIONS:
+            raise PatchError(f"Unknown operation: {name!r}.")
+        getattr(self, f"_{name}")(path, operation)
+
+    def commit(self):
+        for slot in reversed(list(self.touched.values())):
+            slot.validate()
+        for value in self.owned.values():
+            _settle(value)
+
+        model, root = self.model, self.root
+        for _, _, field in model.iterate_with_name():
+            try:
+                field.memory[model._cache_key] = field.memory[root._cache_key]
+            except KeyError:
+                pass
+        if "_raw_values" in root.__dict__:
+            model.__dict__["_raw_values"] = root._raw_values
+
+    def _add(self, path, operation):
+        self._resolve(path).add(_get_operation_value(operation))
+
+    def _remove(self, path, operation):
+        self._resolve(path).remove()
+
+    def _replace(self, path, operation):
+        self._resolve(path).replace(_get_operation_value(operation))
+
+    def _move(self, path, operation):
+        source = _get_operation_from(operation)
+        if path.startswith(source + "/"):
+            raise PatchError(f"Can't move '{source}' into itself.")
+        value = self._resolve(source).to_struct()
+        self._resolve(source).remove()
+        self._resolve(path).add(value)
+
+    def _copy(self, path, operation):
+        value = self._resolve(_get_operation_from(operation)).to_struct()
+        self._resolve(path).add(copy.deepcopy(value))
+
+    def _test(self, path, operation):
+        if self._resolve(path).to_struct() != _get_operation_value(operation):
+            raise PatchError(f"Test of '{path}' failed.")
+
+    def _resolve(self, path):
+        if not path.startswith("/"):
+            raise PatchError(f"Can't patch '{path}', only values in model.")
+
+        tokens = [unescape(token) for token in path[1:].split("/")]
+        container, items_field = self.root, None
+        for token in tokens[:-1]:
+            slot = self._get_slot(container, token, items_field)
+            value = slot.get()
+            container = self._own(value)
+            if container is not value:
+                slot.put(container)
+            items_field = slot.get_items_field()
+        return self._get_slot(container, tokens[-1], items_field)
+
+    def _get_slot(self, container, token, items_field):
+        if hasattr(container, "_get_fields_index"):
+            slot = _FieldSlot(container, token)
+            self.touched.setdefault((id(container), id(slot.field)), slot)
+            return slot
+        if isinstance(container, list):
+            return _ItemSlot(container, token, items_field)
+        if isinstance(container, dict):
+            return _KeySlot(container, token)
+        raise PatchError(f"Can't get '{token}' of {type(container).__name__}.")
+
+    def _own(self, value):
+        """Get copy of value, which can be changed by patch."""
+        if id(value) in self.owned:
+            return value
+
+        if hasattr(value, "_get_fields_index"):
+            owned = value.copy()
+        elif isinstance(value, ModelCollection):
+            owned = value.copy()
+        elif isinstance(value, list):
+            owned = list(value)
+        elif isinstance(value, dict):
+            owned = dict(value)
+        else:
+            return value
+        self.owned[id(owned)] = owned
+        return owned
+
+
+def _settle(value):
+    """Finish changes of value owned by patch."""
+    if isinstance(value, ModelCollection):
+        # Items could be changed after they were put into collection.
+        value.reindex()
+    elif getattr(value, "_frozen", False):
+        # Copies of frozen models got values, which can be changed.
+        value._freeze_values()
+
+
+_OPERATIONS = {"add", "remove", "replace", "move", "copy", "test"}
+
+
+def _get_operation_value(operation):
+    try:
+        return operation["value"]
+    except KeyError:
+        raise PatchError(f"Operation has no value: {operation!r}.")
+
+
+def _get_operation_from(operation):
+    try:
+        return operation["from"]
+    except KeyError:
+        raise PatchError(f"Operation has no source: {operation!r}.")
+
+
+class _FieldSlot:
+    """Value of field of model."""
+
+    def __init__(self, model, name):
+        index = model._get_fields_index()
+        try:
+            _, self.field = index.by_structure_name[name]
+        except KeyError:
+            raise FieldNotFound("Field not found", name)
+        self.model = model
+        self.name = name
+
+    def get(self):
+        return _get_value(self.model, self.field)
+
+    def put(self, value):
+        self.field.memory[self.model._cache_key] = value
+
+    def get_items_field(self):
+        return self.field if isinstance(self.field, fields.ListField) else None
+
+    def add(self, value):
+        try:
+            self.field.__set__(self.model, value)
+        except ValidationError as error:
+            raise ValidationError(f"Error for field '{self.name}': {error}.")
+
+    def remove(self):
+        self._check_exists()
+        self.add(None)
+
+    def replace(self, value):
+        self._check_exists()
+        self.add(value)
+
+    def to_struct(self):
+        self._check_exists()
+        return self.field.to_struct(self.get())
+
+    def validate(self):
+        value = self.get()
+        try:
+            if isinstance(self.field, fields.EmbeddedField):
+                # Embedded model itself is validated, when it is changed.
+                fields.BaseField.validate(self.field, value)
+            else:
+                self.field.validate(value)
+        except ValidationError as error:
+            raise ValidationError(f"Error for field '{self.name}'.", error)
+
+    def _check_exists(self):
+        if self.get() is None:
+            raise PatchError(f"Field '{self.name}' has no value.")
+
+
+class _ItemSlot:
+    """Item of list (values of `ListField` or list in raw structure)."""
+
+    def __init__(self, items, token, field):
+        self.items = items
+        self.field = field
+        if token == "-":
+            self.index = len(items)
+        elif token.isdigit() and (token == "0" or not token.startswith("0")):
+            self.index = int(token)
+        else:
+            raise PatchError(f"Wrong index of list: '{token}'.")
+
+    def get(self):
+        self._check_exists()
+        return self.items[self.index]
+
+    def put(self, value):
+        self.items[self.index] = value
+
+    def get_items_field(self):
+        return None
+
+    def add(self, value):
+        if self.index > len(self.items):
+            raise PatchError(f"Index {self.index} is out of range.")
+        self.items.insert(self.index, self._parse(value))
+
+    def remove(self):
+        self._check_exists()
+        del self.items[self.index]
+
+    def replace(self, value):
+        self._check_exists()
+        self.put(self._parse(value))
+
+    def to_struct(self):
+        value = self.get()
+        return value if self.field is None else self.field._elem_to_struct(value)
+
+    def _parse(self, value):
+        if self.field is None:
+            return value
+        [value] = self.field.parse_value([value])
+        self.field.validate_single_value(value)
+        return value
+
+    def _check_exists(self):
+        if self.index >= len(self.items):
+            raise PatchError(f"Index {self.index} is out of range.")
+
+
+class _KeySlot:
+    """Value in dict of raw structure (like value of `DictField`)."""
+
+    def __init__(self, values, key):
+        self.values = values
+        self.key = key
+
+    def get(self):
+        self._check_exists()
+        return self.values[self.key]
+
+    def put(self, value):
+        self.values[self.key] = value
+
+    def get_items_field(self):
+        return None
+
+    def add(self, value):
+        self.values[self.key] = value
+
+    def remove(self):
+        self._check_exists()
+        del self.values[self.key]
+
+    def replace(self, value):
+        self._check_exists()
+        self.values[self.key] = value
+
+    def to_struct(self):
+        return self.get()
+
+    def _check_exists(self):
+        if self.key not in self.values:
+            raise PatchError(f"Key '{self.key}' doesn't exist.")
+
+
+def _merge_model(model, document, path, operations):
+    index = model._get_fields_index()
+    for key, value in document.items():
+        try:
+            _, field = index.by_structure_name[key]
+        except KeyError:
+            raise FieldNotFound("Field not found", key)
+        current = _get_value(model, field)
+        _merge_value(current, value, f"{path}/{escape(key)}", operations)
+
+
+def _merge_value(current, value, path, operations):
+    if value is None:
+        if current is not None:
+            operations.append({"op": "remove", "path": path})
+    elif isinstance(value, dict) and hasattr(current, "_get_fields_index"):
+        _merge_model(current, value, path, operations)
+    elif isinstance(value, dict) and isinstance(current, dict):
+        for key, item in value.items():
+            item_path = f"{path}/{escape(key)}"
+            _merge_value(current.get(key), item, item_path, operations)
+    else:
+        operations.append({"op": "add", "path": path, "value": value})
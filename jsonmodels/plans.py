@@ -0,0 +1,376 @@
+"""Plans compiled from models to work directly on raw structures."""
+
+from . import fields
+from .errors import ErrorRecord, FieldNotFound, ValidationError
+
+
+def get_plan(cls):
+    """Get plan for given model class (it is compiled on first use).
+
+    :param cls: Model class.
+    :rtype: `StructPlan`
+
+    """
+    compiled = cls._get_fields_index().compiled
+    try:
+        return compiled["struct"]
+    except KeyError:
+        plan = compiled["struct"] = StructPlan(cls)
+        return plan
+
+
+class StructPlan:
+    """Validation of raw structures against model, without instantiating it.
+
+    Outcome of `validate` is the same as of `Model(**data).validate()`: the
+    same exceptions are raised, with the same messages.
+
+    """
+
+    def __init__(self, model):
+        self.model = model
+        index = model._get_fields_index()
+
+        # Keys are taken in the same order as `Base.populate` takes them.
+        checks = {}
+        self.checks = {}
+        for key, (position, field) in index.keys.items():
+            if field not in checks:
+                checks[field] = _compile_check(field)
+            self.checks[key] = (position, checks[field])
+
+        self.defaults = []
+        for name, structure_name, field in index.fields:
+            keys = (structure_name,)
+            if index.keys[name][1] is field and name != structure_name:
+                keys += (name,)
+            if _needs_default_check(field):
+                self.defaults.append((name, keys, field))
+
+    def validate(self, data):
+        """Validate structure like `Model(**data).validate()` would do."""
+        _check_mapping(data)
+        self.populate(data)
+        for name, keys, field in self._get_unset_defaults(data):
+            try:
+                field.validate(field.parse_value(field.get_default_value()))
+            except ValidationError as error:
+                raise ValidationError(f"Error for field '{name}'.", error)
+
+    def iter_errors(self, data, path=()):
+        """Iterate over errors, which `validate` would raise."""
+        _check_mapping(data)
+        yield from self.iter_populate_errors(data, path)
+        for _, keys, field in self._get_unset_defaults(data):
+            value = field.parse_value(field.get_default_value())
+            yield from field.iter_errors(value, path + (keys[0],))
+
+    def _get_unset_defaults(self, data):
+        for name, keys, field in self.defaults:
+            if not any(key in data for key in keys):
+                yield name, keys, field
+
+    def populate(self, data):
+        """Check values like `Base.populate` does while setting them."""
+        for key, check in self._get_steps(data):
+            try:
+                check(data[key])
+            except ValidationError as error:
+                raise ValidationError(f"Error for field '{key}': {error}.")
+
+    def iter_value_errors(self, key, value, path=()):
+        """Iterate over errors of single value of structure."""
+        _, check = self.checks[key]
+        return check.iter_errors(value, path)
+
+    def iter_populate_errors(self, data, path=()):
+        """Iterate over errors, which `populate` would raise."""
+        for key, check in self._get_steps(data):
+            yield from check.iter_errors(data[key], path + (key,))
+
+    def _get_steps(self, data):
+        checks = self.checks
+        found = sorted((checks[key][0], key) for key in data if key in checks)
+        return [(key, checks[key][1]) for _, key in found]
+
+
+def _check_mapping(data):
+    if not isinstance(data, dict):
+        raise TypeError(f"Structure must be a mapping, not {type(data).__name__}.")
+
+
+def _needs_default_check(field):
+    """Check if validation of default value of field may ever fail."""
+    return bool(
+        field.required or field.validators or field.has_default or field.types is None
+    )
+
+
+def _compile_check(field):
+    get_model = _get_model_getter(field)
+    if get_model is None:
+        return _FieldCheck(field)
+    # Validators expect model instances, so such fields are checked by field.
+    if field.validators:
+        return _FieldCheck(field)
+    if isinstance(field, fields.EmbeddedField):
+        return _EmbeddedCheck(field, get_model)
+    if not field.item_validators:
+        return _ListCheck(field, get_model)
+    return _FieldCheck(field)
+
+
+def _get_model_getter(field):
+    """Get function choosing model for dict, like field does when parsing."""
+    from .models import Base
+
+    if isinstance(field, fields.EmbeddedField):
+        types = field.types
+    elif isinstance(field, fields.ListField):
+        types = field.items_types
+    else:
+        return None
+
+    if field.discriminator is not None:
+        return field._discriminator_lookup.get_type
+    if len(types) == 1 and issubclass(types[0], Base):
+        return lambda value: types[0]
+    return None
+
+
+class _FieldCheck:
+    """Check value with field itself, like it is done on assignment."""
+
+    def __init__(self, field):
+        self.field = field
+
+    def __call__(self, value):
+        self.field.validate(self.field.parse_value(value))
+
+    def iter_errors(self, value, path):
+        try:
+            value = self.field.parse_value(value)
+        except ValidationError as error:
+            yield _get_invalid_error(error, path)
+            return
+        except (TypeError, ValueError) as error:
+            tpl = "Value can't be parsed: {error}"
+            yield ErrorRecord("parse", tpl, {"error": error}, path)
+            return
+
+        yield from self.field.iter_errors(value, path)
+
+
+class _EmbeddedCheck(_FieldCheck):
+    """Check dict against plan of embedded model."""
+
+    def __init__(self, field, get_model):
+        super().__init__(field)
+        self.get_model = get_model
+
+    def __call__(self, value):
+        if not isinstance(value, dict):
+            return super().__call__(value)
+        get_plan(self.get_model(value)).validate(value)
+
+    def iter_errors(self, value, path):
+        if not isinstance(value, dict):
+            yield from super().iter_errors(value, path)
+            return
+
+        try:
+            model = self.get_model(value)
+        except ValidationError as error:
+            yield _get_invalid_error(error, path)
+            return
+        yield from get_plan(model).iter_errors(value, path)
+
+
+class _ListCheck(_FieldCheck):
+    """Check list of dicts against plans of models of items.
+
+    Items are only populated, since `ListField` doesn't validate them
+    afterwards.
+
+    """
+
+    def __init__(self, field, get_model):
+        super().__init__(field)
+        self.get_model = get_model
+
+    def __call__(self, values):
+        if not values or not isinstance(values, list):
+            return super().__call__(values)
+
+        for value in values:
+            if isinstance(value, self.field.items_types):
+                continue
+            if not isinstance(value, dict):
+                return super().__call__(values)
+            get_plan(self.get_model(value)).populate(value)
+
+    def iter_errors(self, values, path):
+        if not values or not isinstance(values, list):
+            yield from super().iter_errors(values, path)
+            return
+
+        for index, value in enumerate(values):
+            if isinstance(value, dict):
+                yield from self._iter_item_errors(value, path + (index,))
+            else:
+                yield from self.field.iter_single_value_errors(value, path + (index,))
+
+    def _iter_item_errors(self, value, path):
+        try:
+            model = self.get_model(value)
+        except ValidationError as error:
+            yield _get_invalid_error(error, path)
+            return
+        yield from get_plan(model).iter_populate_errors(value, path)
+
+
+def _get_invalid_error(error, path):
+    return ErrorRecord("invalid", "{error}", {"error": error}, path)
+
+
+def get_projection(cls, include=None, exclude=None):
+    """Get plan of projection of model (it is compiled on first use).
+
+    :param cls: Model class.
+    :param include: Paths of values to include (or `None` for all of them).
+    :param exclude: Paths of values to exclude.
+    :rtype: `ProjectionPlan`
+
+    """
+    include = None if include is None else frozenset(include)
+    exclude = frozenset(exclude or ())
+    compiled = cls._get_fields_index().compiled
+    key = ("projection", include, exclude)
+    try:
+        return compiled[key]
+    except KeyError:
+        plan = compiled[key] = ProjectionPlan(cls, include, exclude)
+        return plan
+
+
+class ProjectionPlan:
+    """Casting of part of model to structure.
+
+    Paths are made of structure names separated with dots, like ``"a.b"``
+    (``b`` of model embedded in ``a``). Name of list field can be followed by
+    ``[]`` to select inside of its items (like ``"items[].id"``), but it is not
+    required. Only selected values are validated.
+
+    Paths inside of embedded models are resolved against type of actual value,
+    so these are checked only when such value is met.
+
+    """
+
+    def __init__(self, model, include=None, exclude=()):
+        self.model = model
+        included = _split_paths(include)
+        excluded = _split_paths(exclude)
+        index = model._get_fields_index()
+        for name in set(included or ()) | set(excluded):
+            if name not in index.by_structure_name:
+                raise FieldNotFound("Field not found", name)
+
+        self.steps = []
+        for name, structure_name, field in index.fields:
+            if included is not None and structure_name not in included:
+                continue
+            sub_include = included[structure_name] if included else None
+            sub_exclude = excluded.get(structure_name, ())
+            if sub_exclude is None:
+                continue
+            step = _compile_projection_step(field, sub_include, sub_exclude)
+            self.steps.append((name, structure_name, step))
+
+    def to_struct(self, model):
+        resp = {}
+        for name, structure_name, step in self.steps:
+            try:
+                value = step.field.__get__(model)
+                step.validate(value)
+            except ValidationError as error:
+                raise ValidationError(f"Error for field '{name}'.", error)
+
+            if value is not None:
+                resp[structure_name] = step.to_struct(value)
+        return resp
+
+
+def _split_paths(paths):
+    """Group paths by first name.
+
+    :rtype: ``dict`` of rest of paths, `None` for names selected as a whole.
+
+    """
+    if paths is None:
+        return None
+
+    result = {}
+    for path in paths:
+        name, _, rest = path.partition(".")
+        name = name[:-2] if name.endswith("[]") else name
+        if not rest:
+            result[name] = None
+        elif result.get(name, ()) is not None:
+            result[name] = result.get(name, set()) | {rest}
+    return result
+
+
+def _compile_projection_step(field, include, exclude):
+    if include is None and not exclude:
+        return _ProjectionStep(field)
+    if isinstance(field, fields.EmbeddedField):
+        return _EmbeddedProjectionStep(field, include, exclude)
+    if isinstance(field, fields.ListField):
+        return _ListProjectionStep(field, include, exclude)
+    raise ValueError(f"Can't select values inside of '{type(field).__name__}'.")
+
+
+class _ProjectionStep:
+    """Cast whole value of field."""
+
+    def __init__(self, field):
+        self.field = field
+
+    def validate(self, value):
+        self.field.validate(value)
+
+    def to_struct(self, value):
+        return self.field.to_struct(value)
+
+
+class _EmbeddedProjectionStep(_ProjectionStep):
+    """Cast part of embedded model."""
+
+    def __init__(self, field, include, exclude):
+        super().__init__(field)
+        self.include = include
+        self.exclude = exclude
+
+    def validate(self, value):
+        # Only the field itself, embedded model is validated by its projection.
+        fields.BaseField.validate(self.field, value)
+
+    def to_struct(self, value):
+        return self._project(value)
+
+    def _project(self, value):
+        plan = get_projection(type(value), self.include, self.exclude)
+        return plan.to_struct(value)
+
+
+class _ListProjectionStep(_EmbeddedProjectionStep):
+    """Cast part of each model in list."""
+
+    def validate(self, value):
+        self.field.validate(value)
+
+    def to_struct(self, values):
+        return [
+            self._project(value) if hasattr(value, "iterate_with_name") else value
+            for value in values
+        ]
@@ -0,0 +1,164 @@
+"""Values of models read on demand from raw JSON documents.
+
+`JSONSpans` finds offsets (and decoded values) of members of top level object
+of JSON document, when the first of them is requested.
+`RawValues` gives these values to model (see `Base.from_json`) like values
+kept raw by `Base.from_struct`, so only values of fields which are accessed
+are parsed.
+
+"""
+
+import json
+import re
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_scan_once = json.JSONDecoder().scan_once
+
+
+class JSONSpans:
+    """Offsets of values of top level object of JSON document.
+
+    Members of object are scanned with scanner of `json` module, on first
+    request (all of them, since the last of duplicate keys counts, like for
+    ``json.loads``). Decoded values are kept until they are requested, so they
+    aren't decoded again.
+
+    """
+
+    def __init__(self, data):
+        """Init.
+
+        :param data: JSON document (``bytes`` or ``str``).
+        :raises ValueError: If document doesn't contain object.
+
+        """
+        if not isinstance(data, str):
+            data = data.decode(json.detect_encoding(data), "surrogatepass")
+        self.text = data
+        self.spans = {}
+        self.values = {}
+        position = _WHITESPACE.match(data).end()
+        if not data.startswith("{", position):
+            raise ValueError("Expecting JSON object.")
+        self.position = self._skip_whitespace(position + 1)
+        self.finished = data.startswith("}", self.position)
+
+    def find(self, key):
+        """Get (start, end) offsets of value of key, or `None`."""
+        while not self.finished:
+            self._scan_member()
+        return self.spans.get(key)
+
+    def decode(self, key):
+        """Decode value of key.
+
+        Value decoded by scan is given away only once (it can be changed by
+        its new owner), next calls decode it again.
+
+        :raises KeyError: If there is no such key.
+
+        """
+        span = self.find(key)
+        if span is None:
+            raise KeyError(key)
+        try:
+            return self.values.pop(key)
+        except KeyError:
+            start, end = span
+            return json.loads(self.text[start:end])
+
+    def _scan_member(self):
+        text = self.text
+        if not text.startswith('"', self.position):
+            raise ValueError(f"Expecting property name at {self.position}.")
+        key, position = _scan(text, self.position)
+
+        position = self._skip_whitespace(position)
+        if not text.startswith(":", position):
+            raise ValueError(f"Expecting ':' at {position}.")
+        start = self._skip_whitespace(position + 1)
+        self.values[key], end = _scan(text, start)
+        self.spans[key] = (start, end)
+
+        position = self._skip_whitespace(end)
+        if text.startswith(",", position):
+            self.position = self._skip_whitespace(position + 1)
+        elif text.startswith("}", position):
+            self.finished = True
+        else:
+            raise ValueError(f"Expecting ',' or '}}' at {position}.")
+
+    def _skip_whitespace(self, position):
+        return _WHITESPACE.match(self.text, position).end()
+
+
+def _scan(text, position):
+    """Decode value at given offset, get it with offset of its end."""
+    try:
+        return _scan_once(text, position)
+    except StopIteration:
+        raise ValueError(f"Expecting value at {position}.")
+
+
+class RawValues:
+    """Raw values of fields of model, decoded from JSON document on demand.
+
+    It works like mapping (used by models for values kept raw) of fields to
+    tuples of key and (decoded) value, for fields not loaded yet.
+
+    """
+
+    def __init__(self, model, spans, loaded=()):
+        self.keys = _get_keys(model)
+        self.spans = spans
+        self.loaded = set(loaded)
+
+    def __contains__(self, field):
+        return field not in self.loaded and self._find_key(field) is not None
+
+    def __getitem__(self, field):
+        key = None if field in self.loaded else self._find_key(field)
+        if key is None:
+            raise KeyError(field)
+        return key, self.spans.decode(key)
+
+    def __delitem__(self, field):
+        self.loaded.add(field)
+
+    def copy(self):
+        clone = RawValues.__new__(RawValues)
+        clone.keys = self.keys
+        clone.spans = self.spans
+        clone.loaded = set(self.loaded)
+        return clone
+
+    def _find_key(self, field):
+        for key in self.keys.get(field, ()):
+            if self.spans.find(key) is not None:
+                return key
+        return None
+
+
+def _get_keys(model):
+    """Get keys of fields, in order of precedence.
+
+    Key assigned last by `Base.populate` (attribute name, if it differs from
+    structure name) comes first.
+
+    """
+    compiled = model._get_fields_index().compiled
+    try:
+        return compiled["json_keys"]
+    except KeyError:
+        pass
+
+    keys = {}
+    found = sorted(
+        model._get_fields_index().keys.items(),
+        key=lambda item: item[1][0],
+        reverse=True,
+    )
+    for key, (_, field) in found:
+        keys.setdefault(field, []).append(key)
+    compiled["json_keys"] = keys
+    return keys
@@ -0,0 +1,306 @@
+"""Instances of flat models stored in shared memory.
+
+`SharedModelArray` lays values of instances out in one
+`multiprocessing.shared_memory` block, column by column, so other processes
+can map it (by name) and read the instances without copying or
+deserialization of the whole block.
+
+Only fields with fixed width are supported: `IntField`, `FloatField`,
+`BoolField`, `DateField`, `DateTimeField`, `TimeField` (naive datetimes and
+times only) and `StringField` with `Enum` validator.
+
+"""
+
+import array
+import datetime
+import hashlib
+import os
+import struct
+from multiprocessing import resource_tracker, shared_memory
+
+from . import fields, validators
+from .batches import ModelBatch, get_view_class
+from .errors import FieldNotSupported
+
+# Magic, number of rows, fingerprint of layout and resource tracker of creator.
+_HEADER = struct.Struct("<8sQ16sQ")
+_MAGIC = b"jsonmdl2"
+_EPOCH = datetime.datetime(1970, 1, 1)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+
+class SharedModelArray:
+    """Instances of flat model in shared memory block.
+
+    Create it with `create` in one process and pass `name` to other ones,
+    which `attach` to it. Rows are read through views (like rows of
+    `jsonmodels.batches.ModelBatch`), which decode only the values they read.
+
+    """
+
+    def __init__(self, model, memory, owner=False):
+        self.model = model
+        self.memory = memory
+        self.owner = owner
+        magic, self._length, fingerprint, _ = _HEADER.unpack_from(memory.buf)
+        if magic != _MAGIC:
+            raise ValueError(f"Block '{memory.name}' doesn't contain models.")
+        layout = _get_layout(model, self._length)
+        if fingerprint != _get_fingerprint(model, layout):
+            raise ValueError(
+                f"Block '{memory.name}' doesn't contain '{model.__name__}' models."
+            )
+        self.columns = {}
+        for name, column in layout.items():
+            self.columns[name] = column.open(memory.buf)
+        self._view = get_view_class(model)
+
+    @classmethod
+    def create(cls, model, items, name=None):
+        """Store instances in new shared memory block.
+
+        :param model: Model class.
+        :param items: `ModelBatch`, ``list`` of instances of model or ``list``
+            of structures (``dict``, they are parsed and validated first).
+        :param str name: Name of block (random one, if `None`).
+        :rtype: `SharedModelArray`
+
+        """
+        items = items if isinstance(items, ModelBatch) else list(items)
+        if items and isinstance(items[0], dict):
+            items = ModelBatch.from_structs(model, items)
+
+        layout = _get_layout(model, len(items))
+        size = max(column.end for column in layout.values()) if layout else 0
+        memory = shared_memory.SharedMemory(
+            name=name, create=True, size=max(size, _HEADER.size)
+        )
+        try:
+            fingerprint = _get_fingerprint(model, layout)
+            _HEADER.pack_into(
+                memory.buf, 0, _MAGIC, len(items), fingerprint, _get_tracker()
+            )
+            for attribute, _, field in model.iterate_with_name():
+                if isinstance(items, ModelBatch):
+                    values = items.columns[attribute]
+                else:
+                    values = [field.__get__(item) for item in items]
+                layout[attribute].write(memory.buf, values)
+            return cls(model, memory, owner=True)
+        except BaseException:
+            memory.close()
+            memory.unlink()
+            raise
+
+    @classmethod
+    def attach(cls, model, name):
+        """Map block created (with the same model) by other process.
+
+        `ValueError` is raised, if layout of block doesn't match the model.
+
+        :rtype: `SharedModelArray`
+
+        """
+        try:
+            memory = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:  # Python < 3.13 tracks all the blocks.
+            memory = shared_memory.SharedMemory(name=name)
+            # Tracker would remove the block when this process exits, unless
+            # it's the tracker of creator (which removes the block anyway).
+            if len(memory.buf) >= _HEADER.size:
+                if _HEADER.unpack_from(memory.buf)[3] != _get_tracker():
+                    resource_tracker.unregister(memory._name, "shared_memory")
+        try:
+            return cls(model, memory)
+        except BaseException:
+            memory.close()
+            raise
+
+    @property
+    def name(self):
+        """Name of shared memory block (to pass to other processes)."""
+        return self.memory.name
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Row index out of range.")
+        return self._view(self, index)
+
+    def __iter__(self):
+        view = self._view
+        for index in range(self._length):
+            yield view(self, index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close access to block (it is removed too, if it was created here)."""
+        for column in self.columns.values():
+            column.release()
+        self.columns = {}
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
+            self.owner = False
+
+
+class SharedColumn:
+    """Values of one field in shared memory block.
+
+    `values` is ``memoryview`` of raw numbers (e.g. to read them with NumPy),
+    `present` marks (with ``1``) rows having value.
+
+    """
+
+    def __init__(self, values, present, decode):
+        self.values = values
+        self.present = present
+        self.decode = decode
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if not self.present[index]:
+            return None
+        value = self.values[index]
+        return value if self.decode is None else self.decode(value)
+
+    def release(self):
+        self.values.release()
+        self.present.release()
+
+
+class _ColumnLayout:
+    def __init__(self, offset, length, typecode, encode, decode):
+        self.length = length
+        self.typecode = typecode
+        self.encode = encode
+        self.decode = decode
+        itemsize = array.array(typecode).itemsize
+        values_offset = _align(offset + length)
+        self.end = _align(values_offset + length * itemsize)
+        self.present = slice(offset, offset + length)
+        self.values = slice(values_offset, values_offset + length * itemsize)
+
+    def open(self, buffer):
+        values = buffer[self.values].cast(self.typecode)
+        return SharedColumn(values, buffer[self.present], self.decode)
+
+    def write(self, buffer, values):
+        buffer[self.present] = bytes(value is not None for value in values)
+        encode = self.encode or _identity
+        numbers = array.array(
+            self.typecode,
+            (0 if value is None else encode(value) for value in values),
+        )
+        buffer[self.values] = numbers.tobytes()
+
+
+def _get_layout(model, length):
+    """Get layout of columns of all fields of model, for given number of rows."""
+    layout = {}
+    offset = _HEADER.size
+    for name, _, field in model.iterate_with_name():
+        typecode, encode, decode = _get_codec(field)
+        column = layout[name] = _ColumnLayout(offset, length, typecode, encode, decode)
+        offset = column.end
+    return layout
+
+
+def _get_fingerprint(model, layout):
+    """Hash names, types and offsets of columns (and choices of enums)."""
+    description = [
+        (
+            name,
+            type(field).__name__,
+            layout[name].typecode,
+            layout[name].present.start,
+            layout[name].values.start,
+            _get_choices(field),
+        )
+        for name, _, field in model.iterate_with_name()
+    ]
+    return hashlib.sha256(repr(description).encode()).digest()[:16]
+
+
+def _get_tracker():
+    """Identify resource tracker of process (by its pipe), 0 if it has none."""
+    if os.name != "posix":
+        return 0
+    return os.fstat(resource_tracker.getfd()).st_ino
+
+
+def _get_codec(field):
+    if isinstance(field, fields.DateTimeField):
+        return "q", _encode_datetime, _decode_datetime
+    if isinstance(field, fields.DateField):
+        return "i", datetime.date.toordinal, datetime.date.fromordinal
+    if isinstance(field, fields.TimeField):
+        return "q", _encode_time, _decode_time
+    if isinstance(field, fields.StringField):
+        return _get_enum_codec(field)
+    if isinstance(field, fields.BoolField):
+        return "B", None, bool
+    if isinstance(field, fields.IntField):
+        return "q", None, None
+    if isinstance(field, fields.FloatField):
+        return "d", float, None
+    raise FieldNotSupported(f"Field {type(field).__name__} has no fixed width.")
+
+
+def _get_enum_codec(field):
+    choices = _get_choices(field)
+    if choices is None or len(choices) >= 2**16:
+        raise FieldNotSupported("Only strings with Enum validator have fixed width.")
+    positions = {choice: index for index, choice in enumerate(choices)}
+    return "H", positions.__getitem__, choices.__getitem__
+
+
+def _get_choices(field):
+    for validator in field.validators:
+        if isinstance(validator, validators.Enum):
+            return validator.choices
+    return None
+
+
+def _encode_datetime(value):
+    if value.tzinfo is not None:
+        raise ValueError("Only naive datetimes can be shared.")
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_datetime(value):
+    return _EPOCH + value * _MICROSECOND
+
+
+def _encode_time(value):
+    if value.tzinfo is not None:
+        raise ValueError("Only naive times can be shared.")
+    return (
+        (value.hour * 60 + value.minute) * 60 + value.second
+    ) * 1000000 + value.microsecond
+
+
+def _decode_time(value):
+    seconds, microsecond = divmod(value, 1000000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return datetime.time(hour, minute, second, microsecond)
+
+
+def _align(offset):
+    return (offset + 7) // 8 * 8
+
+
+def _identity(value):
+    return value
@@ -0,0 +1,180 @@
+"""Random access to records of NDJSON files.
+
+`IndexedNDJSON` maps file into memory and keeps offsets of its lines (and
+values of key field, if any) in sidecar index file, so single records can be
+read by position or key with parsing of just their lines.
+
+"""
+
+import array
+import json
+import mmap
+import os
+import struct
+
+from . import errors
+
+_HEADER = struct.Struct("<8sQqQ")
+_MAGIC = b"jsonidx1"
+
+
+class IndexedNDJSON:
+    """NDJSON file (one JSON structure per line) with offset index.
+
+    Index is built on first use of file and saved next to it (in `path` with
+    ``.idx`` suffix, by default). It is built again when file was changed
+    (its size or modification time differ) or when other `key` is used. If
+    index can't be saved (e.g. in read-only directory), it is kept in memory
+    only. Empty lines are skipped.
+
+    Records are parsed into instances of `model` when they are read (they are
+    not validated, like for ``model(**struct)``).
+
+    """
+
+    def __init__(self, path, model, key=None, index_path=None):
+        """Init.
+
+        :param path: Path to NDJSON file.
+        :param model: Model class of records.
+        :param str key: Name (attribute or structure one) of field to look
+            records up by (with `get`).
+        :param index_path: Path to sidecar index file.
+
+        """
+        self.path = os.fspath(path)
+        self.model = model
+        self.index_path = (
+            self.path + ".idx" if index_path is None else os.fspath(index_path)
+        )
+        self.key = None if key is None else _get_key_field(model, key)
+
+        with open(self.path, "rb") as source:
+            stat = os.fstat(source.fileno())
+            self._buffer = (
+                mmap.mmap(source.fileno(), 0, access=mmap.ACCESS_READ)
+                if stat.st_size
+                else b""
+            )
+        self._offsets, values = self._load_index(stat)
+        self._keys = None
+        if self.key is not None:
+            parse_value = self.key[2].parse_value
+            self._keys = {}
+            for position, value in enumerate(values):
+                self._keys.setdefault(parse_value(value), position)
+
+    def __len__(self):
+        return len(self._offsets) // 2
+
+    def __getitem__(self, index):
+        return self.model(**self.read_struct(index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def read_struct(self, index):
+        """Read structure of record with given position (without model)."""
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Record index out of range.")
+        start, end = self._offsets[2 * index], self._offsets[2 * index + 1]
+        return json.loads(self._buffer[start:end])
+
+    def get(self, value):
+        """Get record, which has given value of key field.
+
+        If many records have this value, first of them is returned.
+
+        :raises KeyError: If there is no such record.
+
+        """
+        if self._keys is None:
+            raise ValueError("Records have no key field.")
+        return self[self._keys[value]]
+
+    def close(self):
+        """Unmap file."""
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def _load_index(self, stat):
+        key_name = None if self.key is None else self.key[1]
+        current = (_MAGIC, stat.st_size, stat.st_mtime_ns, key_name)
+        try:
+            with open(self.index_path, "rb") as index_file:
+                return _read_index(index_file.read(), current)
+        except (OSError, KeyError, TypeError, ValueError):
+            pass  # Index is missing, stale or corrupted, it is built again.
+
+        offsets, values = _scan(self._buffer, key_name)
+        header = _HEADER.pack(*current[:3], len(offsets) // 2)
+        keys = json.dumps({"key": key_name, "values": values}).encode()
+        temporary = self.index_path + ".tmp"
+        try:
+            with open(temporary, "wb") as index_file:
+                index_file.write(header + offsets.tobytes() + keys)
+            os.replace(temporary, self.index_path)
+        except OSError:
+            try:
+                os.remove(temporary)
+            except OSError:
+                pass
+        return offsets, values
+
+
+def _read_index(data, current):
+    """Read offsets and key values from index (if it matches current file)."""
+    try:
+        magic, size, mtime, count = _HEADER.unpack_from(data)
+    except struct.error:
+        raise ValueError("Index is truncated.")
+    start = _HEADER.size
+    end = start + count * 16
+    if len(data) < end:
+        raise ValueError("Index is truncated.")
+    keys = json.loads(data[end:])
+    if (magic, size, mtime, keys["key"]) != current:
+        raise ValueError("Index is outdated.")
+    values = keys["values"]
+    if values is not None and len(values) != count:
+        raise ValueError("Index is corrupted.")
+    offsets = array.array("q")
+    offsets.frombytes(data[start:end])
+    return offsets, values
+
+
+def _get_key_field(model, name):
+    """Get attribute name, structure name and field of key field."""
+    for attribute, structure_name, field in model.iterate_with_name():
+        if name in (attribute, structure_name):
+            return attribute, structure_name, field
+    raise errors.FieldNotFound("Field not found", name)
+
+
+def _scan(buffer, key_name):
+    """Find start and end offsets of all lines (and values of key field)."""
+    offsets = array.array("q")
+    values = None if key_name is None else []
+    start = 0
+    size = len(buffer)
+    while start < size:
+        end = buffer.find(b"\n", start)
+        if end == -1:
+            end = size
+        line = buffer[start:end]
+        if line.strip():
+            offsets.append(start)
+            offsets.append(end)
+            if values is not None:
+                values.append(json.loads(line).get(key_name))
+        start = end + 1
+    return offsets, values
@@ -1,5 +1,7 @@
+import array
+import functools
 import re
-from collections import namedtuple
+from collections import Counter, namedtuple
 
 SCALAR_TYPES = (str, int, float, bool)
 
@@ -13,37 +15,42 @@ PYTHON_TO_ECMA_FLAGS = {value: key for key, value in ECMA_TO_PYTHON_FLAGS.items(
 PythonRegex = namedtuple("PythonRegex", ["regex", "flags"])
 
 
-def _normalize_string_type(value):
-    if isinstance(value, str):
-        return str(value)
-    else:
-        return value
+@functools.lru_cache(maxsize=None)
+def import_numpy():
+    """Get `numpy` module (or `None`, if it isn't installed)."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
 
 
-def _compare_dicts(one, two):
-    if len(one) != len(two):
-        return False
+def minimum(values):
+    """Get the lowest of values (computed with NumPy for arrays, if possible)."""
+    numbers = _as_numpy(values)
+    return min(values) if numbers is None else numbers.min().item()
 
-    for key, value in one.items():
-        if key not in one or key not in two:
-            return False
 
-        if not compare_schemas(one[key], two[key]):
-            return False
-    return True
+def maximum(values):
+    """Get the biggest of values (computed with NumPy for arrays, if possible)."""
+    numbers = _as_numpy(values)
+    return max(values) if numbers is None else numbers.max().item()
 
 
-def _compare_lists(one, two):
-    if len(one) != len(two):
-        return False
+def _as_numpy(values):
+    if not isinstance(values, array.array):
+        return None
+    numpy = import_numpy()
+    if numpy is None:
+        return None
+    return numpy.frombuffer(values, dtype=values.typecode)
 
-    they_match = False
-    for first_item in one:
-        for second_item in two:
-            if they_match:
-                continue
-            they_match = compare_schemas(first_item, second_item)
-    return they_match
+
+def _normalize_string_type(value):
+    if isinstance(value, str):
+        return str(value)
+    else:
+        return value
 
 
 def _assert_same_types(one, two):
@@ -53,15 +60,71 @@ def _assert_same_types(one, two):
         )
 
 
+def _scalar_type_name(value):
+    for type_ in (bool, str, int, float):
+        if isinstance(value, type_):
+            return type_.__name__
+
+
+def canonicalize_schema(schema):
+    """Get canonical form of structure that represents JSON schema.
+
+    Canonical forms of two schemas are equal (and have equal hashes) when
+    schemas differ only in order of items of lists, since in JSON schema lists
+    DO NOT keep order. Canonical forms are hashable, so can be used as keys of
+    dicts, e.g. to find identical subschemas.
+
+    :param schema: Schema to canonicalize.
+    :rtype: `tuple`
+
+    """
+    if isinstance(schema, dict):
+        items = ((key, canonicalize_schema(value)) for key, value in schema.items())
+        return "object", frozenset(items)
+    elif isinstance(schema, list):
+        counter = Counter(canonicalize_schema(item) for item in schema)
+        return "array", frozenset(counter.items())
+    elif isinstance(schema, SCALAR_TYPES):
+        return _scalar_type_name(schema), schema
+    elif schema is None:
+        return "null", None
+    else:
+        raise RuntimeError(f'Not allowed type "{type(schema).__name__}"')
+
+
+def schema_hash(schema):
+    """Get hash of JSON schema, which ignores order of items of lists.
+
+    :param schema: Schema to hash.
+    :rtype: `int`
+
+    """
+    return hash(canonicalize_schema(schema))
+
+
+def unique_schemas(schemas):
+    """Remove duplicates from list of JSON schemas.
+
+    Schemas are compared like in :func:`compare_schemas`, first one of
+    identical schemas is kept.
+
+    :param list schemas: Schemas to deduplicate.
+    :rtype: `list`
+
+    """
+    unique = {}
+    for schema in schemas:
+        unique.setdefault(canonicalize_schema(schema), schema)
+    return list(unique.values())
+
+
 def compare_schemas(one, two):
     """Compare two structures that represents JSON schemas.
 
     For comparison you can't use normal comparison, because in JSON schema
     lists DO NOT keep order (and Python lists do), so this must be taken into
-    account during comparison.
-
-    Note this wont check all configurations, only first one that seems to
-    match, which can lead to wrong results.
+    account during comparison. Both schemas are canonicalized (see
+    :func:`canonicalize_schema`), so comparison takes linear time.
 
     :param one: First schema to compare.
     :param two: Second schema to compare.
@@ -73,16 +136,7 @@ def compare_schemas(one, two):
 
     _assert_same_types(one, two)
 
-    if isinstance(one, list):
-        return _compare_lists(one, two)
-    elif isinstance(one, dict):
-        return _compare_dicts(one, two)
-    elif isinstance(one, SCALAR_TYPES):
-        return one == two
-    elif one is None:
-        return one is two
-    else:
-        raise RuntimeError(f'Not allowed type "{type(one).__name__}"')
+    return canonicalize_schema(one) == canonicalize_schema(two)
 
 
 def is_ecma_regex(regex):
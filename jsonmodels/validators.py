@@ -4,7 +4,7 @@ import re
 from functools import reduce
 
 from . import utilities
-from .errors import ValidationError
+from .errors import ErrorRecord, ValidationError
 
 
 class Min:
@@ -23,15 +23,35 @@ class Min:
 
     def validate(self, value):
         """Validate value."""
+        _raise_error(self.check(value))
+
+    def validate_all(self, values):
+        """Validate many values at once (only the lowest one is checked).
+
+        If NaN is found instead (it isn't comparable), each value is checked.
+
+        """
+        if not len(values):
+            return
+        lowest = utilities.minimum(values)
+        if lowest != lowest:
+            for value in values:
+                self.validate(value)
+        else:
+            self.validate(lowest)
+
+    def check(self, value):
+        """Check value, return `ErrorRecord` (or `None` if value is valid)."""
         if self.exclusive:
             if value <= self.minimum_value:
                 tpl = "'{value}' is lower or equal than minimum ('{min}')."
-                raise ValidationError(tpl.format(value=value, min=self.minimum_value))
+                params = {"value": value, "min": self.minimum_value}
+                return ErrorRecord("exclusive_minimum", tpl, params)
         else:
             if value < self.minimum_value:
-                raise ValidationError(
-                    f"'{value}' is lower than minimum ('{self.minimum_value}')."
-                )
+                tpl = "'{value}' is lower than minimum ('{min}')."
+                params = {"value": value, "min": self.minimum_value}
+                return ErrorRecord("minimum", tpl, params)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
@@ -56,15 +76,35 @@ class Max:
 
     def validate(self, value):
         """Validate value."""
+        _raise_error(self.check(value))
+
+    def validate_all(self, values):
+        """Validate many values at once (only the biggest one is checked).
+
+        If NaN is found instead (it isn't comparable), each value is checked.
+
+        """
+        if not len(values):
+            return
+        biggest = utilities.maximum(values)
+        if biggest != biggest:
+            for value in values:
+                self.validate(value)
+        else:
+            self.validate(biggest)
+
+    def check(self, value):
+        """Check value, return `ErrorRecord` (or `None` if value is valid)."""
         if self.exclusive:
             if value >= self.maximum_value:
-                tpl = "'{val}' is bigger or equal than maximum ('{max}')."
-                raise ValidationError(tpl.format(val=value, max=self.maximum_value))
+                tpl = "'{value}' is bigger or equal than maximum ('{max}')."
+                params = {"value": value, "max": self.maximum_value}
+                return ErrorRecord("exclusive_maximum", tpl, params)
         else:
             if value > self.maximum_value:
-                raise ValidationError(
-                    f"'{value}' is bigger than maximum ('{self.maximum_value}')."
-                )
+                tpl = "'{value}' is bigger than maximum ('{max}')."
+                params = {"value": value, "max": self.maximum_value}
+                return ErrorRecord("maximum", tpl, params)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
@@ -109,17 +149,21 @@ class Regex:
 
     def validate(self, value):
         """Validate value."""
+        _raise_error(self.check(value))
+
+    def check(self, value):
+        """Check value, return `ErrorRecord` (or `None` if value is valid)."""
         flags = self._calculate_flags()
 
         try:
             result = re.search(self.pattern, value, flags)
         except TypeError as te:
-            raise ValidationError(*te.args)
+            return ErrorRecord("type", "{error}", {"error": te})
 
         if not result:
-            raise ValidationError(
-                f'Value "{value}" did not match pattern "{self.pattern}".'
-            )
+            tpl = 'Value "{value}" did not match pattern "{pattern}".'
+            params = {"value": value, "pattern": self.pattern}
+            return ErrorRecord("pattern", tpl, params)
 
     def _calculate_flags(self):
         return reduce(lambda x, y: x | y, self.flags, 0)
@@ -154,20 +198,27 @@ class Length:
 
     def validate(self, value):
         """Validate value."""
+        _raise_error(self.check(value))
+
+    def validate_all(self, values):
+        """Validate many values at once (only the shortest and the longest)."""
+        if len(values):
+            self.validate(min(values, key=len))
+            self.validate(max(values, key=len))
+
+    def check(self, value):
+        """Check value, return `ErrorRecord` (or `None` if value is valid)."""
         len_ = len(value)
 
         if self.minimum_value is not None and len_ < self.minimum_value:
-            tpl = "Value '{val}' length is lower than allowed minimum '{min}'."
-            raise ValidationError(tpl.format(val=value, min=self.minimum_value))
+            tpl = "Value '{value}' length is lower than allowed minimum '{min}'."
+            params = {"value": value, "min": self.minimum_value}
+            return ErrorRecord("min_length", tpl, params)
 
         if self.maximum_value is not None and len_ > self.maximum_value:
-            raise ValidationError(
-                "Value '{val}' length is bigger than "
-                "allowed maximum '{max}'.".format(
-                    val=value,
-                    max=self.maximum_value,
-                )
-            )
+            tpl = "Value '{value}' length is bigger than allowed maximum '{max}'."
+            params = {"value": value, "max": self.maximum_value}
+            return ErrorRecord("max_length", tpl, params)
 
     def modify_schema(self, field_schema):
         """Modify field schema."""
@@ -194,9 +245,27 @@ class Enum:
         self.choices = list(choices)
 
     def validate(self, value):
+        _raise_error(self.check(value))
+
+    def validate_all(self, values):
+        """Validate many values at once (each distinct value is checked once)."""
+        try:
+            values = dict.fromkeys(values)
+        except TypeError:  # Values aren't hashable.
+            pass
+        for value in values:
+            self.validate(value)
+
+    def check(self, value):
+        """Check value, return `ErrorRecord` (or `None` if value is valid)."""
         if value not in self.choices:
-            tpl = "Value '{val}' is not a valid choice."
-            raise ValidationError(tpl.format(val=value))
+            tpl = "Value '{value}' is not a valid choice."
+            return ErrorRecord("enum", tpl, {"value": value})
 
     def modify_schema(self, field_schema):
         field_schema["enum"] = self.choices
+
+
+def _raise_error(error):
+    if error is not None:
+        raise ValidationError(error.message)
@@ -0,0 +1,82 @@
+import pytest
+
+from jsonmodels import errors, fields, models
+
+from .utilities import Line, Order, Product, make_order
+
+
+def test_accessor():
+    order = make_order()
+    order.lines.append(Line())
+
+    assert Order.accessor("number")(order) == 1
+    assert Order.accessor("order-number").get(order) == 1
+    assert Order.accessor("lines[1].product.sku")(order) == "B"
+    assert Order.accessor("lines[-1].product.sku")(order) is None
+    assert Order.accessor("lines[].product.sku")(order) == ["A", "B", None]
+    assert Order.accessor("lines[].quantity")(order) == [1, 2, None]
+    assert Order.accessor("tags[0]")(order) == "new"
+    assert Order.accessor("lines[].product.sku")(Order()) == []
+
+    assert Order.accessor("lines[].quantity") is Order.accessor("lines[].quantity")
+
+
+def test_accessor_of_many_model_types():
+    class Service(models.Base):
+        sku = fields.StringField(name="service-sku")
+
+    class Entry(models.Base):
+        item = fields.EmbeddedField([Product, Service])
+
+    class Invoice(models.Base):
+        entries = fields.ListField([Entry])
+
+    invoice = Invoice(
+        entries=[Entry(item=Service(sku="X")), Entry(item=Product(sku="Y")), Entry()]
+    )
+    assert Invoice.accessor("entries[].item.sku")(invoice) == ["X", "Y", None]
+    assert Invoice.accessor("entries[0].item.service-sku")(invoice) == "X"
+
+
+def test_accessor_extract():
+    orders = [make_order(), Order(), Order(lines=[Line(product={"sku": "C"})])]
+
+    accessor = Order.accessor("lines[0].product.sku")
+    assert accessor.extract(orders[2:]) == ["C"]
+    assert Order.accessor("order-number").extract(orders) == [1, None, None]
+
+    collection = fields.ListField([Order]).parse_value([])
+    collection.append(orders[0])
+    assert Order.accessor("lines[].product.sku").extract(collection) == [["A", "B"]]
+
+
+def test_accessor_set():
+    order = make_order()
+    order.lines.append(Line())
+
+    Order.accessor("lines[0].product.sku").set(order, "C")
+    assert order.lines[0].product.sku == "C"
+    Order.accessor("lines[1]").set(order, {"quantity": 3})
+    assert order.lines[1].quantity == 3
+    Order.accessor("order-number").set(order, 2)
+    assert order.number == 2
+
+    with pytest.raises(errors.ValidationError):
+        Order.accessor("lines[0].product.sku").set(order, "lower")
+    with pytest.raises(errors.ValidationError):
+        Order.accessor("lines[0]").set(order, {"product": {"sku": "d"}})
+    with pytest.raises(ValueError):
+        Order.accessor("lines[].quantity").set(order, 1)
+    with pytest.raises(ValueError):
+        Order.accessor("lines[2].product.sku").set(order, "E")
+
+
+def test_wrong_accessor():
+    with pytest.raises(ValueError):
+        Order.accessor("lines.product.weight")
+    with pytest.raises(ValueError):
+        Order.accessor("number.value")
+    with pytest.raises(ValueError):
+        Order.accessor("number[0]")
+    with pytest.raises(ValueError):
+        Order.accessor("lines[x]")
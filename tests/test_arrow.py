@@ -0,0 +1,103 @@
+import datetime
+
+import pytest
+
+from jsonmodels import errors, fields, models
+
+pyarrow = pytest.importorskip("pyarrow")
+arrow = pytest.importorskip("jsonmodels.arrow")
+
+
+class Position(models.Base):
+    x = fields.FloatField(required=True)
+    y = fields.FloatField()
+
+
+class Stop(models.Base):
+    name = fields.StringField(name="stop-name")
+    position = fields.EmbeddedField(Position)
+
+
+class Trip(models.Base):
+    number = fields.IntField(required=True)
+    day = fields.DateField()
+    started = fields.DateTimeField()
+    active = fields.BoolField()
+    stops = fields.ListField([Stop])
+    tags = fields.ListField(str)
+    speeds = fields.NumericArrayField("f4")
+
+
+def _trips():
+    return [
+        Trip(
+            number=1,
+            day=datetime.date(2020, 1, 2),
+            started=datetime.datetime(2020, 1, 2, 10, 30),
+            active=True,
+            stops=[Stop(name="A", position=Position(x=1, y=2)), Stop(name="B")],
+            tags=["fast"],
+            speeds=[1.5, 2.5],
+        ),
+        Trip(number=2),
+    ]
+
+
+def test_schema():
+    schema = arrow.get_schema(Trip)
+
+    assert schema.field("number").type == pyarrow.int64()
+    assert not schema.field("number").nullable
+    assert schema.field("day").type == pyarrow.date32()
+    assert schema.field("started").type == pyarrow.timestamp("us")
+    assert schema.field("active").type == pyarrow.bool_()
+    assert schema.field("tags").type == pyarrow.list_(pyarrow.string())
+    assert schema.field("speeds").type == pyarrow.list_(pyarrow.float32())
+    stop = schema.field("stops").type.value_type
+    assert stop.field("stop-name").type == pyarrow.string()
+    assert stop.field("position").type.field("x").type == pyarrow.float64()
+
+
+def test_unsupported_fields():
+    class Mixed(models.Base):
+        values = fields.ListField([int, str])
+
+    class Extra(models.Base):
+        extra = fields.DictField()
+
+    for model in (Mixed, Extra):
+        with pytest.raises(errors.FieldNotSupported):
+            arrow.get_schema(model)
+
+
+def test_round_trip_of_instances():
+    trips = _trips()
+
+    record_batch = arrow.to_record_batch(Trip, trips)
+    assert record_batch.num_rows == 2
+    assert record_batch.column("number").to_pylist() == [1, 2]
+
+    loaded = arrow.from_record_batch(Trip, record_batch)
+    assert [trip.to_struct() for trip in loaded] == [trip.to_struct() for trip in trips]
+
+
+def test_round_trip_of_structs():
+    structs = [trip.to_struct() for trip in _trips()]
+
+    record_batch = arrow.to_record_batch(Trip, structs)
+    batch = arrow.to_model_batch(Trip, record_batch)
+    assert batch.to_structs() == structs
+    assert arrow.to_record_batch(Trip, batch).equals(record_batch)
+
+    with pytest.raises(errors.ValidationError):
+        arrow.to_record_batch(Trip, [{"day": "2020-01-01"}])
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "trips.parquet"
+
+    arrow.write_parquet(Trip, _trips(), path)
+    loaded = arrow.read_parquet(Trip, path)
+    assert loaded[0].stops[0].position.y == 2
+    assert loaded[1].number == 2
@@ -0,0 +1,114 @@
+import asyncio
+import warnings
+
+import pytest
+
+from jsonmodels import errors, fields, models, validators
+
+TAKEN = {"taken", "used"}
+
+
+async def is_free(value):
+    await asyncio.sleep(0)
+    if value in TAKEN:
+        raise errors.ValidationError(f"'{value}' is taken.")
+
+
+def is_free_now(value):
+    if value in TAKEN:
+        raise errors.ValidationError(f"'{value}' is taken.")
+
+
+class Counter:
+    def __init__(self):
+        self.active = 0
+        self.most = 0
+
+    async def validate(self, value):
+        self.active += 1
+        self.most = max(self.most, self.active)
+        await asyncio.sleep(0.001)
+        self.active -= 1
+
+
+class Account(models.Base):
+    login = fields.StringField(required=True, validators=[is_free])
+    aliases = fields.ListField(str, item_validators=[is_free])
+
+
+class Team(models.Base):
+    owner = fields.EmbeddedField(Account)
+
+
+class SyncAccount(models.Base):
+    login = fields.StringField(required=True, validators=[is_free_now])
+
+
+class SyncTeam(models.Base):
+    owner = fields.EmbeddedField(SyncAccount)
+
+
+def test_avalidate():
+    asyncio.run(Account(login="free", aliases=["other"]).avalidate())
+
+    team = Team(owner=Account(login="late"))
+    sync_team = SyncTeam(owner=SyncAccount(login="late"))
+    TAKEN.add("late")
+    try:
+        with pytest.raises(errors.ValidationError) as info:
+            asyncio.run(team.avalidate())
+        with pytest.raises(errors.ValidationError) as sync_info:
+            sync_team.validate()
+    finally:
+        TAKEN.discard("late")
+    assert str(info.value) == str(sync_info.value)
+
+    with pytest.raises(errors.ValidationError) as info:
+        asyncio.run(Account(login="free", aliases=["a", "used", "taken"]).avalidate())
+    assert "'used' is taken." in str(info.value)
+
+
+def test_validate_skips_asynchronous_validators():
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        account = Account(login="taken", aliases=["used"])
+        account.validate()
+        assert list(account.iter_errors()) == []
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        with pytest.raises(errors.ValidationError) as info:
+            asyncio.run(Account(aliases=["free"]).avalidate())
+    assert "required" in str(info.value)
+
+
+def test_items_are_validated_concurrently():
+    counter = Counter()
+
+    class Batch(models.Base):
+        ids = fields.ListField(int, item_validators=[counter, validators.Min(0)])
+
+    batch = Batch(ids=list(range(10)))
+    asyncio.run(batch.avalidate(concurrency=3))
+    assert counter.most == 3
+
+    counter.most = 0
+    asyncio.run(batch.avalidate(concurrency=None))
+    assert counter.most == 10
+
+    with pytest.raises(errors.ValidationError):
+        Batch(ids=[1, -1])
+
+
+def test_asynchronous_validation_of_list_is_not_remembered():
+    account = Account(login="free")
+    account.aliases.append("alias")
+    TAKEN.add("alias")
+    try:
+        with pytest.raises(errors.ValidationError):
+            asyncio.run(account.avalidate())
+        with pytest.raises(errors.ValidationError):
+            asyncio.run(account.avalidate())
+    finally:
+        TAKEN.discard("alias")
+    asyncio.run(account.avalidate())
@@ -0,0 +1,114 @@
+import array
+
+import pytest
+
+from jsonmodels import batches, errors, fields, models, validators
+
+
+class Reading(models.Base):
+    sensor = fields.StringField(required=True, validators=validators.Enum("a", "b"))
+    value = fields.FloatField(validators=[validators.Min(0), validators.Max(100)])
+    count = fields.IntField(name="n")
+    unit = fields.StringField(default="C")
+    tags = fields.ListField(str)
+
+
+RECORDS = [
+    {"sensor": "a", "value": 1.5, "n": 3},
+    {"sensor": "b", "value": 2.0, "tags": ["x"]},
+    {"sensor": "a", "value": 0.5, "count": 1, "unit": "F"},
+]
+
+
+def test_batch_from_structs():
+    batch = Reading.batch_from_structs(RECORDS)
+
+    assert isinstance(batch, batches.ModelBatch)
+    assert len(batch) == 3
+    assert batch.column("value") == array.array("d", [1.5, 2.0, 0.5])
+    assert batch.column("n") == [3, None, 1]
+    assert batch.column("sensor") == ["a", "b", "a"]
+    assert batch.column("sensor")[0] is batch.column("sensor")[2]
+    assert batch.column("unit") == ["C", "C", "F"]
+    with pytest.raises(errors.FieldNotFound):
+        batch.column("unknown")
+
+
+def test_rows_of_batch():
+    batch = Reading.batch_from_structs(RECORDS)
+
+    row = batch[1]
+    assert row.sensor == "b"
+    assert row.value == 2.0
+    assert row.count is None
+    assert row.tags == ["x"]
+    assert batch[-1].count == 1
+    assert [row.sensor for row in batch] == ["a", "b", "a"]
+    assert [name for name, _ in row] == [name for name, _ in Reading()]
+    with pytest.raises(IndexError):
+        batch[3]
+    with pytest.raises(AttributeError):
+        row.sensor = "c"
+
+    model = row.to_model()
+    assert isinstance(model, Reading)
+    assert model.to_struct() == row.to_struct()
+
+    model.tags.append("y")
+    assert row.tags == ["x"]
+
+
+def test_batch_to_structs():
+    batch = Reading.batch_from_structs(RECORDS)
+
+    expected = [Reading(**record).to_struct() for record in RECORDS]
+    assert batch.to_structs() == expected
+    assert [row.to_struct() for row in batch] == expected
+
+
+def test_validation_of_batch():
+    bad_records = [
+        [{"value": 1}],
+        [{"sensor": "a"}, {"sensor": "c"}],
+        [{"sensor": "a", "value": -1}],
+        [{"sensor": "a", "value": 1.0}, {"sensor": "a", "value": 101.0}],
+        [{"sensor": "a", "value": "1"}],
+        [{"sensor": 1}],
+    ]
+    for records in bad_records:
+        with pytest.raises(errors.ValidationError):
+            Reading.batch_from_structs(records)
+
+    with pytest.raises(errors.ValidationError) as info:
+        Reading.batch_from_structs(RECORDS + [{"sensor": "a", "value": 200.0}])
+    assert "row 3" in str(info.value)
+
+    with pytest.raises(errors.ValidationError) as info:
+        Reading.batch_from_structs(
+            [{"sensor": "a", "unit": 1}, {"sensor": "b", "unit": 2}]
+        )
+    assert "Error for field 'unit' in row 0" in str(info.value)
+    with pytest.raises(errors.ValidationError):
+        Reading.batch_from_structs([{"sensor": "a", "unit": 1.5}])
+    assert Reading.batch_from_structs([{"sensor": "a", "value": 1}]).column(
+        "value"
+    ) == array.array("q", [1])
+
+    batch = Reading.batch_from_structs([{"sensor": "c"}], validate=False)
+    assert batch[0].sensor == "c"
+    with pytest.raises(errors.ValidationError):
+        batch.validate()
+
+
+def test_batch_of_nested_models():
+    class Point(models.Base):
+        x = fields.IntField()
+
+    class Shape(models.Base):
+        center = fields.EmbeddedField(Point, required=True)
+
+    batch = Shape.batch_from_structs([{"center": {"x": 1}}, {"center": Point()}])
+    assert batch[0].center.x == 1
+    assert batch.to_structs() == [{"center": {"x": 1}}, {"center": {}}]
+    with pytest.raises(errors.ValidationError):
+        Shape.batch_from_structs([{"center": {"x": 1}}, {}])
@@ -0,0 +1,173 @@
+import pytest
+
+from jsonmodels import errors, fields, models, validators
+
+
+class Item(models.Base):
+    id = fields.IntField()
+    kind = fields.StringField()
+
+
+class Basket(models.Base):
+    items = fields.ListField([Item], index_on=["id", "kind"])
+    others = fields.ListField([Item])
+
+
+def _ids(items):
+    return [item.id for item in items]
+
+
+def test_index_of_collection():
+    basket = Basket(items=[{"id": 1, "kind": "a"}, {"id": 2, "kind": "b"}])
+    items = basket.items
+
+    assert items.get_by("id", 2) is items[1]
+    assert _ids(items.get_all_by("kind", "a")) == [1]
+    assert items.get_all_by("kind", "c") == []
+    with pytest.raises(KeyError):
+        items.get_by("id", 3)
+    with pytest.raises(ValueError):
+        items.get_by("name", 1)
+
+    items.append(Item(id=3, kind="a"))
+    items.insert(0, Item(id=4, kind="a"))
+    items += [Item(id=5, kind="b")]
+    assert _ids(items.get_all_by("kind", "a")) == [4, 1, 3]
+    assert items.get_by("kind", "a").id == 4
+
+    items[0] = Item(id=6, kind="b")
+    items[1:3] = [Item(id=7, kind="c")]
+    assert _ids(items) == [6, 7, 3, 5]
+    assert _ids(items.get_all_by("kind", "b")) == [6, 5]
+    assert items.get_all_by("id", 1) == []
+
+    del items[0]
+    items.pop()
+    items.remove(items.get_by("id", 7))
+    assert _ids(items) == [3]
+    assert items.get_by("kind", "a").id == 3
+    assert items.get_all_by("kind", "b") == []
+
+    items *= 2
+    assert _ids(items.get_all_by("id", 3)) == [3, 3]
+    items.clear()
+    assert items.get_all_by("id", 3) == []
+
+
+def test_index_after_change_of_item():
+    basket = Basket(items=[{"id": 1}, {"id": 2}])
+    items = basket.items
+
+    items[0].id = 3
+    items.reindex()
+    assert items.get_by("id", 3) is items[0]
+    assert items.get_all_by("id", 1) == []
+
+    items[1].id = 4
+    del items[1]
+    assert _ids(items.get_all_by("id", 2)) == []
+
+
+def test_index_of_copies():
+    basket = Basket(items=[{"id": 1}, {"id": 2}])
+
+    copied = basket.copy(deep=True)
+    assert copied.items.get_by("id", 1) is copied.items[0]
+    assert copied.items.get_by("id", 1) is not basket.items[0]
+
+    basket.apply_patch(
+        [
+            {"op": "replace", "path": "/items/0/id", "value": 3},
+            {"op": "add", "path": "/items/-", "value": {"id": 4}},
+        ]
+    )
+    assert _ids(basket.items) == [3, 2, 4]
+    assert basket.items.get_by("id", 3) is basket.items[0]
+    assert basket.items.get_by("id", 4) is basket.items[2]
+    assert copied.items.get_all_by("id", 4) == []
+
+    Basket.accessor("items[1]").set(basket, {"id": 5})
+    assert basket.items.get_by("id", 5) is basket.items[1]
+
+
+def test_not_indexed_collection():
+    basket = Basket(others=[])
+
+    basket.others.append(Item(id=1))
+    with pytest.raises(ValueError):
+        basket.others.get_by("id", 1)
+
+
+def test_indexed_collection_validates_items():
+    basket = Basket()
+
+    with pytest.raises(errors.ValidationError):
+        basket.items.append("item")
+    with pytest.raises(errors.ValidationError):
+        basket.items[0:0] = [Item(), "item"]
+    assert basket.items == []
+    assert basket.items.get_all_by("id", None) == []
+
+
+def test_all_mutators_validate_items():
+    class Names(models.Base):
+        names = fields.ListField(str, item_validators=[validators.Length(1)])
+
+    names = Names(names=["a"]).names
+    bad_changes = [
+        lambda: names.append(1),
+        lambda: names.extend(["b", 2]),
+        lambda: names.extend(["b", ""]),
+        lambda: names.insert(0, ""),
+        lambda: names.__iadd__(["b", 3]),
+        lambda: names.__setitem__(0, 4),
+        lambda: names.__setitem__(slice(0, 1), ["b", 5]),
+    ]
+    for change in bad_changes:
+        with pytest.raises(errors.ValidationError):
+            change()
+        assert names == ["a"]
+
+    names.extend(["b", "c"])
+    names.insert(0, "d")
+    names += ["e"]
+    names[1:3] = ["f"]
+    assert names == ["d", "f", "c", "e"]
+
+
+def test_validation_of_new_items_only():
+    checked = []
+
+    def check(value):
+        checked.append(value)
+
+    class Numbers(models.Base):
+        numbers = fields.ListField(int, item_validators=[check])
+
+    model = Numbers(numbers=[1, 2, 3])
+    assert checked == [1, 2, 3]
+
+    model.validate()
+    assert checked == [1, 2, 3]
+
+    list.extend(model.numbers, [4, 5])
+    model.numbers.append(6)
+    model.validate()
+    assert checked == [1, 2, 3, 6, 4, 5, 6]
+
+    list.append(model.numbers, 7)
+    del model.numbers[1]
+    model.validate()
+    assert checked[7:] == [3, 4, 5, 6, 7]
+
+    copied = model.copy(deep=True)
+    copied.validate()
+    assert len(checked) == 12
+
+
+def test_parsed_list_is_collection():
+    model = Basket(others=[{"id": 1}])
+
+    assert isinstance(model.others, type(model.items))
+    with pytest.raises(errors.ValidationError):
+        model.others.append("item")
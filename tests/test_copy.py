@@ -0,0 +1,123 @@
+import copy
+import datetime
+
+import pytest
+
+from jsonmodels import errors, fields, models, validators
+
+
+class Tag(models.Base, frozen=True):
+    name = fields.StringField()
+
+
+class Wheel(models.Base):
+    pressure = fields.FloatField(validators=validators.Min(1), nullable=True)
+
+
+class Car(models.Base):
+    brand = fields.StringField(required=True)
+    made = fields.DateTimeField()
+    wheels = fields.ListField([Wheel])
+    spare = fields.EmbeddedField(Wheel)
+    tag = fields.EmbeddedField(Tag)
+    extra = fields.DictField()
+
+
+class Node(models.Base):
+    children = fields.ListField(["Node"])
+
+
+def _car():
+    return Car(
+        brand="Fiat",
+        made=datetime.datetime(2020, 1, 2, 3, 4),
+        wheels=[Wheel(pressure=2), Wheel(pressure=2.5)],
+        spare={"pressure": 3},
+        tag=Tag(name="red"),
+        extra={"owners": ["Bob"]},
+    )
+
+
+def test_copy():
+    car = _car()
+    clone = car.copy()
+
+    assert clone == car
+    assert clone is not car
+    assert clone.wheels is car.wheels
+    assert clone.spare is car.spare
+
+    clone.brand = "Opel"
+    assert car.brand == "Fiat"
+
+
+def test_deep_copy():
+    car = _car()
+    clone = car.copy(deep=True)
+
+    assert clone == car
+    assert clone.wheels is not car.wheels
+    assert clone.wheels[0] is not car.wheels[0]
+    assert clone.spare is not car.spare
+    assert clone.extra["owners"] is not car.extra["owners"]
+    assert clone.tag is car.tag
+
+    clone.wheels[0].pressure = 5
+    clone.wheels.append(Wheel())
+    assert car.wheels[0].pressure == 2
+    assert len(car.wheels) == 2
+
+    assert copy.deepcopy(car) == car
+    assert copy.copy(car).wheels is car.wheels
+
+
+def test_deep_copy_keeps_shared_values_shared():
+    car = _car()
+    car.spare = car.wheels[0]
+    owners = car.extra["owners"]
+    car.extra["drivers"] = owners
+
+    cars = copy.deepcopy([car, car])
+    clone = cars[0]
+    assert cars[1] is clone
+    assert clone.spare is clone.wheels[0]
+    assert clone.spare is not car.spare
+    assert clone.extra["drivers"] is clone.extra["owners"]
+
+    node = Node()
+    node.children.append(Node())
+    node.children[0].children.append(node)
+    clone = copy.deepcopy(node)
+    assert clone.children[0].children[0] is clone
+
+
+def test_copy_with_update():
+    car = _car()
+
+    clone = car.copy(deep=True, update={"brand": "Opel", "spare": {"pressure": 4}})
+    assert clone.brand == "Opel"
+    assert clone.spare.pressure == 4
+    assert car.brand == "Fiat"
+    assert car.spare.pressure == 3
+
+    with pytest.raises(errors.ValidationError):
+        car.copy(update={"spare": {"pressure": 0}})
+
+
+def test_copy_keeps_unset_fields_unset():
+    car = Car()
+    clone = car.copy()
+
+    with pytest.raises(errors.ValidationError):
+        clone.validate()
+    assert clone.copy(update={"brand": "Fiat"}) == Car(brand="Fiat")
+
+
+def test_copy_of_frozen_model():
+    tag = Tag(name="red")
+    assert hash(tag.copy()) == hash(tag)
+
+    clone = tag.copy(update={"name": "blue"})
+    assert clone.name == "blue"
+    with pytest.raises(errors.FrozenModelError):
+        clone.name = "green"
@@ -1,4 +1,5 @@
 import datetime
+import json
 
 import pytest
 
@@ -326,3 +327,150 @@ def test_default_value():
     assert p.last_ate == default_last_ate
     assert p.birthday == default_birthday
     assert p.time_of_death == default_time_of_death
+
+
+class Event(models.Base):
+    id = fields.IntField(required=True)
+    title = fields.StringField(name="event-title")
+    start = fields.DateTimeField()
+    attendees = fields.ListField(str)
+
+
+EVENT = {
+    "id": 1,
+    "event-title": "Party",
+    "start": "2020-01-02T20:00:00",
+    "attendees": ["Bob", "Ann"],
+    "unknown": "value",
+}
+
+
+def test_from_struct():
+    event = Event.from_struct(EVENT)
+    assert event == Event(**EVENT)
+
+    event = Event.from_struct(EVENT, only=["id", "event-title"])
+    assert event.__dict__["_raw_values"] == {
+        Event.start: ("start", "2020-01-02T20:00:00"),
+        Event.attendees: ("attendees", ["Bob", "Ann"]),
+    }
+    assert event.id == 1
+    assert event.title == "Party"
+
+    assert event.start == datetime.datetime(2020, 1, 2, 20)
+    assert Event.start not in event.__dict__["_raw_values"]
+    assert event == Event(**EVENT)
+    assert event.to_struct() == Event(**EVENT).to_struct()
+
+
+def test_from_struct_without_raw_values():
+    event = Event.from_struct(EVENT, only=["title"], keep_raw=False)
+
+    assert event.title == "Party"
+    assert event.start is None
+    with pytest.raises(errors.ValidationError):
+        event.validate()
+
+
+def test_from_struct_defers_errors():
+    data = dict(EVENT, attendees="Bob")
+    with pytest.raises(errors.ValidationError):
+        Event(**data)
+
+    event = Event.from_struct(data, only=["id"])
+    assert event.id == 1
+    with pytest.raises(errors.ValidationError):
+        event.attendees
+    with pytest.raises(errors.ValidationError):
+        event.validate()
+
+    assert [error.path for error in event.iter_errors()] == [("attendees",)]
+    assert Event.start in event.__dict__["_raw_values"]
+
+    event.attendees = ["Bob"]
+    assert [error.path for error in event.iter_errors()] == []
+
+
+def test_from_struct_copy():
+    event = Event.from_struct(EVENT, only=["id"])
+    clone = event.copy()
+
+    assert clone.title == "Party"
+    assert Event.title in event.__dict__["_raw_values"]
+    assert event.title == "Party"
+
+
+def test_from_struct_with_wrong_names():
+    with pytest.raises(errors.FieldNotFound):
+        Event.from_struct(EVENT, only=["unknown"])
+
+
+def test_from_json():
+    document = json.dumps(EVENT)
+    assert Event.from_json(document) == Event(**EVENT)
+
+    event = Event.from_json(document.encode(), lazy=True)
+    assert event.title == "Party"
+    assert list(event.__dict__["_raw_values"].spans.spans) == list(EVENT)
+    assert Event.id in event.__dict__["_raw_values"]
+    assert event.to_struct() == Event(**EVENT).to_struct()
+    assert event == Event(**EVENT)
+
+    clone = Event.from_json(document, lazy=True).copy()
+    assert clone.attendees == ["Bob", "Ann"]
+
+
+def test_from_json_scans_values():
+    document = rb"""
+        {"id": 2, "extra": [{"y": "{\\"}, [[1], {}]], "attendees": ["x]", "[\""],
+         "event-title": "Par\u0074y", "start": null}"""
+    event = Event.from_json(document, lazy=True)
+
+    assert event.id == 2
+    assert event.title == "Party"
+    assert event.start is None
+    assert event.attendees == ["x]", '["']
+    assert event.__dict__["_raw_values"].spans.find("missing") is None
+
+    broken = Event.from_json(b'{"id": 2, "event-title": "Party", broken', lazy=True)
+    with pytest.raises(ValueError):
+        broken.id
+    with pytest.raises(ValueError):
+        Event.from_json(b"[1, 2]", lazy=True)
+    assert Event.from_json(" {} ", lazy=True).title is None
+
+
+def test_from_json_like_eager_one():
+    documents = [
+        '{"id": 1, "event-title": "Party", "id": 2, "event-title": "Gig"}',
+        '{"event-title": "Party", "title": "Gig", "id": 1}',
+        '{"title": "Gig", "event-title": "Party", "id": 1}',
+        '{"title": "Gig", "id": 1, "title": "Talk", "event-title": "Party"}',
+    ]
+    for document in documents:
+        eager = Event.from_json(document)
+        lazy = Event.from_json(document, lazy=True)
+        assert lazy.title == eager.title
+        assert lazy.to_struct() == eager.to_struct()
+        assert lazy == eager
+
+
+def test_from_json_decodes_value_once(monkeypatch):
+    event = Event.from_json(json.dumps(EVENT), lazy=True)
+    clone = event.copy()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(json, "loads", None)
+        event.attendees.append("Eve")
+    # Value taken by model isn't shared with its copy.
+    assert clone.attendees == ["Bob", "Ann"]
+    assert event.attendees == ["Bob", "Ann", "Eve"]
+
+
+def test_from_json_defers_errors():
+    event = Event.from_json(json.dumps(dict(EVENT, attendees="Bob")), lazy=True)
+
+    assert event.title == "Party"
+    assert [error.path for error in event.iter_errors()] == [("attendees",)]
+    with pytest.raises(errors.ValidationError):
+        event.validate()
@@ -0,0 +1,132 @@
+import pytest
+
+from jsonmodels import errors, fields, models
+
+
+class File(models.Base):
+    kind = fields.StringField(default="file")
+    name = fields.StringField(required=True)
+    size = fields.IntField()
+
+
+class Directory(models.Base):
+    kind = fields.StringField(default="directory")
+    name = fields.StringField(required=True)
+    children = fields.ListField(["Directory", File], discriminator="kind")
+
+
+class Filesystem(models.Base):
+    root = fields.EmbeddedField([Directory, File], discriminator="kind")
+
+
+TREE = {
+    "root": {
+        "kind": "directory",
+        "name": "/",
+        "children": [
+            {"kind": "file", "name": "vmlinuz", "size": 42},
+            {
+                "kind": "directory",
+                "name": "home",
+                "children": [{"kind": "file", "name": "notes.txt"}],
+            },
+        ],
+    }
+}
+
+
+def test_dispatch_by_discriminator():
+    filesystem = Filesystem(**TREE)
+
+    root = filesystem.root
+    assert isinstance(root, Directory)
+    assert [type(child) for child in root.children] == [File, Directory]
+    assert root.children[0].size == 42
+    assert isinstance(root.children[1].children[0], File)
+
+
+def test_dispatch_with_wrong_discriminator():
+    with pytest.raises(errors.ValidationError):
+        Filesystem(root={"name": "/"})
+
+    with pytest.raises(errors.ValidationError):
+        Filesystem(root={"kind": "link", "name": "/"})
+
+    with pytest.raises(errors.ValidationError):
+        Directory(name="/", children=[{"kind": ["file"], "name": "a"}])
+
+
+def test_discriminator_in_struct():
+    assert Filesystem(**TREE).to_struct() == TREE
+
+    directory = Directory(name="/", children=[File(name="a", kind=None)])
+    assert directory.to_struct()["children"] == [{"kind": "file", "name": "a"}]
+
+
+def test_discriminator_in_validate_struct():
+    Filesystem.validate_struct(TREE)
+    assert Filesystem.check_struct(TREE) == []
+
+    data = {"root": {"kind": "directory", "name": "/", "children": [{"kind": "x"}]}}
+    with pytest.raises(errors.ValidationError) as error:
+        Filesystem(**data)
+    with pytest.raises(errors.ValidationError) as struct_error:
+        Filesystem.validate_struct(data)
+    assert str(struct_error.value) == str(error.value)
+
+    [error] = Filesystem.check_struct(data)
+    assert error.path == ("root", "children", 0)
+
+
+def test_discriminator_in_schema():
+    class Circle(models.Base):
+        shape = fields.StringField(default="circle")
+        radius = fields.FloatField(required=True)
+
+    class Square(models.Base):
+        shape = fields.StringField(default="square")
+
+    class Drawing(models.Base):
+        main = fields.EmbeddedField([Circle, Square], discriminator="shape")
+        others = fields.ListField([Square], discriminator="shape")
+
+    schema = Drawing.to_json_schema()
+
+    circle, square = schema["properties"]["main"]["oneOf"]
+    assert circle["properties"]["shape"] == {
+        "type": "string",
+        "default": "circle",
+        "const": "circle",
+    }
+    assert circle["required"] == ["radius", "shape"]
+    assert square["properties"]["shape"]["const"] == "square"
+    assert schema["properties"]["others"]["items"] == {
+        "allOf": [
+            "#/definitions/tests_test_discriminator_square",
+            {"properties": {"shape": {"const": "square"}}, "required": ["shape"]},
+        ]
+    }
+    square_definition = schema["definitions"]["tests_test_discriminator_square"]
+    assert "const" not in square_definition["properties"]["shape"]
+
+
+def test_discriminator_requires_field_with_default():
+    class Link(models.Base):
+        kind = fields.StringField()
+
+    class Wrong(models.Base):
+        target = fields.EmbeddedField([File, Link], discriminator="kind")
+
+    with pytest.raises(ValueError):
+        Wrong()
+
+
+def test_discriminator_values_must_be_unique():
+    class OtherFile(models.Base):
+        kind = fields.StringField(default="file")
+
+    class Wrong(models.Base):
+        target = fields.ListField([File, OtherFile], discriminator="kind")
+
+    with pytest.raises(ValueError):
+        Wrong()
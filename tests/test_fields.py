@@ -1,4 +1,8 @@
-from jsonmodels import fields, models, validators
+import array
+
+import pytest
+
+from jsonmodels import errors, fields, models, validators
 
 
 def test_bool_field():
@@ -51,3 +55,54 @@ def test_dict_field():
 
     person.extra = {"extra": True}
     assert person.extra == {"extra": True}
+
+
+def test_numeric_array_field():
+    class Series(models.Base):
+        values = fields.NumericArrayField(
+            "f8", [validators.Min(0), validators.Max(10)], required=True
+        )
+        counts = fields.NumericArrayField("i2", default=[1, 2])
+
+    series = Series(values=[1, 2.5, 10])
+    assert series.values == array.array("d", [1, 2.5, 10])
+    assert series.counts.typecode == "h"
+    assert series.counts is not Series().counts
+    assert series.to_struct() == {"values": [1.0, 2.5, 10.0], "counts": [1, 2]}
+
+    values = array.array("d", [3])
+    series.values = values
+    assert series.values is values
+    series.values = (4, 5)
+    assert series.values.tolist() == [4, 5]
+
+    with pytest.raises(errors.ValidationError):
+        series.values = [1, 11]
+    with pytest.raises(errors.ValidationError):
+        series.values = array.array("d", [-1])
+    with pytest.raises(errors.ValidationError):
+        series.values = "123"
+    with pytest.raises(TypeError):
+        series.counts = [1.5]
+    with pytest.raises(ValueError):
+        series.counts = [2**20]
+    with pytest.raises(ValueError):
+        fields.NumericArrayField("x8")
+
+    assert [(error.path, error.code) for error in Series(counts=[]).iter_errors()] == [
+        (("values",), "required")
+    ]
+    assert [
+        (error.path, error.code)
+        for error in Series.check_struct({"values": [1, -1, 2, 11]})
+    ] == [(("values", 1), "minimum"), (("values", 3), "maximum")]
+
+
+def test_numeric_array_in_frozen_model():
+    class Point(models.Base, frozen=True):
+        coordinates = fields.NumericArrayField("i8")
+
+    assert len({Point(coordinates=[1, 2]), Point(coordinates=[1, 2])}) == 1
+    assert Point(coordinates=[1]).copy(deep=True) == Point(coordinates=[1])
+    with pytest.raises(errors.FrozenModelError):
+        Point(coordinates=[1]).coordinates[0] = 2
@@ -0,0 +1,107 @@
+import pytest
+
+from jsonmodels import fields, interning, models
+
+
+class Currency(models.Base, frozen=True):
+    code = fields.StringField(required=True)
+
+
+class Price(models.Base, frozen=True):
+    amount = fields.IntField()
+    currency = fields.EmbeddedField(Currency)
+
+
+class Order(models.Base):
+    total = fields.EmbeddedField(Price)
+    items = fields.ListField([Price])
+
+
+DATA = {
+    "total": {"amount": 3, "currency": {"code": "EUR"}},
+    "items": [
+        {"amount": 1, "currency": {"code": "EUR"}},
+        {"amount": 2, "currency": {"code": "EUR"}},
+        {"amount": 1, "currency": {"code": "EUR"}},
+    ],
+}
+
+
+def test_scoped_interning():
+    with interning.scope(Currency, Price) as tables:
+        order = Order(**DATA)
+        other_order = Order(**DATA)
+
+    currencies = {id(price.currency) for price in order.items + [order.total]}
+    assert len(currencies) == 1
+    assert order.items[0] is order.items[2]
+    assert order.items[0] is not order.items[1]
+    assert other_order.total is order.total
+
+    # Currencies are parsed only for prices, which weren't seen before.
+    assert tables[Currency].hits == 2
+    assert tables[Currency].misses == 1
+    assert tables[Price].hits == 5
+    assert tables[Price].hit_rate == 5 / 8
+    assert tables[Price].saved_bytes > 0
+
+    assert Order(**DATA).total is not order.total
+
+
+def test_global_interning():
+    table = interning.intern_globally(Currency, maxsize=2)
+    try:
+        for code in ["EUR", "USD", "EUR", "PLN", "USD"]:
+            Price(currency={"code": code})
+        assert table.hits == 1
+        assert [currency.code for currency in table] == ["PLN", "USD"]
+
+        with interning.scope(Currency) as tables:
+            Price(currency={"code": "PLN"})
+        assert tables[Currency].misses == 1
+        assert table.hits == 1
+    finally:
+        interning.stop_interning(Currency)
+
+    assert interning.get_table(Currency) is None
+
+
+def test_only_frozen_models_can_be_interned():
+    with pytest.raises(TypeError):
+        interning.intern_globally(Order)
+    with pytest.raises(TypeError):
+        with interning.scope(Order):
+            pass
+
+
+def test_interning_of_instances():
+    class Tagged(models.Base, frozen=True):
+        tags = fields.ListField(str)
+        extra = fields.DictField()
+
+    table = interning.InternTable()
+    first = table.intern(Tagged(tags=["a"]))
+    assert table.intern(Tagged(tags=["a"])) is first
+    assert table.intern(Tagged(tags=["b"])) is not first
+
+    created = table.create(Tagged, {"tags": ["a"]})
+    assert created is not first
+    assert table.create(Tagged, {"tags": ["a"]}) is created
+
+    created = table.create(Tagged, {"extra": {"a": {1, 2}}})
+    assert table.create(Tagged, {"extra": {"a": {1, 2}}}) is not created
+    assert len(table) == 3
+
+
+def test_values_of_different_types_are_not_interned_together():
+    class Measure(models.Base, frozen=True):
+        value = fields.FloatField()
+        extra = fields.DictField()
+
+    table = interning.InternTable()
+    structs = [{"value": 1.0}, {"value": 1}, {"extra": {"a": 1.0}}, {"extra": {"a": 1}}]
+    measures = [table.create(Measure, struct) for struct in structs]
+    assert [measure.to_struct() for measure in measures] == structs
+    assert [type(measure.value) for measure in measures[:2]] == [float, int]
+    assert type(measures[3].extra["a"]) is int
+    assert table.misses == 4
@@ -517,3 +517,144 @@ def test_equality_missing_required_field():
     assert Model(age=1) == Model(age=1)
     assert Model(age=1) != Model(age=2)
     assert Model(name="William", age=1) != Model(age=1)
+
+
+class FrozenPoint(models.Base, frozen=True):
+    x = fields.IntField()
+    y = fields.IntField()
+
+
+class FrozenPath(models.Base, frozen=True):
+    name = fields.StringField(required=True)
+    start = fields.EmbeddedField(FrozenPoint)
+    points = fields.ListField([FrozenPoint])
+    tags = fields.DictField()
+
+
+def test_frozen_model_cant_be_changed():
+    point = FrozenPoint(x=1, y=2)
+
+    with pytest.raises(errors.FrozenModelError):
+        point.x = 3
+    with pytest.raises(errors.FrozenModelError):
+        point.populate(x=3)
+    with pytest.raises(errors.FrozenModelError):
+        point.other = 3
+    assert point.x == 1
+
+    with pytest.raises(errors.ValidationError):
+        FrozenPath(name=1)
+
+
+def test_frozen_model_is_hashable():
+    def path():
+        return FrozenPath(
+            name="a",
+            start=FrozenPoint(x=0),
+            points=[FrozenPoint(x=1, y=2), FrozenPoint(x=2, y=3)],
+            tags={"color": ["red"]},
+        )
+
+    assert hash(path()) == hash(path())
+    assert path() == path()
+    assert len({path(), path(), FrozenPath(name="b")}) == 2
+    assert {path(): 1}[path()] == 1
+
+    other = FrozenPath(name="a", points=[FrozenPoint(x=2, y=3), FrozenPoint(x=1)])
+    assert hash(other) != hash(path())
+    assert other != path()
+
+    # Required field, which is missing, is compared as `None`.
+    assert FrozenPath() == FrozenPath()
+    assert hash(FrozenPath()) == hash(FrozenPath())
+
+
+def test_values_of_frozen_model_are_read_only():
+    path = FrozenPath(
+        name="a", points=[FrozenPoint(x=1)], tags={"colors": ["red"], "size": 1}
+    )
+    hash_before = hash(path)
+
+    with pytest.raises(errors.FrozenModelError):
+        path.points.append(FrozenPoint(x=2))
+    with pytest.raises(errors.FrozenModelError):
+        path.points[0] = FrozenPoint(x=2)
+    with pytest.raises(errors.FrozenModelError):
+        path.tags["size"] = 2
+    with pytest.raises(errors.FrozenModelError):
+        path.tags["colors"].append("blue")
+    assert hash(path) == hash_before
+    assert path.to_struct() == {
+        "name": "a",
+        "points": [{"x": 1}],
+        "tags": {"colors": ["red"], "size": 1},
+    }
+
+    struct = path.to_struct()
+    struct["tags"]["colors"].append("blue")
+    points = path.points.copy()
+    points.append(FrozenPoint(x=2))
+    assert len(path.points) == 1
+    assert path.copy(deep=True).points == [FrozenPoint(x=1)]
+    with pytest.raises(errors.FrozenModelError):
+        path.copy(deep=True).points.append(FrozenPoint(x=2))
+    with pytest.raises(errors.FrozenModelError):
+        FrozenPath().points.append(FrozenPoint(x=2))
+
+
+def test_frozen_model_embeds_only_frozen_models():
+    class Point(models.Base):
+        x = fields.IntField()
+
+    with pytest.raises(TypeError):
+
+        class Shape(models.Base, frozen=True):
+            center = fields.EmbeddedField(Point)
+
+    with pytest.raises(TypeError):
+
+        class Polygon(models.Base, frozen=True):
+            points = fields.ListField([Point, FrozenPoint])
+
+    class Line(models.Base):
+        points = fields.ListField(Point)
+
+    with pytest.raises(TypeError):
+
+        class FrozenLine(Line, frozen=True):
+            pass
+
+    class Figure(models.Base, frozen=True):
+        parts = fields.ListField(["tests.test_jsonmodels.NotFrozenPart"])
+
+    with pytest.raises(TypeError):
+        Figure()
+
+
+class NotFrozenPart(models.Base):
+    x = fields.IntField()
+
+
+def test_only_frozen_models_are_hashable():
+    class Point(models.Base):
+        x = fields.IntField()
+
+    class NotFrozenPoint(FrozenPoint, frozen=False):
+        pass
+
+    class FrozenPoint3D(FrozenPoint):
+        z = fields.IntField()
+
+    with pytest.raises(TypeError):
+        hash(Point())
+    with pytest.raises(TypeError):
+        hash(NotFrozenPoint())
+
+    point = NotFrozenPoint(x=1)
+    point.x = 2
+    assert point.x == 2
+
+    with pytest.raises(errors.FrozenModelError):
+        FrozenPoint3D(x=1).z = 3
+    assert hash(FrozenPoint3D(z=1)) == hash(FrozenPoint3D(z=1))
+    assert FrozenPoint3D(z=1) != FrozenPoint(x=1)
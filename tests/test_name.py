@@ -93,3 +93,52 @@ def test_cross_names():
     foo = Foo(one=1, two=2)
     assert foo.one == 2
     assert foo.two == 1
+
+
+def test_structure_names_go_first():
+    class Foo(models.Base):
+        one = fields.IntField(name="two")
+        two = fields.IntField(name="three")
+
+    foo = Foo(two=2, three=3)
+    assert foo.one == 2
+    assert foo.two == 3
+
+    foo = Foo(one=1, two=2, three=3)
+    assert foo.one == 1
+    assert foo.two == 3
+
+
+def test_fields_index():
+    class Human(models.Base):
+        name = fields.StringField()
+        surname = fields.StringField(name="second-name")
+
+    human = Human()
+    index = Human._get_fields_index()
+    surname = human.get_field("surname")
+    assert index.by_name == {"name": human.get_field("name"), "surname": surname}
+    assert index.by_structure_name["second-name"] == ("surname", surname)
+    assert index.structure_names["surname"] == "second-name"
+    assert Human._get_fields_index() is index
+
+
+def test_fields_index_follows_changes_of_class():
+    class Human(models.Base):
+        name = fields.StringField()
+
+    class Child(Human):
+        pass
+
+    assert [name for name, _ in Child.iterate_over_fields()] == ["name"]
+
+    Human.age = fields.IntField(name="years")
+    assert [name for name, _ in Child.iterate_over_fields()] == ["age", "name"]
+    assert Child(years=3).age == 3
+
+    del Human.age
+    assert [name for name, _ in Child.iterate_over_fields()] == ["name"]
+
+    Human.name = 5
+    assert list(Child.iterate_over_fields()) == []
+    assert Child(name="x").to_struct() == {}
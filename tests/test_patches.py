@@ -0,0 +1,227 @@
+import datetime
+
+import pytest
+
+from jsonmodels import errors, fields, models, validators
+
+from .utilities import Line, Order, Product, make_order
+
+
+def test_diff_of_equal_models():
+    order = make_order()
+
+    assert order.diff(order) == []
+    assert order.diff(order.copy()) == []
+    assert order.diff(order.copy(deep=True)) == []
+    assert order.diff(make_order()) == []
+
+
+def test_diff():
+    order = make_order()
+    other = order.copy(
+        update={
+            "number": 2,
+            "created": datetime.datetime(2021, 1, 2),
+            "shipping": None,
+            "extra": {"gift": True},
+        }
+    )
+
+    assert order.diff(other) == [
+        {"op": "replace", "path": "/created", "value": "2021-01-02T00:00:00"},
+        {"op": "add", "path": "/extra", "value": {"gift": True}},
+        {"op": "replace", "path": "/order-number", "value": 2},
+        {"op": "remove", "path": "/shipping"},
+    ]
+
+
+def test_diff_of_nested_values():
+    order = make_order()
+    other = order.copy()
+    other.lines = [
+        order.lines[0],
+        Line(id=2, product=Product(sku="B", price=3), quantity=2),
+        Line(product=Product(sku="C")),
+    ]
+    other.tags = []
+
+    assert order.diff(other) == [
+        {"op": "replace", "path": "/lines/1/product/price", "value": 3.0},
+        {"op": "add", "path": "/lines/-", "value": {"product": {"sku": "C"}}},
+        {"op": "remove", "path": "/tags/0"},
+    ]
+    assert other.diff(order) == [
+        {"op": "replace", "path": "/lines/1/product/price", "value": 2.0},
+        {"op": "remove", "path": "/lines/2"},
+        {"op": "add", "path": "/tags/-", "value": "new"},
+    ]
+
+
+def test_diff_skips_shared_values():
+    order = make_order()
+    other = order.copy()
+    other.number = 2
+
+    class Untouchable(Line):
+        def __ne__(self, other):
+            raise AssertionError("Shared value was compared.")
+
+    order.lines.append(Untouchable())
+    assert order.diff(other) == [
+        {"op": "replace", "path": "/order-number", "value": 2},
+    ]
+
+
+def test_diff_of_different_models():
+    with pytest.raises(TypeError):
+        Order().diff(Line())
+
+
+def test_apply_patch():
+    order = make_order()
+    lines = order.lines
+    shipping = order.shipping
+
+    order.apply_patch(
+        [
+            {"op": "replace", "path": "/order-number", "value": 2},
+            {"op": "replace", "path": "/lines/1/product/price", "value": 3},
+            {"op": "add", "path": "/lines/-", "value": {"quantity": 3}},
+            {"op": "remove", "path": "/tags/0"},
+            {"op": "add", "path": "/extra", "value": {"gift": {"wrap": "red"}}},
+            {"op": "copy", "from": "/extra/gift", "path": "/extra/card"},
+            {"op": "move", "from": "/lines/0", "path": "/lines/-"},
+            {"op": "test", "path": "/lines/2/product/sku", "value": "A"},
+        ]
+    )
+
+    assert order.number == 2
+    assert [line.quantity for line in order.lines] == [2, 3, 1]
+    assert order.lines[0].product.price == 3
+    assert isinstance(order.lines[1], Line)
+    assert order.tags == []
+    assert order.extra == {"gift": {"wrap": "red"}, "card": {"wrap": "red"}}
+
+    # Changed values were copied, others are still shared.
+    assert order.lines is not lines
+    assert lines[1].product.price == 2
+    assert order.shipping is shipping
+
+
+def test_apply_patch_is_atomic():
+    order = make_order()
+    struct = order.to_struct()
+
+    bad_patches = [
+        [{"op": "replace", "path": "/lines/0/product/sku", "value": 1}],
+        [{"op": "remove", "path": "/lines/0/product/sku"}],
+        [{"op": "remove", "path": "/lines/5"}],
+        [{"op": "add", "path": "/lines/01", "value": {}}],
+        [{"op": "add", "path": "/unknown", "value": 1}],
+        [{"op": "add", "path": "/order-number/x", "value": 1}],
+        [{"op": "add", "path": "/lines/-", "value": "line"}],
+        [{"op": "test", "path": "/tags", "value": []}],
+        [{"op": "jump", "path": "/tags"}],
+        [{"op": "add", "path": "/tags/-"}],
+        [{"op": "replace", "path": "", "value": {}}],
+    ]
+    for operations in bad_patches:
+        operations.insert(0, {"op": "add", "path": "/tags/-", "value": "old"})
+        operations.insert(0, {"op": "replace", "path": "/lines/0/quantity", "value": 9})
+        with pytest.raises(
+            (errors.ValidationError, errors.FieldNotFound, ValueError, TypeError)
+        ):
+            order.apply_patch(operations)
+        assert order.to_struct() == struct
+
+
+def test_apply_patch_validates_changed_values():
+    class Limited(models.Base):
+        lines = fields.ListField([Line], validators=validators.Length(maximum_value=1))
+        line = fields.EmbeddedField(Line, required=True)
+
+    limited = Limited(lines=[], line=Line(quantity=1))
+    limited.apply_patch([{"op": "add", "path": "/lines/-", "value": {}}])
+    with pytest.raises(errors.ValidationError):
+        limited.apply_patch([{"op": "add", "path": "/lines/-", "value": {}}])
+    with pytest.raises(errors.ValidationError):
+        limited.apply_patch([{"op": "remove", "path": "/line"}])
+    assert len(limited.lines) == 1
+
+
+def test_merge_patch():
+    order = make_order()
+    order.merge_patch(
+        {
+            "order-number": 3,
+            "shipping": {"price": None},
+            "tags": ["a", "b"],
+            "extra": {"gift": True},
+            "created": None,
+        }
+    )
+
+    assert order.number == 3
+    assert order.shipping.sku == "S"
+    assert order.shipping.price is None
+    assert order.tags == ["a", "b"]
+    assert order.created is None
+
+    order.merge_patch({"extra": {"gift": None, "card": "Hi"}})
+    assert order.extra == {"card": "Hi"}
+
+    struct = order.to_struct()
+    with pytest.raises(errors.ValidationError):
+        order.merge_patch({"order-number": 4, "shipping": {"sku": None}})
+    with pytest.raises(errors.FieldNotFound):
+        order.merge_patch({"order-number": 4, "unknown": 1})
+    assert order.to_struct() == struct
+
+
+def test_patch_of_frozen_model():
+    class Point(models.Base, frozen=True):
+        x = fields.IntField()
+
+    class Shape(models.Base):
+        center = fields.EmbeddedField(Point)
+
+    shape = Shape(center=Point(x=1))
+    center = shape.center
+    shape.apply_patch([{"op": "replace", "path": "/center/x", "value": 2}])
+    assert shape.center.x == 2
+    assert center.x == 1
+
+    with pytest.raises(errors.FrozenModelError):
+        center.merge_patch({"x": 3})
+
+
+def test_patch_of_list_in_frozen_model():
+    class Tags(models.Base, frozen=True):
+        names = fields.ListField(str)
+
+    class Post(models.Base):
+        tags = fields.EmbeddedField(Tags)
+
+    post = Post(tags=Tags(names=["a"]))
+    tags = post.tags
+    post.apply_patch([{"op": "add", "path": "/tags/names/-", "value": "b"}])
+    assert post.tags.names == ["a", "b"]
+    assert tags.names == ["a"]
+    with pytest.raises(errors.FrozenModelError):
+        post.tags.names.append("c")
+
+
+def test_patch_reverts_diff():
+    order = make_order()
+    other = order.copy(deep=True)
+    other.apply_patch(
+        [
+            {"op": "replace", "path": "/lines/1/quantity", "value": 5},
+            {"op": "remove", "path": "/lines/0"},
+            {"op": "add", "path": "/tags/0", "value": "first"},
+        ]
+    )
+
+    order.apply_patch(order.diff(other))
+    assert order == other
+    assert order.diff(other) == []
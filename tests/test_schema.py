@@ -1,6 +1,6 @@
 import pytest
 
-from jsonmodels import builders, errors, fields, models, validators
+from jsonmodels import builders, errors, fields, models, parsers, validators
 from jsonmodels.utilities import compare_schemas
 
 from .utilities import get_fixture
@@ -400,3 +400,109 @@ def test_primitives():
         assert b.build() == {"type": [jstype, "null"], "default": 0}
         b = builders.PrimitiveBuilder(pytpe, nullable=True, default=0)
         assert b.build() == {"type": [jstype, "null"], "default": 0}
+
+
+def test_builders_share_root_state():
+    class Person(models.Base):
+        name = fields.StringField()
+
+    root = builders.ObjectBuilder(Person)
+    child = builders.ListBuilder(root)
+    nested = builders.ObjectBuilder(Person, child)
+
+    assert nested.root is root
+    assert root.count_type(Person) == 2
+    assert nested.get_builder(Person) is root
+    assert nested.is_definition
+
+
+def test_deep_graph_with_shared_model():
+    class Leaf(models.Base):
+        name = fields.StringField()
+
+    model = Leaf
+    for index in range(100):
+        model = type(
+            f"Node{index}",
+            (models.Base,),
+            {"child": fields.EmbeddedField(model), "leaf": fields.EmbeddedField(Leaf)},
+        )
+
+    schema = model.to_json_schema()
+
+    leaf_name = "tests_test_schema_leaf"
+    assert list(schema["definitions"]) == [leaf_name]
+    assert schema["properties"]["leaf"] == f"#/definitions/{leaf_name}"
+    node = schema
+    for _ in range(100):
+        node = node["properties"]["child"]
+    assert node == schema["definitions"][leaf_name]
+
+
+def test_schema_bundle():
+    class Toy(models.Base):
+        name = fields.StringField(required=True)
+
+    class Kid(models.Base):
+        toys = fields.ListField(Toy)
+
+    class Parent(models.Base):
+        kid = fields.EmbeddedField(Kid, nullable=True)
+        toy = fields.EmbeddedField(Toy)
+
+    schema = parsers.to_json_schema_bundle([Kid, Parent, Kid])
+
+    kid, parent, toy = (
+        f"#/definitions/tests_test_schema_{name}" for name in ("kid", "parent", "toy")
+    )
+    pattern = {
+        "oneOf": [kid, parent, kid],
+        "definitions": {
+            "tests_test_schema_kid": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {"toys": {"type": "array", "items": toy}},
+            },
+            "tests_test_schema_parent": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {
+                    "kid": {"oneOf": [kid, {"type": "null"}]},
+                    "toy": toy,
+                },
+            },
+            "tests_test_schema_toy": {
+                "type": "object",
+                "additionalProperties": False,
+                "properties": {"name": {"type": "string"}},
+                "required": ["name"],
+            },
+        },
+    }
+    assert compare_schemas(pattern, schema)
+    assert schema["oneOf"] == [kid, parent, kid]
+    assert list(schema["definitions"]) == sorted(schema["definitions"])
+
+
+def test_numeric_array_field():
+    class Series(models.Base):
+        values = fields.NumericArrayField(
+            item_validators=[validators.Min(0)], validators=validators.Length(1)
+        )
+        counts = fields.NumericArrayField("u4", default=[1])
+
+    schema = Series.to_json_schema()
+
+    pattern = {
+        "type": "object",
+        "additionalProperties": False,
+        "properties": {
+            "values": {
+                "type": "array",
+                "items": {"type": "number", "minimum": 0},
+                "minItems": 1,
+            },
+            "counts": {"type": "array", "items": {"type": "number"}, "default": [1]},
+        },
+    }
+    assert compare_schemas(pattern, schema) is True
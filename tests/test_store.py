@@ -0,0 +1,117 @@
+import json
+import os
+
+import pytest
+
+from jsonmodels import errors, fields, models
+from jsonmodels.store import IndexedNDJSON
+
+
+class Person(models.Base):
+    id = fields.IntField(name="person-id")
+    name = fields.StringField()
+
+
+def _write(path, structs):
+    path.write_text("".join(json.dumps(struct) + "\n" for struct in structs))
+
+
+def test_read_by_position(tmp_path):
+    path = tmp_path / "people.ndjson"
+    path.write_text('{"name": "Alan"}\n\n{"name": "Ada"}\n{"name": "Grace"}')
+
+    with IndexedNDJSON(path, Person) as people:
+        assert len(people) == 3
+        assert people[1].name == "Ada"
+        assert people[-1].name == "Grace"
+        assert people.read_struct(0) == {"name": "Alan"}
+        assert [person.name for person in people] == ["Alan", "Ada", "Grace"]
+        with pytest.raises(IndexError):
+            people[3]
+        with pytest.raises(ValueError):
+            people.get(1)
+
+    assert os.path.exists(str(path) + ".idx")
+
+
+def test_read_by_key(tmp_path):
+    path = tmp_path / "people.ndjson"
+    _write(path, [{"person-id": 3, "name": "Alan"}, {"person-id": 1, "name": "Ada"}])
+
+    with IndexedNDJSON(path, Person, key="id") as people:
+        assert people.get(1).name == "Ada"
+        with pytest.raises(KeyError):
+            people.get(2)
+
+    with pytest.raises(errors.FieldNotFound):
+        IndexedNDJSON(path, Person, key="surname")
+
+
+def test_index_is_reused_and_rebuilt(tmp_path):
+    path = tmp_path / "people.ndjson"
+    index_path = tmp_path / "people.index"
+    _write(path, [{"person-id": 1, "name": "Alan"}])
+
+    IndexedNDJSON(path, Person, key="id", index_path=index_path).close()
+    built = index_path.read_bytes()
+    IndexedNDJSON(path, Person, key="id", index_path=index_path).close()
+    assert index_path.read_bytes() == built
+
+    _write(path, [{"person-id": 1, "name": "Alan"}, {"person-id": 2, "name": "Ada"}])
+    with IndexedNDJSON(path, Person, key="id", index_path=index_path) as people:
+        assert people.get(2).name == "Ada"
+    with IndexedNDJSON(path, Person, key="name", index_path=index_path) as people:
+        assert people.get("Ada").id == 2
+
+    index_path.write_bytes(b"broken")
+    with IndexedNDJSON(path, Person, index_path=index_path) as people:
+        assert len(people) == 2
+
+    missing = tmp_path / "missing" / "people.index"
+    with IndexedNDJSON(path, Person, key="id", index_path=missing) as people:
+        assert people.get(2).name == "Ada"
+    assert not missing.parent.exists()
+
+
+def test_corrupted_index_is_rebuilt(tmp_path):
+    path = tmp_path / "people.ndjson"
+    index_path = tmp_path / "people.index"
+    _write(path, [{"person-id": 1, "name": "Alan"}, {"person-id": 2, "name": "Ada"}])
+    IndexedNDJSON(path, Person, key="id", index_path=index_path).close()
+    built = index_path.read_bytes()
+    split = built.index(b'{"key"')
+    header, keys = built[:split], json.loads(built[split:])
+
+    corrupted = [
+        header + b"[]",
+        header + b'{"values": [1, 2]}',
+        header + json.dumps(dict(keys, values=[1])).encode(),
+        header + b"\xff",
+        built[:30],
+    ]
+    for data in corrupted:
+        index_path.write_bytes(data)
+        with IndexedNDJSON(path, Person, key="id", index_path=index_path) as people:
+            assert people.get(2).name == "Ada"
+        assert index_path.read_bytes() == built
+
+
+def test_temporary_index_is_removed(tmp_path):
+    path = tmp_path / "people.ndjson"
+    index_path = tmp_path / "people.index"
+    _write(path, [{"person-id": 1, "name": "Alan"}])
+    # Index can't replace directory.
+    index_path.mkdir()
+
+    with IndexedNDJSON(path, Person, key="id", index_path=index_path) as people:
+        assert people.get(1).name == "Alan"
+    assert sorted(os.listdir(tmp_path)) == ["people.index", "people.ndjson"]
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.ndjson"
+    path.write_text("")
+
+    with IndexedNDJSON(path, Person) as people:
+        assert len(people) == 0
+        assert list(people) == []
@@ -1,8 +1,12 @@
+import asyncio
+import concurrent.futures
 from datetime import datetime
 
 import pytest
 
-from jsonmodels import errors, fields, models
+from jsonmodels import errors, fields, models, validators
+
+from .utilities import Order, make_order
 
 
 class _DateField(fields.BaseField):
@@ -206,3 +210,150 @@ def test_to_struct_datetime():
 
     pattern = {"start": "2013-05-06T12:03:34"}
     assert pattern == event.to_struct()
+
+
+def test_to_struct_with_include():
+    order = make_order()
+
+    assert order.to_struct(include={"order-number", "tags"}) == {
+        "order-number": 1,
+        "tags": ["new"],
+    }
+    assert order.to_struct(include=["shipping.sku", "lines[].id"]) == {
+        "shipping": {"sku": "S"},
+        "lines": [{"id": 1}, {"id": 2}],
+    }
+    assert order.to_struct(include=["lines.product.name", "lines"]) == {
+        "lines": order.to_struct()["lines"],
+    }
+    assert order.to_struct(include=["lines.product.name"]) == {
+        "lines": [{"product": {"name": "Apple"}}, {"product": {}}],
+    }
+    assert order.to_struct(include=[]) == {}
+
+
+def test_to_struct_with_exclude():
+    order = make_order()
+    struct = order.to_struct()
+
+    del struct["customer"]
+    for line in struct["lines"]:
+        line.pop("product", None)
+    assert order.to_struct(exclude={"customer", "lines[].product"}) == struct
+
+    assert order.to_struct(include={"lines"}, exclude={"lines.quantity"}) == {
+        "lines": [
+            {"id": 1, "product": {"sku": "A", "name": "Apple", "price": 1.0}},
+            {"id": 2, "product": {"sku": "B", "price": 2.0}},
+        ]
+    }
+
+
+def test_to_struct_validates_only_selected_values():
+    class Line(models.Base):
+        id = fields.IntField(required=True)
+        quantity = fields.IntField()
+
+    class Order(models.Base):
+        number = fields.IntField(name="order-number")
+        customer = fields.StringField(required=True)
+        lines = fields.ListField([Line])
+
+    order = Order(number=1, lines=[Line(id=1, quantity=2), Line(quantity=1)])
+
+    assert order.to_struct(include={"order-number", "lines[].quantity"}) == {
+        "order-number": 1,
+        "lines": [{"quantity": 2}, {"quantity": 1}],
+    }
+    assert "customer" not in order.to_struct(exclude={"customer", "lines"})
+
+    with pytest.raises(errors.ValidationError):
+        order.to_struct(include={"customer"})
+    with pytest.raises(errors.ValidationError):
+        order.to_struct(include={"lines[].id"})
+
+
+def test_to_struct_projection_is_compiled_once():
+    order = make_order()
+    order.to_struct(include={"lines[].id", "customer"})
+
+    compiled = Order._get_fields_index().compiled
+    key = ("projection", frozenset({"lines[].id", "customer"}), frozenset())
+    assert key in compiled
+    count = len(compiled)
+    order.to_struct(include=["customer", "lines[].id"])
+    assert len(compiled) == count
+
+
+def test_to_struct_with_wrong_projection():
+    order = make_order()
+
+    with pytest.raises(errors.FieldNotFound):
+        order.to_struct(include={"number"})
+    with pytest.raises(errors.FieldNotFound):
+        order.to_struct(exclude={"shipping.weight"})
+    with pytest.raises(ValueError):
+        order.to_struct(include={"customer.name"})
+
+
+class _Line(models.Base):
+    sku = fields.StringField(required=True)
+    quantity = fields.IntField(validators=validators.Min(1))
+
+
+class _Order(models.Base):
+    number = fields.StringField(name="order-number")
+    lines = fields.ListField([_Line], index_on=["sku"])
+    codes = fields.ListField(int, validators=validators.Length(0, 50))
+
+
+def _order_struct(lines=20):
+    return {
+        "order-number": "A-1",
+        "lines": [{"sku": f"S{index}", "quantity": 1} for index in range(lines)],
+        "codes": list(range(30)),
+    }
+
+
+def test_async_to_struct_and_from_struct():
+    struct = _order_struct()
+    pauses = []
+
+    async def run():
+        ticker = asyncio.get_running_loop().call_soon(pauses.append, 1)
+        order = await _Order.afrom_struct(struct, chunk_size=4)
+        assert pauses  # Control was given back to the loop.
+        ticker.cancel()
+        return order, await order.ato_struct(chunk_size=4)
+
+    order, result = asyncio.run(run())
+    assert result == struct == _Order(**struct).to_struct()
+    assert order.lines.get_by("sku", "S7").quantity == 1
+    assert order.lines._validated == 20
+
+
+def test_async_from_struct_validates():
+    struct = _order_struct()
+    struct["lines"][15]["quantity"] = 0
+    with pytest.raises(errors.ValidationError) as info:
+        asyncio.run(_Order.afrom_struct(struct, chunk_size=4))
+    assert "Error for field 'lines'" in str(info.value)
+
+    struct = dict(_order_struct(), codes=list(range(60)))
+    with pytest.raises(errors.ValidationError):
+        asyncio.run(_Order.afrom_struct(struct, chunk_size=4))
+
+
+def test_async_struct_in_executor():
+    struct = _order_struct()
+
+    async def run(executor):
+        order = await _Order.afrom_struct(struct, executor=executor, threshold=10)
+        return await order.ato_struct(executor=executor, threshold=10)
+
+    with concurrent.futures.ThreadPoolExecutor(1) as executor:
+        assert asyncio.run(run(executor)) == struct
+
+    with concurrent.futures.ProcessPoolExecutor(1) as executor:
+        with pytest.raises(ValueError):
+            asyncio.run(run(executor))
@@ -51,6 +51,46 @@ def test_failed_comparison_of_two_dicts():
     )
 
 
+def test_comparison_of_lists_with_repeated_items():
+    assert utilities.compare_schemas(["one", "one", "two"], ["one", "two", "one"])
+    assert not utilities.compare_schemas(["one", "one", "two"], ["one", "two", "two"])
+    assert not utilities.compare_schemas([{"one": 1}, "two"], [{"one": 2}, "two"])
+
+
+def test_comparison_of_nested_values_of_different_types():
+    assert not utilities.compare_schemas({"one": 1}, {"one": "1"})
+    assert not utilities.compare_schemas([1], [True])
+    assert not utilities.compare_schemas([None], [[]])
+
+    with pytest.raises(RuntimeError):
+        utilities.compare_schemas({"one": ("tuple",)}, {"one": ("tuple",)})
+
+
+def test_schema_hash():
+    one = {"oneOf": [{"type": "string"}, {"type": "null"}], "enum": [1, 2, 3]}
+    two = {"enum": [3, 1, 2], "oneOf": [{"type": "null"}, {"type": "string"}]}
+
+    assert utilities.canonicalize_schema(one) == utilities.canonicalize_schema(two)
+    assert utilities.schema_hash(one) == utilities.schema_hash(two)
+    assert utilities.schema_hash(one) != utilities.schema_hash({"enum": [1, 2]})
+
+
+def test_unique_schemas():
+    schemas = [
+        {"type": "string"},
+        {"required": ["one", "two"]},
+        {"type": "string"},
+        {"required": ["two", "one"]},
+        {"required": ["one"]},
+    ]
+
+    assert utilities.unique_schemas(schemas) == [
+        {"type": "string"},
+        {"required": ["one", "two"]},
+        {"required": ["one"]},
+    ]
+
+
 def test_is_ecma_regex():
     assert utilities.is_ecma_regex("some regex") is False
     assert utilities.is_ecma_regex("^some regex$") is False
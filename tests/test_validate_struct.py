@@ -0,0 +1,119 @@
+import datetime
+
+import pytest
+
+from jsonmodels import errors, fields, models, validators
+
+
+class Toy(models.Base):
+    name = fields.StringField(required=True)
+    price = fields.FloatField(validators=validators.Min(0), nullable=True)
+
+
+class Kid(models.Base):
+    name = fields.StringField(required=True)
+    age = fields.IntField(validators=[validators.Min(0), validators.Max(18)])
+    toys = fields.ListField(Toy, validators=validators.Length(maximum_value=2))
+    favourite = fields.EmbeddedField(Toy)
+
+
+class Person(models.Base):
+    name = fields.StringField(required=True, name="first-name")
+    surname = fields.StringField(validators=validators.Regex("^[A-Z]"), nullable=True)
+    born = fields.DateField()
+    active = fields.BoolField()
+    kids = fields.ListField([Kid])
+    tags = fields.ListField(str, item_validators=[validators.Length(1)])
+    partner = fields.EmbeddedField("Person", nullable=True)
+    extra = fields.DictField()
+
+
+class Crossed(models.Base):
+    one = fields.IntField(name="two")
+    two = fields.IntField(name="one", required=True)
+
+
+def _outcome(callable_, *args):
+    try:
+        callable_(*args)
+    except Exception as error:
+        return type(error), str(error)
+    return None
+
+
+def _assert_same_outcome(model, data):
+    expected = _outcome(lambda: model(**data).validate())
+    assert _outcome(model.validate_struct, data) == expected
+    return expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"first-name": "Chuck"},
+        {"name": "Chuck"},
+        {},
+        {"first-name": 42},
+        {"first-name": "Chuck", "surname": "norris"},
+        {"first-name": "Chuck", "born": "2000-01-02", "active": 1},
+        {"first-name": "Chuck", "born": datetime.date(2000, 1, 2)},
+        {"first-name": "Chuck", "kids": [{"name": "Bob"}, {"age": 3}]},
+        {"first-name": "Chuck", "kids": [{"name": "Bob", "age": 30}]},
+        {"first-name": "Chuck", "kids": [{"toys": [{}, {}, {}]}]},
+        {"first-name": "Chuck", "kids": [{"toys": [{"price": -1}]}]},
+        {"first-name": "Chuck", "kids": [{"favourite": {"price": 1}}]},
+        {"first-name": "Chuck", "kids": [Kid(name="Bob"), {"name": "Tom"}]},
+        {"first-name": "Chuck", "kids": [1]},
+        {"first-name": "Chuck", "kids": {"name": "Bob"}},
+        {"first-name": "Chuck", "kids": []},
+        {"first-name": "Chuck", "tags": ["a", ""]},
+        {"first-name": "Chuck", "tags": ["a", 1]},
+        {"first-name": "Chuck", "partner": None},
+        {"first-name": "Chuck", "partner": {}},
+        {"first-name": "Chuck", "partner": {"first-name": "Ann", "kids": [{}]}},
+        {"first-name": "Chuck", "partner": Person(name="Ann")},
+        {"first-name": "Chuck", "partner": "Ann"},
+        {"first-name": "Chuck", "extra": []},
+        {"first-name": "Chuck", "unknown": 1},
+    ],
+)
+def test_validate_struct_is_same_as_validate(data):
+    _assert_same_outcome(Person, data)
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"one": 1, "two": 2},
+        {"two": 2},
+        {"one": 1},
+        {"one": "1"},
+        {"one": "one"},
+    ],
+)
+def test_validate_struct_with_crossed_names(data):
+    _assert_same_outcome(Crossed, data)
+
+
+def test_validate_struct_creates_no_instances(monkeypatch):
+    data = {
+        "first-name": "Chuck",
+        "kids": [{"name": "Bob", "favourite": {"name": "car"}}],
+        "partner": {"first-name": "Ann", "kids": [{"favourite": {"price": 1}}]},
+    }
+    assert _assert_same_outcome(Person, data) is not None
+
+    def fail(self, **kwargs):
+        raise AssertionError("Model was instantiated.")
+
+    monkeypatch.setattr(models.Base, "__init__", fail)
+    with pytest.raises(errors.ValidationError):
+        Person.validate_struct(data)
+
+    data["partner"]["kids"][0]["favourite"]["name"] = "ball"
+    Person.validate_struct(data)
+
+
+def test_validate_struct_requires_mapping():
+    with pytest.raises(TypeError):
+        Person.validate_struct(["first-name"])
@@ -1,5 +1,7 @@
 """Test for validators."""
 
+import array
+
 import pytest
 
 from jsonmodels import errors, fields, models, validators
@@ -81,6 +83,70 @@ def test_min_validation():
         validator.validate(-2)
 
 
+def test_validation_of_many_values():
+    validators.Min(3).validate_all([5, 3, 4])
+    validators.Max(3, exclusive=True).validate_all(array.array("d", [1, 2]))
+    validators.Enum("a", "b").validate_all(["a", "b", "a"])
+    validators.Enum([1]).validate_all([[1], [1]])
+    validators.Length(1, 2).validate_all(["a", "bc"])
+    for validator in (validators.Min(3), validators.Max(3)):
+        validator.validate_all([])
+
+    with pytest.raises(errors.ValidationError):
+        validators.Min(3).validate_all(array.array("q", [5, 2, 4]))
+    with pytest.raises(errors.ValidationError):
+        validators.Max(3).validate_all([1, 4])
+    with pytest.raises(errors.ValidationError):
+        validators.Enum("a").validate_all(["a", "c"])
+    with pytest.raises(errors.ValidationError):
+        validators.Length(1, 2).validate_all(["a", ""])
+    with pytest.raises(errors.ValidationError):
+        validators.Length(1, 2).validate_all(["a", "abc"])
+
+
+def test_first_invalid_item_is_reported():
+    class Series(models.Base):
+        numbers = fields.ListField(int, item_validators=[validators.Min(0)])
+        names = fields.ListField(str, item_validators=[validators.Length(1, 2)])
+        values = fields.NumericArrayField("i8", item_validators=[validators.Max(9)])
+
+    with pytest.raises(errors.ValidationError) as info:
+        Series(numbers=[5, -1, -9])
+    assert "'-1' is lower than minimum" in str(info.value)
+    with pytest.raises(errors.ValidationError) as info:
+        Series(names=["a", "abc", ""])
+    assert "Value 'abc' length is bigger" in str(info.value)
+    with pytest.raises(errors.ValidationError) as info:
+        Series(values=[1, 10, 20])
+    assert "'10' is bigger than maximum" in str(info.value)
+
+
+def test_validation_of_many_values_with_nan():
+    nan = float("nan")
+
+    class Series(models.Base):
+        low = fields.ListField(float, item_validators=[validators.Min(0)])
+        high = fields.ListField(float, item_validators=[validators.Max(0)])
+        low_array = fields.NumericArrayField(item_validators=[validators.Min(0)])
+        high_array = fields.NumericArrayField(item_validators=[validators.Max(0)])
+        value = fields.FloatField(validators=[validators.Min(0), validators.Max(9)])
+
+    Series(low=[nan, 1.0], high=[nan, -1.0], low_array=[nan], high_array=[nan])
+    for name, numbers in [
+        ("low", [nan, -1.0]),
+        ("high", [nan, 1.0]),
+        ("low_array", [nan, -1.0]),
+        ("high_array", [nan, 1.0]),
+    ]:
+        with pytest.raises(errors.ValidationError):
+            Series(**{name: numbers})
+        with pytest.raises(errors.ValidationError):
+            Series.batch_from_structs([{name: numbers}])
+    for numbers in ([nan, -1.0], [nan, 10.0]):
+        with pytest.raises(errors.ValidationError):
+            Series.batch_from_structs([{"value": number} for number in numbers])
+
+
 def test_exclusive_validation():
     validator = validators.Min(3, True)
     assert 3 == validator.minimum_value
@@ -324,3 +390,126 @@ def test_enum_validation():
 
     with pytest.raises(errors.ValidationError):
         validator.validate("horse")
+
+
+def test_validators_check():
+    assert validators.Min(3).check(3) is None
+    assert validators.Max(3).check(2) is None
+    assert validators.Enum("cat").check("cat") is None
+
+    error = validators.Min(3, exclusive=True).check(3)
+    assert error.code == "exclusive_minimum"
+    assert error.params == {"value": 3, "min": 3}
+    assert error.message == "'3' is lower or equal than minimum ('3')."
+
+    error = validators.Length(maximum_value=2).check("long value")
+    assert error.code == "max_length"
+    assert error.message == (
+        "Value 'long value' length is bigger than allowed maximum '2'."
+    )
+
+    assert validators.Regex("^a").check("b").code == "pattern"
+    assert validators.Regex("^a").check(1).code == "type"
+
+
+class Toy(models.Base):
+    name = fields.StringField(required=True)
+
+
+class Kid(models.Base):
+    name = fields.StringField(required=True)
+    age = fields.IntField(validators=validators.Max(18), nullable=True)
+    toys = fields.ListField(Toy)
+    favourite = fields.EmbeddedField(Toy)
+    pet = fields.StringField(
+        validators=validators.Enum("cat", "dog"), name="pet-kind", nullable=True
+    )
+
+
+def _describe(errors):
+    return sorted((error.path, error.code) for error in errors)
+
+
+def test_iter_errors():
+    kid = Kid(age=10, toys=[Toy(name="car")], favourite=Toy(name="ball"))
+    list.append(kid.toys, "ball")  # Bypass validation of collection.
+
+    assert _describe(kid.iter_errors()) == [
+        (("name",), "required"),
+        (("toys", 1), "item_type"),
+    ]
+    assert _describe(kid.iter_errors(("kids", 0))) == [
+        (("kids", 0, "name"), "required"),
+        (("kids", 0, "toys", 1), "item_type"),
+    ]
+
+    kid.toys.pop()
+    kid.name = "Bob"
+    assert list(kid.iter_errors()) == []
+    kid.validate()
+
+
+def test_iter_errors_checks_type_of_item_first():
+    class Scores(models.Base):
+        values = fields.ListField(int, item_validators=[validators.Min(0)])
+
+    scores = Scores(values=[1])
+    list.extend(scores.values, [-1, "2"])  # Bypass validation of collection.
+    assert _describe(scores.iter_errors()) == [
+        (("values", 1), "minimum"),
+        (("values", 2), "item_type"),
+    ]
+    with pytest.raises(errors.ValidationError) as info:
+        scores.validate()
+    assert "lower than minimum" in str(info.value)
+
+    scores = Scores(values=[1])
+    list.extend(scores.values, ["0", -1])
+    assert _describe(scores.iter_errors()) == [
+        (("values", 1), "item_type"),
+        (("values", 2), "minimum"),
+    ]
+    with pytest.raises(errors.ValidationError) as info:
+        scores.validate()
+    assert "All items must be instances" in str(info.value)
+
+
+def test_check_struct():
+    data = {
+        "age": "20",
+        "pet-kind": "fish",
+        "toys": [{"name": "car"}, {}, "ball"],
+        "favourite": {},
+    }
+
+    errors = Kid.check_struct(data)
+
+    assert _describe(errors) == [
+        (("age",), "maximum"),
+        (("favourite", "name"), "required"),
+        (("name",), "required"),
+        (("pet-kind",), "enum"),
+        (("toys", 2), "item_type"),
+    ]
+    pet_error = next(error for error in errors if error.code == "enum")
+    assert pet_error.params == {"value": "fish"}
+    assert pet_error.message == "Value 'fish' is not a valid choice."
+
+    assert Kid.check_struct({"name": "Bob", "age": "one"})[0].code == "parse"
+    assert Kid.check_struct({"name": "Bob", "toys": [{"name": "car"}]}) == []
+
+
+def test_check_struct_doesnt_format_messages():
+    class Value:
+        def __str__(self):
+            raise AssertionError("Message was formatted.")
+
+    class AnyField(fields.BaseField):
+        types = (object,)
+
+    class Wrong(models.Base):
+        value = AnyField(validators=validators.Enum("good"))
+
+    errors = Wrong.check_struct({"value": Value()})
+
+    assert [error.code for error in errors] == ["enum"]
@@ -1,6 +1,9 @@
+import datetime
 import json
 import os
 
+from jsonmodels import fields, models, validators
+
 FIXTURES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "fixtures")
 
 
@@ -12,3 +15,40 @@ def get_fixture(filepath):
     """
     with open(os.path.join(FIXTURES_DIR, filepath)) as fixture:
         return json.loads(fixture.read())
+
+
+class Product(models.Base):
+    sku = fields.StringField(required=True, validators=validators.Regex("^[A-Z]"))
+    name = fields.StringField()
+    price = fields.FloatField()
+
+
+class Line(models.Base):
+    id = fields.IntField()
+    product = fields.EmbeddedField(Product)
+    quantity = fields.IntField()
+
+
+class Order(models.Base):
+    number = fields.IntField(name="order-number")
+    customer = fields.StringField()
+    created = fields.DateTimeField()
+    shipping = fields.EmbeddedField(Product)
+    lines = fields.ListField([Line])
+    tags = fields.ListField(str)
+    extra = fields.DictField()
+
+
+def make_order():
+    """Get order with nested models and lists (for tests of paths in models)."""
+    return Order(
+        number=1,
+        customer="Bob",
+        created=datetime.datetime(2020, 1, 2),
+        shipping=Product(sku="S", name="Shipping", price=5),
+        lines=[
+            Line(id=1, product=Product(sku="A", name="Apple", price=1), quantity=1),
+            Line(id=2, product=Product(sku="B", price=2), quantity=2),
+        ],
+        tags=["new"],
+    )